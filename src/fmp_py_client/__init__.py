@@ -1,6 +1,9 @@
 """FMP (Financial Modeling Prep) API client."""
 
+from fmp_py_client._cache import CacheBackend, CachePolicy, MemoryCache, SQLiteCache
 from fmp_py_client._client import AsyncFMPClient
+from fmp_py_client._connection import ConnectionConfig
+from fmp_py_client._eodstore import EODStore
 from fmp_py_client._exceptions import (
     FMPAPIError,
     FMPAuthenticationError,
@@ -10,7 +13,23 @@ from fmp_py_client._exceptions import (
     FMPRateLimitError,
     FMPTimeoutError,
 )
-from fmp_py_client._types import Period, Timeframe
+from fmp_py_client._insiderfeed import InsiderFeed
+from fmp_py_client._ratelimit import RateLimiter, TokenBucket
+from fmp_py_client._lake import ParquetLake
+from fmp_py_client._membership import IndexMembership, MembershipPeriod
+from fmp_py_client._newsstream import NewsStream
+from fmp_py_client._retry import RetryPolicy
+from fmp_py_client._scheduler import Scheduler
+from fmp_py_client._searchindex import SearchIndex
+from fmp_py_client._structs import struct_type
+from fmp_py_client._types import (
+    BatchResult,
+    MapResult,
+    Period,
+    Priority,
+    SymbolResult,
+    Timeframe,
+)
 
 # Re-export models for convenient access
 from fmp_py_client.models import (
@@ -151,6 +170,7 @@ from fmp_py_client.models import (
 __all__ = [
     # Client
     "AsyncFMPClient",
+    "ConnectionConfig",
     # Exceptions
     "FMPAPIError",
     "FMPAuthenticationError",
@@ -159,8 +179,34 @@ __all__ = [
     "FMPNotFoundError",
     "FMPRateLimitError",
     "FMPTimeoutError",
+    # Rate limiting
+    "RateLimiter",
+    "TokenBucket",
+    # Retries
+    "RetryPolicy",
+    # Scheduling
+    "Scheduler",
+    # Caching
+    "CacheBackend",
+    "CachePolicy",
+    "MemoryCache",
+    "SQLiteCache",
+    # Local data
+    "EODStore",
+    "IndexMembership",
+    "InsiderFeed",
+    "MembershipPeriod",
+    "NewsStream",
+    "ParquetLake",
+    "SearchIndex",
+    # Types
+    "BatchResult",
+    "MapResult",
+    "SymbolResult",
+    "struct_type",
     # Enums
     "Period",
+    "Priority",
     "Timeframe",
     # Models - Calendar
     "Dividend",
@@ -1,21 +1,52 @@
 """Base client with shared logic for auth, URL building, and request execution."""
 
-from typing import Any
+import asyncio
+import codecs
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import AbstractAsyncContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from fmp_py_client._cache import CacheBackend, CachePolicy, cache_key
+from fmp_py_client._columnar import (
+    Columns,
+    column_decoder,
+    rows_to_columns,
+    to_arrow,
+)
+from fmp_py_client._connection import ConnectionConfig
+from fmp_py_client._csv import CSVRowParser
 from fmp_py_client._exceptions import (
     FMPAPIError,
     FMPAuthenticationError,
     FMPConnectionError,
+    FMPError,
     FMPNotFoundError,
     FMPRateLimitError,
     FMPTimeoutError,
 )
+from fmp_py_client._json import DecoderName, JSONDecoder, get_decoder
+from fmp_py_client._ratelimit import RateLimiter
+from fmp_py_client._retry import RetryPolicy
+from fmp_py_client._scheduler import Scheduler, current_priority
+from fmp_py_client._structs import is_composite, row_model, struct_decoder, to_structs
+from fmp_py_client._types import MapResult, Priority, SymbolResult
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 BASE_URL = "https://financialmodelingprep.com"
 API_PREFIX = "/stable"
 
+# (tag, decoder) replacing the client's JSON decoder within one call.
+_decoder_override: ContextVar[tuple[str, JSONDecoder] | None] = ContextVar(
+    "fmp_decoder_override", default=None
+)
+
 
 class BaseClient:
     """Shared logic for async and sync clients."""
@@ -50,12 +81,31 @@ class AsyncBaseClient(BaseClient):
         base_url: str = BASE_URL,
         timeout: float = 30.0,
         httpx_client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        cache: CacheBackend | None = None,
+        cache_policy: CachePolicy | None = None,
+        coalesce: bool = False,
+        json_decoder: DecoderName = "auto",
+        connection: ConnectionConfig | None = None,
+        scheduler: Scheduler | None = None,
     ) -> None:
         super().__init__(api_key=api_key, base_url=base_url, timeout=timeout)
-        self._client = httpx_client or httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout),
+        if httpx_client is not None and connection is not None:
+            raise ValueError("Pass either httpx_client or connection, not both")
+        self._client = httpx_client or (connection or ConnectionConfig()).create_client(
+            timeout
         )
         self._owns_client = httpx_client is None
+        self._rate_limiter = rate_limiter
+        self._retry = retry
+        self._resume_at = 0.0
+        self._cache = cache
+        self._cache_policy = cache_policy or CachePolicy()
+        self._coalesce = coalesce
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._decode = get_decoder(json_decoder)
+        self._scheduler = scheduler
 
     async def __aenter__(self) -> "AsyncBaseClient":
         return self
@@ -67,20 +117,404 @@ class AsyncBaseClient(BaseClient):
         if self._owns_client:
             await self._client.aclose()
 
+    @contextmanager
+    def priority(self, priority: Priority) -> Iterator[None]:
+        """Send requests made within the block at ``priority``.
+
+        Only has an effect with a `Scheduler`. Tasks started inside the block
+        inherit the priority.
+
+        Usage:
+            with client.priority(Priority.BATCH):
+                await asyncio.gather(*(client.profile(symbol=s) for s in symbols))
+        """
+        token = current_priority.set(Priority(priority))
+        try:
+            yield
+        finally:
+            current_priority.reset(token)
+
+    async def map[T](
+        self,
+        method: Callable[..., Awaitable[T]],
+        symbols: Iterable[str],
+        /,
+        *,
+        concurrency: int = 32,
+        progress: Callable[[int, int], None] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[SymbolResult[T]]:
+        """Call a per-symbol method for many symbols, yielding results as they finish.
+
+        At most ``concurrency`` calls run at once, and each still passes
+        through the client's rate limiter, scheduler and retry policy, so
+        large universes are paced instead of sent in one burst. A failed call
+        yields its `FMPError` instead of stopping the others. ``progress`` is
+        called with ``(done, total)`` after each symbol.
+
+        Usage:
+            async for result in client.map(client.key_metrics, symbols, limit=4):
+                if result.error is None:
+                    store(result.symbol, result.value)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        queue = deque(dict.fromkeys(symbols))
+        total = len(queue)
+        pending: dict[asyncio.Task[T], str] = {}
+        done_count = 0
+
+        def schedule() -> None:
+            while queue and len(pending) < concurrency:
+                symbol = queue.popleft()
+                pending[asyncio.ensure_future(method(symbol=symbol, **kwargs))] = symbol
+
+        try:
+            schedule()
+            while pending:
+                finished, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    symbol = pending.pop(task)
+                    try:
+                        result = SymbolResult(symbol, task.result(), None)
+                    except FMPError as e:
+                        result = SymbolResult(symbol, None, e)
+                    done_count += 1
+                    if progress is not None:
+                        progress(done_count, total)
+                    schedule()
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def map_all[T](
+        self,
+        method: Callable[..., Awaitable[T]],
+        symbols: Iterable[str],
+        /,
+        *,
+        concurrency: int = 32,
+        progress: Callable[[int, int], None] | None = None,
+        **kwargs: Any,
+    ) -> MapResult[T]:
+        """Like `map`, but wait for every symbol and return all results.
+
+        Usage:
+            profiles, errors = await client.map_all(client.profile, symbols)
+        """
+        requested = list(dict.fromkeys(symbols))
+        values: dict[str, T] = {}
+        errors: dict[str, FMPError] = {}
+        async for result in self.map(
+            method,
+            requested,
+            concurrency=concurrency,
+            progress=progress,
+            **kwargs,
+        ):
+            if result.error is None:
+                values[result.symbol] = result.value  # type: ignore[assignment]
+            else:
+                errors[result.symbol] = result.error
+        ordered = {s: values[s] for s in requested if s in values}
+        return MapResult(ordered, errors)
+
+    async def fetch_structs(
+        self,
+        method: Callable[..., Awaitable[list[Any]]],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Call a client method and decode its rows into compact structs.
+
+        The structs have the same field names as the method's TypedDict row
+        model but use far less memory than dicts; see `struct_type`. Rows of
+        methods that merge several requests, such as
+        `historical_price_eod_range`, are converted after merging.
+
+        Usage:
+            bars = await client.fetch_structs(
+                client.historical_price_eod_full, symbol="AAPL"
+            )
+            closes = [bar.close for bar in bars]
+        """
+        model = row_model(method)
+        if not self._decodes_directly(method):
+            return to_structs(await method(*args, **kwargs), model)
+        decoder = struct_decoder(model, self._decode)
+        with self._decoding(f"struct:{model.__qualname__}", decoder):
+            return await method(*args, **kwargs)
+
+    async def fetch_columns(
+        self,
+        method: Callable[..., Awaitable[list[Any]]],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Columns:
+        """Call a client method and decode its rows into one NumPy array per field.
+
+        Prices are float64, volumes int64 (float64 if any are fractional) and
+        dates datetime64; no list of dicts is built along the way, except for
+        methods that merge several requests, such as
+        `historical_price_eod_range`, whose merged rows are converted.
+        Requires NumPy.
+
+        Usage:
+            bars = await client.fetch_columns(
+                client.historical_price_eod_full, symbol="AAPL"
+            )
+            returns = bars["close"][:-1] / bars["close"][1:] - 1
+        """
+        model = row_model(method)
+        if not self._decodes_directly(method):
+            return rows_to_columns(await method(*args, **kwargs), model)
+        decoder = column_decoder(model, self._decode)
+        with self._decoding(f"columns:{model.__qualname__}", decoder):
+            return await method(*args, **kwargs)
+
+    async def fetch_arrow(
+        self,
+        method: Callable[..., Awaitable[list[Any]]],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> "pa.Table":
+        """Like `fetch_columns` but return a ``pyarrow.Table``. Requires pyarrow."""
+        return to_arrow(await self.fetch_columns(method, *args, **kwargs))
+
+    async def stream_columns(
+        self,
+        method: Callable[..., AsyncIterator[Any]],
+        /,
+        *args: Any,
+        batch_size: int = 100_000,
+        **kwargs: Any,
+    ) -> AsyncIterator[Columns]:
+        """Consume a streaming ``iter_*`` method in batches of typed columns.
+
+        Each batch holds up to ``batch_size`` rows as one NumPy array per
+        field, typed as in `fetch_columns`. Requires NumPy.
+
+        Usage:
+            async for batch in client.stream_columns(client.iter_eod_bulk):
+                store(batch)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        model = row_model(method)
+        rows: list[Any] = []
+        async for row in method(*args, **kwargs):
+            rows.append(row)
+            if len(rows) >= batch_size:
+                yield rows_to_columns(rows, model)
+                rows = []
+        if rows:
+            yield rows_to_columns(rows, model)
+
+    def _decodes_directly(self, method: Callable[..., Any]) -> bool:
+        # Only this client's single-request endpoints return the response
+        # body as is; anything else may post-process the decoded rows.
+        return getattr(method, "__self__", None) is self and not is_composite(method)
+
+    @contextmanager
+    def _decoding(self, tag: str, decoder: JSONDecoder) -> Iterator[None]:
+        token = _decoder_override.set((tag, decoder))
+        try:
+            yield
+        finally:
+            _decoder_override.reset(token)
+
     async def _request(
         self,
         path: str,
         params: dict[str, Any] | None = None,
     ) -> Any:
+        params = params or {}
+        if not self._coalesce:
+            return await self._load(path, params)
+
+        key = cache_key(path, params)
+        override = _decoder_override.get()
+        if override is not None:
+            # Callers decoding to different shapes cannot share a result.
+            key = f"{key}#{override[0]}"
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(path, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        # Shield so one caller's cancellation does not fail the others.
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: str, task: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled.
+            task.exception()
+
+    async def _load(self, path: str, params: dict[str, Any]) -> Any:
+        override = _decoder_override.get()
+        decode = self._decode if override is None else override[1]
+        ttl = None if self._cache is None else self._cache_policy.ttl_for(path, params)
+        if self._cache is None or ttl is None:
+            return decode(await self._fetch(path, params))
+
+        key = cache_key(path, params)
+        body = await self._cache.get(key)
+        if body is None:
+            body = await self._fetch(path, params)
+            await self._cache.set(key, body, ttl)
+        return decode(body)
+
+    async def _fetch(self, path: str, params: dict[str, Any]) -> bytes:
+        url = self._build_url(path)
+        prepared = self._prepare_params(params)
+        if self._retry is None:
+            return await self._send(path, url, prepared)
+        return await self._send_with_retry(path, url, prepared, self._retry)
+
+    async def _stream_csv(
+        self,
+        path: str,
+        model: type,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Stream a CSV response and yield its rows as they arrive."""
+        parser = CSVRowParser(model)
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        async for chunk in self._stream_body(path, params):
+            for row in parser.feed(decoder.decode(chunk)):
+                yield row
+        for row in parser.feed(decoder.decode(b"", final=True)) + parser.close():
+            yield row
+
+    async def _stream_body(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream a response body in chunks as they arrive.
+
+        Streams bypass the cache. With a retry policy, failures before the
+        first chunk are retried like other requests; a stream that fails
+        after yielding data is not restarted.
+        """
         url = self._build_url(path)
         prepared = self._prepare_params(params or {})
-        try:
-            response = await self._client.get(url, params=prepared)
-        except httpx.TimeoutException as e:
-            raise FMPTimeoutError(f"Request to {path} timed out") from e
-        except httpx.ConnectError as e:
-            raise FMPConnectionError(f"Failed to connect: {e}") from e
+        policy = self._retry
+        deadline = (
+            None
+            if policy is None or policy.deadline is None
+            else time.monotonic() + policy.deadline
+        )
+        attempt = 0
+        while True:
+            await self._wait_for_backoff(deadline)
+            started = False
+            try:
+                async for chunk in self._open_stream(path, url, prepared):
+                    started = True
+                    yield chunk
+                return
+            except FMPError as e:
+                if policy is None or started:
+                    raise
+                attempt += 1
+                await self._backoff(policy, attempt, e, deadline)
+
+    async def _open_stream(
+        self, path: str, url: str, params: dict[str, Any]
+    ) -> AsyncIterator[bytes]:
+        async with self._slot(path):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(path)
+            try:
+                async with self._client.stream("GET", url, params=params) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                        self._raise_for_status(path, response)
+                    async for chunk in response.aiter_bytes():
+                        yield chunk
+            except httpx.TimeoutException as e:
+                raise FMPTimeoutError(f"Request to {path} timed out") from e
+            except httpx.ConnectError as e:
+                raise FMPConnectionError(f"Failed to connect: {e}") from e
+
+    async def _send_with_retry(
+        self,
+        path: str,
+        url: str,
+        params: dict[str, Any],
+        policy: RetryPolicy,
+    ) -> bytes:
+        deadline = (
+            None if policy.deadline is None else time.monotonic() + policy.deadline
+        )
+        attempt = 0
+        while True:
+            await self._wait_for_backoff(deadline)
+            try:
+                return await self._send(path, url, params)
+            except FMPError as e:
+                attempt += 1
+                await self._backoff(policy, attempt, e, deadline)
 
+    async def _backoff(
+        self,
+        policy: RetryPolicy,
+        attempt: int,
+        error: FMPError,
+        deadline: float | None,
+    ) -> None:
+        # Waits before the next attempt, or re-raises when none is allowed.
+        if attempt >= policy.max_attempts or not policy.is_retryable(error):
+            raise error
+        delay = policy.delay(attempt, error)
+        resume_at = time.monotonic() + delay
+        if deadline is not None and resume_at > deadline:
+            raise error
+        if isinstance(error, FMPRateLimitError):
+            # Pause every request on this client, not just this one.
+            self._resume_at = max(self._resume_at, resume_at)
+        await asyncio.sleep(delay)
+
+    async def _wait_for_backoff(self, deadline: float | None) -> None:
+        delay = self._resume_at - time.monotonic()
+        if delay <= 0:
+            return
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise FMPTimeoutError("Retry deadline exceeded while rate limited")
+        await asyncio.sleep(delay)
+
+    def _slot(self, path: str) -> AbstractAsyncContextManager[None]:
+        if self._scheduler is None:
+            return nullcontext()
+        return self._scheduler.slot(path)
+
+    async def _send(self, path: str, url: str, params: dict[str, Any]) -> bytes:
+        # Rate-limit waits happen inside the slot so budget goes to the
+        # highest-priority requests first.
+        async with self._slot(path):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(path)
+            try:
+                response = await self._client.get(url, params=params)
+            except httpx.TimeoutException as e:
+                raise FMPTimeoutError(f"Request to {path} timed out") from e
+            except httpx.ConnectError as e:
+                raise FMPConnectionError(f"Failed to connect: {e}") from e
+
+        self._raise_for_status(path, response)
+        return response.content
+
+    def _raise_for_status(self, path: str, response: httpx.Response) -> None:
         if response.status_code in (401, 403):
             raise FMPAuthenticationError(
                 "Invalid or missing API key",
@@ -106,5 +540,3 @@ class AsyncBaseClient(BaseClient):
                 status_code=response.status_code,
                 response_body=response.text,
             )
-
-        return response.json()
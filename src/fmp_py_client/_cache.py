@@ -0,0 +1,260 @@
+"""Response caching for the async client."""
+
+import asyncio
+import math
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Protocol
+from urllib.parse import urlencode
+
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+FOREVER = math.inf
+
+DEFAULT_TTLS: dict[str, float] = {
+    # Real-time prices
+    "quote": 5.0,
+    "quote-short": 5.0,
+    "batch-quote": 5.0,
+    "batch-quote-short": 5.0,
+    "aftermarket-trade": 5.0,
+    "aftermarket-quote": 5.0,
+    "batch-aftermarket-trade": 5.0,
+    "batch-aftermarket-quote": 5.0,
+    # Market status flips at the open and close
+    "all-exchange-market-hours": MINUTE,
+    "exchange-market-hours": MINUTE,
+    # Reference data
+    "profile": DAY,
+    "sec-profile": DAY,
+    "stock-list": DAY,
+    "etf-list": DAY,
+    "financial-statement-symbol-list": DAY,
+    "actively-trading-list": DAY,
+    "available-exchanges": DAY,
+    "available-sectors": DAY,
+    "available-industries": DAY,
+    "available-countries": DAY,
+    "index-list": DAY,
+    "sp500-constituent": DAY,
+    "nasdaq-constituent": DAY,
+    "dowjones-constituent": DAY,
+}
+
+HISTORICAL_EOD_PREFIX = "historical-price-eod/"
+
+
+def cache_key(path: str, params: Mapping[str, Any]) -> str:
+    """Return a stable cache key for a request, excluding the API key."""
+    items = sorted(
+        (k, str(v)) for k, v in params.items() if v is not None and k != "apikey"
+    )
+    return f"{path.strip('/')}?{urlencode(items)}"
+
+
+class CachePolicy:
+    """Decide how long each response may be served from cache.
+
+    ``ttls`` maps endpoint paths to lifetimes in seconds and is merged over
+    `DEFAULT_TTLS`; paths without an entry use ``default_ttl`` and are not
+    cached when it is ``None``. End-of-day history requests whose ``to`` date
+    lies entirely in the past never expire unless ``cache_past_history`` is
+    disabled; note that adjusted series are restated after later splits.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        *,
+        default_ttl: float | None = None,
+        cache_past_history: bool = True,
+    ) -> None:
+        self._ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.cache_past_history = cache_past_history
+
+    def ttl_for(self, path: str, params: Mapping[str, Any]) -> float | None:
+        """Return the TTL in seconds for a request, or ``None`` to skip caching."""
+        name = path.strip("/")
+        if self.cache_past_history and name.startswith(HISTORICAL_EOD_PREFIX):
+            to_date = params.get("to")
+            today = datetime.now(UTC).date().isoformat()
+            if to_date is not None and str(to_date) < today:
+                return FOREVER
+        ttl = self._ttls.get(name, self.default_ttl)
+        if ttl is None or ttl <= 0:
+            return None
+        return ttl
+
+
+class CacheBackend(Protocol):
+    """Storage for raw response bodies used by the client's cache."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached body for ``key`` or ``None`` if absent or expired."""
+        ...
+
+    async def set(self, key: str, body: bytes, ttl: float) -> None:
+        """Store ``body`` under ``key`` for ``ttl`` seconds (``inf`` for ever)."""
+        ...
+
+
+class MemoryCache:
+    """In-process LRU cache of raw response bodies with a byte-size cap."""
+
+    def __init__(self, max_bytes: int = 128 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total bytes held by cached entries."""
+        return self._size
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return body
+
+    async def set(self, key: str, body: bytes, ttl: float) -> None:
+        if key in self._entries:
+            self._remove(key)
+        if len(key) + len(body) > self.max_bytes:
+            return
+        self._entries[key] = (time.monotonic() + ttl, body)
+        self._size += len(key) + len(body)
+        while self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: str) -> None:
+        _, body = self._entries.pop(key)
+        self._size -= len(key) + len(body)
+
+
+class SQLiteCache:
+    """On-disk cache shared by every process on a host.
+
+    Bodies are zlib-compressed and stored with their fetch time and expiry in
+    a SQLite database in WAL mode, so many processes can read while one
+    writes. Database work runs in a worker thread to keep the event loop free.
+
+    Usage:
+        cache = SQLiteCache("~/.cache/fmp/responses.db")
+        async with AsyncFMPClient("your-api-key", cache=cache) as client:
+            ...
+        cache.close()
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        compress_level: int = 6,
+        busy_timeout: float = 30.0,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.compress_level = compress_level
+        self._busy_timeout = busy_timeout
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self._busy_timeout,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "body BLOB NOT NULL, "
+                "fetched_at REAL NOT NULL, "
+                "expires_at REAL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> bytes | None:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            body, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                conn.execute(
+                    "DELETE FROM responses WHERE key = ? AND expires_at <= ?",
+                    (key, time.time()),
+                )
+                return None
+        return zlib.decompress(body)
+
+    def _set(self, key: str, body: bytes, ttl: float) -> None:
+        compressed = zlib.compress(body, self.compress_level)
+        now = time.time()
+        expires_at = None if math.isinf(ttl) else now + ttl
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO responses (key, body, fetched_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, compressed, now, expires_at),
+            )
+
+    def _purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._connect().execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, body: bytes, ttl: float) -> None:
+        await asyncio.to_thread(self._set, key, body, ttl)
+
+    async def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        return await asyncio.to_thread(self._purge_expired)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -3,6 +3,12 @@
 import httpx
 
 from fmp_py_client._base import BASE_URL, AsyncBaseClient
+from fmp_py_client._cache import CacheBackend, CachePolicy
+from fmp_py_client._connection import ConnectionConfig
+from fmp_py_client._json import DecoderName
+from fmp_py_client._ratelimit import RateLimiter
+from fmp_py_client._retry import RetryPolicy
+from fmp_py_client._scheduler import Scheduler
 from fmp_py_client.api._bulk import BulkMixin
 from fmp_py_client.api._calendar import CalendarMixin
 from fmp_py_client.api._company import CompanyMixin
@@ -66,10 +72,26 @@ class AsyncFMPClient(
         base_url: str = BASE_URL,
         timeout: float = 30.0,
         httpx_client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        cache: CacheBackend | None = None,
+        cache_policy: CachePolicy | None = None,
+        coalesce: bool = False,
+        json_decoder: DecoderName = "auto",
+        connection: ConnectionConfig | None = None,
+        scheduler: Scheduler | None = None,
     ) -> None:
         super().__init__(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
             httpx_client=httpx_client,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            cache=cache,
+            cache_policy=cache_policy,
+            coalesce=coalesce,
+            json_decoder=json_decoder,
+            connection=connection,
+            scheduler=scheduler,
         )
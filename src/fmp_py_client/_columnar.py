@@ -0,0 +1,124 @@
+"""Columnar decoding of list responses into NumPy arrays."""
+
+import json
+from collections.abc import Callable, Mapping
+from types import UnionType
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin, get_type_hints
+
+from fmp_py_client._json import JSONDecoder
+from fmp_py_client._structs import struct_decoder
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+type Columns = dict[str, "np.ndarray"]
+
+
+def _kind(name: str, tp: Any) -> str:
+    if get_origin(tp) in (Union, UnionType):
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        tp = args[0] if len(args) == 1 else object
+    if tp is bool:
+        return "bool"
+    if tp is float:
+        return "float"
+    if tp is int:
+        return "int"
+    if tp is str and (name == "date" or name.endswith("Date")):
+        return "date"
+    if tp in (dict, list) or get_origin(tp) in (dict, list):
+        return "nested"
+    return "object"
+
+
+def column_kinds(model: type) -> dict[str, str]:
+    """Map each field of a TypedDict model to its column kind."""
+    return {name: _kind(name, tp) for name, tp in get_type_hints(model).items()}
+
+
+def _to_array(kind: str, values: list[Any]) -> "np.ndarray":
+    import numpy as np
+
+    try:
+        if kind == "float":
+            return np.array(values, dtype=np.float64)
+        if kind == "int":
+            # int64 holds neither missing nor fractional values (e.g. crypto
+            # volumes); fall back to float64 rather than truncating.
+            integral = all(
+                type(value) is int or (type(value) is float and value.is_integer())
+                for value in values
+            )
+            return np.array(values, dtype=np.int64 if integral else np.float64)
+        if kind == "bool" and None not in values:
+            return np.array(values, dtype=np.bool_)
+        if kind == "date":
+            return np.array(values, dtype="datetime64")
+    except (TypeError, ValueError):
+        pass
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _build(kinds: Mapping[str, str], columns: Mapping[str, list[Any]]) -> Columns:
+    return {name: _to_array(kinds[name], columns[name]) for name in kinds}
+
+
+def rows_to_columns(rows: list[Mapping[str, Any]], model: type) -> Columns:
+    """Build typed columns from already decoded rows of ``model``."""
+    kinds = column_kinds(model)
+    return _build(kinds, {name: [row.get(name) for row in rows] for name in kinds})
+
+
+def _decode_with_hook(kinds: Mapping[str, str]) -> JSONDecoder:
+    def decode(body: bytes) -> Columns:
+        columns: dict[str, list[Any]] = {name: [] for name in kinds}
+        appenders = [(name, columns[name].append) for name in kinds]
+
+        def add_row(pairs: list[tuple[str, Any]]) -> None:
+            # Rows go straight into the column lists; no dict list is built.
+            row = dict(pairs)
+            for name, append in appenders:
+                append(row.get(name))
+
+        json.loads(body, object_pairs_hook=add_row)
+        return _build(kinds, columns)
+
+    return decode
+
+
+def column_decoder(model: type, fallback: JSONDecoder) -> JSONDecoder:
+    """Return a decoder from a JSON array body to one array per model field.
+
+    Prices are float64, volumes int64 (float64 when values are missing or
+    fractional), dates datetime64 and other fields object arrays. Requires
+    NumPy; with msgspec installed rows are decoded into compact structs
+    first, otherwise each row is appended to the columns as it is parsed.
+    """
+    import numpy  # noqa: F401
+
+    kinds = column_kinds(model)
+    if "nested" in kinds.values():
+        raise TypeError(f"{model.__name__} has nested fields and is not columnar")
+    try:
+        import msgspec  # noqa: F401
+    except ImportError:
+        return _decode_with_hook(kinds)
+    decode_structs: Callable[[bytes], list[Any]] = struct_decoder(model, fallback)
+
+    def decode(body: bytes) -> Columns:
+        rows = decode_structs(body)
+        return _build(
+            kinds, {name: [getattr(row, name) for row in rows] for name in kinds}
+        )
+
+    return decode
+
+
+def to_arrow(columns: Columns) -> "pa.Table":
+    """Return an Arrow table built from decoded columns."""
+    import pyarrow as pa
+
+    return pa.table(columns)
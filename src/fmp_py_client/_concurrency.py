@@ -0,0 +1,25 @@
+"""Helpers for running many requests concurrently."""
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+
+
+async def gather_limited[T](aws: Iterable[Awaitable[T]], limit: int) -> list[T]:
+    """Await ``aws`` with at most ``limit`` running at once, preserving order.
+
+    The first failure cancels the remaining awaitables and is re-raised.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(run(aw)) for aw in aws]
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0] from None
+    return [task.result() for task in tasks]
@@ -0,0 +1,74 @@
+"""Connection pool, keep-alive and timeout settings for the HTTP client."""
+
+import httpx
+
+
+class ConnectionConfig:
+    """Pool sizing, keep-alive, HTTP/2 and per-phase timeouts.
+
+    The defaults suit hundreds of concurrent requests: connections are kept
+    alive between requests so TLS handshakes are paid once per connection,
+    not once per request. With ``http2=True`` (install the ``http2`` extra)
+    many requests share each connection.
+
+    ``connect_timeout``, ``read_timeout``, ``write_timeout`` and
+    ``pool_timeout`` default to the client's ``timeout``. ``pool_timeout``
+    bounds the wait for a free connection when all are in use.
+
+    Usage:
+        connection = ConnectionConfig(max_connections=1000, http2=True)
+        async with AsyncFMPClient("your-api-key", connection=connection) as client:
+            ...
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = 512,
+        max_keepalive_connections: int | None = 256,
+        *,
+        keepalive_expiry: float | None = 60.0,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+    ) -> None:
+        if max_connections is not None and max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.write_timeout = write_timeout
+        self.pool_timeout = pool_timeout
+
+    def limits(self) -> httpx.Limits:
+        """Return the pool limits for ``httpx.AsyncClient``."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self, default: float) -> httpx.Timeout:
+        """Return per-phase timeouts, using ``default`` for unset phases."""
+
+        def pick(value: float | None) -> float:
+            return default if value is None else value
+
+        return httpx.Timeout(
+            connect=pick(self.connect_timeout),
+            read=pick(self.read_timeout),
+            write=pick(self.write_timeout),
+            pool=pick(self.pool_timeout),
+        )
+
+    def create_client(self, default_timeout: float) -> httpx.AsyncClient:
+        """Return an ``httpx.AsyncClient`` configured with these settings."""
+        return httpx.AsyncClient(
+            timeout=self.timeout(default_timeout),
+            limits=self.limits(),
+            http2=self.http2,
+        )
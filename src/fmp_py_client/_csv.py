@@ -0,0 +1,111 @@
+"""Incremental CSV parsing for the bulk endpoints."""
+
+import csv
+from collections.abc import Callable
+from typing import Any
+
+from fmp_py_client._columnar import column_kinds
+
+
+def _to_float(value: str) -> float:
+    return float(value)
+
+
+def _to_int(value: str) -> int | float:
+    try:
+        return int(value)
+    except ValueError:
+        number = float(value)
+        return int(number) if number.is_integer() else number
+
+
+def _to_bool(value: str) -> bool:
+    return value.lower() in ("true", "1")
+
+
+_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "float": _to_float,
+    "int": _to_int,
+    "bool": _to_bool,
+}
+
+
+class CSVRowParser:
+    """Turn chunks of CSV text into rows typed after a TypedDict model.
+
+    Text may be split anywhere, including inside quoted fields; rows are
+    returned once their last line is complete. Numeric and boolean fields are
+    converted per the model, empty values become ``None`` and columns the
+    model does not define are kept as strings.
+    """
+
+    def __init__(self, model: type) -> None:
+        kinds = column_kinds(model)
+        self._converters = {
+            name: _CONVERTERS[kind]
+            for name, kind in kinds.items()
+            if kind in _CONVERTERS
+        }
+        self._header: list[str] | None = None
+        self._buffer = ""
+        self._record: list[str] = []
+        self._quotes = 0
+
+    def feed(self, text: str) -> list[dict[str, Any]]:
+        """Add a chunk of text and return the rows it completes."""
+        if self._header is None and not self._buffer:
+            text = text.removeprefix("\ufeff")
+        lines = (self._buffer + text).split("\n")
+        self._buffer = lines.pop()
+        return self._parse(self._complete_records(lines))
+
+    def close(self) -> list[dict[str, Any]]:
+        """Return the rows left once the input has ended."""
+        lines = [self._buffer] if self._buffer else []
+        self._buffer = ""
+        records = self._complete_records(lines)
+        if self._record:
+            records.append("\n".join(self._record))
+            self._record = []
+        return self._parse(records)
+
+    def _complete_records(self, lines: list[str]) -> list[str]:
+        # An odd number of quotes so far means a quoted field spans lines.
+        records = []
+        for line in lines:
+            line = line.removesuffix("\r")
+            self._record.append(line)
+            self._quotes += line.count('"')
+            if self._quotes % 2 == 0:
+                records.append("\n".join(self._record))
+                self._record = []
+                self._quotes = 0
+        return records
+
+    def _parse(self, records: list[str]) -> list[dict[str, Any]]:
+        rows = []
+        for fields in csv.reader(records):
+            if not fields:
+                continue
+            if self._header is None:
+                self._header = fields
+                continue
+            rows.append(self._convert(fields))
+        return rows
+
+    def _convert(self, fields: list[str]) -> dict[str, Any]:
+        row: dict[str, Any] = {}
+        converters = self._converters
+        for name, value in zip(self._header or (), fields, strict=False):
+            if value == "":
+                row[name] = None
+                continue
+            convert = converters.get(name)
+            if convert is None:
+                row[name] = value
+                continue
+            try:
+                row[name] = convert(value)
+            except ValueError:
+                row[name] = value
+        return row
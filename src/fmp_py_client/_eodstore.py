@@ -0,0 +1,303 @@
+"""Local end-of-day price history with incremental updates."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fmp_py_client._columnar import column_kinds
+from fmp_py_client._types import MapResult
+from fmp_py_client.models import EODFull
+
+if TYPE_CHECKING:
+    from fmp_py_client._client import AsyncFMPClient
+
+DEFAULT_START = "1990-01-01"
+
+_SQL_TYPES = {"float": "REAL", "int": "INTEGER", "bool": "INTEGER"}
+FIELDS = tuple(column_kinds(EODFull))
+_VALUES = [name for name in FIELDS if name not in ("symbol", "date")]
+
+
+def trading_days(start: str, end: str, holidays: Iterable[str]) -> list[str]:
+    """Return weekdays from ``start`` to ``end`` inclusive, minus ``holidays``."""
+    closed = set(holidays)
+    day = date.fromisoformat(start)
+    last = date.fromisoformat(end)
+    days = []
+    while day <= last:
+        iso = day.isoformat()
+        if day.weekday() < 5 and iso not in closed:
+            days.append(iso)
+        day += timedelta(days=1)
+    return days
+
+
+def _ranges(days: list[str], missing: set[str]) -> list[tuple[str, str]]:
+    # Group missing days that are adjacent in the trading calendar.
+    ranges: list[tuple[str, str]] = []
+    run: list[str] = []
+    for day in days:
+        if day in missing:
+            run.append(day)
+        elif run:
+            ranges.append((run[0], run[-1]))
+            run = []
+    if run:
+        ranges.append((run[0], run[-1]))
+    return ranges
+
+
+class EODStore:
+    """SQLite store of end-of-day bars that only fetches what it lacks.
+
+    `update` fetches each symbol's full history once and afterwards only the
+    bars from its last stored date on; `update_from_bulk` appends one day for
+    every stored symbol with a single ``eod_bulk`` call. `backfill` compares
+    the stored dates with the exchange calendar from ``holidays_by_exchange``
+    and refetches missing ranges; days the API has no bar for are remembered
+    so they are not requested again.
+
+    Usage:
+        store = EODStore("~/data/eod.db")
+        async with AsyncFMPClient("your-api-key") as client:
+            await store.update(client, ["AAPL", "MSFT"])
+            await store.backfill(client)
+        bars = await store.load("AAPL", from_date="2024-01-01")
+        store.close()
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        busy_timeout: float = 30.0,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self._busy_timeout = busy_timeout
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self._busy_timeout,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            kinds = column_kinds(EODFull)
+            columns = ", ".join(
+                f'"{name}" {_SQL_TYPES.get(kinds[name], "TEXT")}' for name in _VALUES
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS bars ("
+                f"symbol TEXT NOT NULL, date TEXT NOT NULL, {columns}, "
+                "PRIMARY KEY (symbol, date)) WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS no_data ("
+                "symbol TEXT NOT NULL, date TEXT NOT NULL, "
+                "PRIMARY KEY (symbol, date)) WITHOUT ROWID"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> list[tuple[Any, ...]]:
+        with self._lock:
+            return self._connect().execute(sql, tuple(params)).fetchall()
+
+    def _insert(
+        self, rows: Iterable[Mapping[str, Any]], symbol: str | None = None
+    ) -> int:
+        placeholders = ", ".join("?" * len(FIELDS))
+        names = ", ".join(f'"{name}"' for name in FIELDS)
+        values = [
+            (symbol or row.get("symbol"), *(row.get(name) for name in FIELDS[1:]))
+            for row in rows
+            if (symbol or row.get("symbol")) and row.get("date")
+        ]
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO bars ({names}) VALUES ({placeholders})",
+                    values,
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return len(values)
+
+    async def symbols(self) -> list[str]:
+        """Return the stored symbols."""
+        rows = await asyncio.to_thread(
+            self._query, "SELECT DISTINCT symbol FROM bars ORDER BY symbol"
+        )
+        return [symbol for (symbol,) in rows]
+
+    async def last_date(self, symbol: str) -> str | None:
+        """Return the date of the newest stored bar for ``symbol``."""
+        rows = await asyncio.to_thread(
+            self._query, "SELECT MAX(date) FROM bars WHERE symbol = ?", (symbol,)
+        )
+        return rows[0][0]
+
+    async def load(
+        self,
+        symbol: str,
+        *,
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> list[EODFull]:
+        """Return stored bars for ``symbol``, oldest first."""
+        names = ", ".join(f'"{name}"' for name in FIELDS)
+        rows = await asyncio.to_thread(
+            self._query,
+            f"SELECT {names} FROM bars WHERE symbol = ? AND date >= ? AND date <= ? "
+            "ORDER BY date",
+            (symbol, from_date or "", to_date or "9999-12-31"),
+        )
+        return [
+            {k: v for k, v in zip(FIELDS, row, strict=True) if v is not None}  # type: ignore[misc]
+            for row in rows
+        ]
+
+    async def update(
+        self,
+        client: "AsyncFMPClient",
+        symbols: Iterable[str],
+        *,
+        start: str = DEFAULT_START,
+        concurrency: int = 8,
+    ) -> MapResult[int]:
+        """Fetch bars from each symbol's last stored date on.
+
+        The last stored bar is fetched again, so a bar stored during the
+        trading day is replaced by the final one. Symbols with no stored bars
+        are loaded from ``start``. Returns the number of bars written per
+        symbol and, like `AsyncFMPClient.map_all`, the errors of symbols
+        whose request failed.
+        """
+        today = datetime.now(UTC).date()
+
+        async def update_one(*, symbol: str) -> int:
+            first = await self.last_date(symbol) or start
+            if first > today.isoformat():
+                return 0
+            bars = await client.historical_price_eod_range(
+                symbol, from_date=first, to_date=today.isoformat()
+            )
+            return await asyncio.to_thread(self._insert, bars, symbol)
+
+        return await client.map_all(update_one, symbols, concurrency=concurrency)
+
+    async def update_from_bulk(
+        self,
+        client: "AsyncFMPClient",
+        *,
+        date: str | None = None,
+    ) -> int:
+        """Append one day of bars for every stored symbol from ``eod_bulk``.
+
+        Returns the number of bars written. Symbols that missed earlier days
+        are left with a gap for `backfill` to fill.
+        """
+        tracked = set(await self.symbols())
+        rows = [
+            row
+            async for row in client.iter_eod_bulk(date=date)
+            if row.get("symbol") in tracked
+        ]
+        return await asyncio.to_thread(self._insert, rows)
+
+    async def find_gaps(
+        self,
+        symbol: str,
+        holidays: Iterable[str],
+    ) -> list[tuple[str, str]]:
+        """Return date ranges of trading days missing between the stored bars."""
+
+        def find() -> list[tuple[str, str]]:
+            stored = {
+                day
+                for (day,) in self._query(
+                    "SELECT date FROM bars WHERE symbol = ? "
+                    "UNION SELECT date FROM no_data WHERE symbol = ?",
+                    (symbol, symbol),
+                )
+            }
+            if not stored:
+                return []
+            days = trading_days(min(stored), max(stored), holidays)
+            return _ranges(days, set(days) - stored)
+
+        return await asyncio.to_thread(find)
+
+    async def backfill(
+        self,
+        client: "AsyncFMPClient",
+        symbols: Iterable[str] | None = None,
+        *,
+        exchange: str = "NASDAQ",
+        concurrency: int = 8,
+    ) -> MapResult[int]:
+        """Refetch the missing trading days of each symbol.
+
+        Defaults to every stored symbol. Returns the number of bars written
+        per symbol that had gaps and the errors of symbols whose request
+        failed.
+        """
+        holidays = [
+            holiday["date"]
+            for holiday in await client.holidays_by_exchange(exchange=exchange)
+        ]
+        if symbols is None:
+            symbols = await self.symbols()
+
+        async def backfill_one(*, symbol: str) -> int | None:
+            gaps = await self.find_gaps(symbol, holidays)
+            if not gaps:
+                return None
+            written = 0
+            for start, end in gaps:
+                bars = await client.historical_price_eod_full(
+                    symbol, from_date=start, to_date=end
+                )
+                written += await asyncio.to_thread(self._insert, bars, symbol)
+                found = {bar["date"] for bar in bars}
+                empty = [
+                    day
+                    for day in trading_days(start, end, holidays)
+                    if day not in found
+                ]
+                await asyncio.to_thread(self._mark_no_data, symbol, empty)
+            return written
+
+        counts, errors = await client.map_all(
+            backfill_one, symbols, concurrency=concurrency
+        )
+        written = {s: count for s, count in counts.items() if count is not None}
+        return MapResult(written, errors)
+
+    def _mark_no_data(self, symbol: str, days: list[str]) -> None:
+        with self._lock:
+            self._connect().executemany(
+                "INSERT OR IGNORE INTO no_data (symbol, date) VALUES (?, ?)",
+                [(symbol, day) for day in days],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
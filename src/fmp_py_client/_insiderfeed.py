@@ -0,0 +1,146 @@
+"""Incremental reader for the latest insider trades."""
+
+import json
+import warnings
+from collections.abc import Mapping
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fmp_py_client.models import InsiderTrade
+
+if TYPE_CHECKING:
+    from fmp_py_client._client import AsyncFMPClient
+
+# Fields that together identify one transaction row of a filing.
+KEY_FIELDS = (
+    "filingDate",
+    "reportingCik",
+    "link",
+    "transactionDate",
+    "transactionType",
+    "securitiesTransacted",
+    "price",
+    "securitiesOwned",
+)
+
+
+def trade_key(row: Mapping[str, Any]) -> str:
+    """Return a string identifying one insider trade row."""
+    return "|".join(str(row.get(field, "")) for field in KEY_FIELDS)
+
+
+class InsiderFeed:
+    """Reads only insider trades filed since the previous poll.
+
+    The feed keeps a watermark: the latest ``filingDate`` seen and the keys
+    of the rows filed at that time. `poll` walks ``insider_trading_latest``
+    pages, newest first, only until it reaches a row at or before the
+    watermark, so a poll usually costs one request. Rows are deduplicated
+    by filing date, reporting CIK, filing link and transaction details.
+    With ``path``, the watermark is saved as JSON after every poll that
+    finds new rows and loaded again on start.
+
+    The first poll without a saved watermark reads a single page. Rows that
+    appear later with a filing date before the watermark are not returned,
+    and rows without a ``filingDate`` are skipped.
+
+    If ``max_pages`` pages are read without reaching the watermark, the
+    trades between them and the watermark are still unread: the watermark is
+    kept, a `RuntimeWarning` is issued, and the trades already returned are
+    remembered so later polls return only the rest. Raise ``max_pages`` if
+    this happens.
+
+    Usage:
+        feed = InsiderFeed("~/data/insider-feed.json")
+        while True:
+            for trade in await feed.poll(client):
+                handle(trade)
+            await asyncio.sleep(60)
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str] | None = None,
+        *,
+        limit: int = 100,
+        max_pages: int = 20,
+    ) -> None:
+        if limit < 1 or max_pages < 1:
+            raise ValueError("limit and max_pages must be at least 1")
+        self.path = None if path is None else Path(path).expanduser()
+        self.limit = limit
+        self.max_pages = max_pages
+        self.watermark: str | None = None
+        self._keys: set[str] = set()
+        # Key -> filing date of trades returned before the watermark was reached.
+        self._pending: dict[str, str] = {}
+        if self.path is not None and self.path.exists():
+            state = json.loads(self.path.read_text())
+            self.watermark = state["filingDate"]
+            self._keys = set(state["keys"])
+            self._pending = state.get("pending", {})
+
+    def _is_seen(self, filed: str, key: str) -> bool:
+        if self.watermark is None:
+            return False
+        return filed < self.watermark or (filed == self.watermark and key in self._keys)
+
+    async def poll(self, client: "AsyncFMPClient") -> list[InsiderTrade]:
+        """Return trades filed since the last poll, oldest first."""
+        new: dict[str, InsiderTrade] = {}
+        pages = 1 if self.watermark is None else self.max_pages
+        caught_up = False
+        for page in range(pages):
+            rows = await client.insider_trading_latest(page=page, limit=self.limit)
+            reached = False
+            for row in rows:
+                filed = row.get("filingDate")
+                if not filed:
+                    continue
+                key = trade_key(row)
+                if self._is_seen(filed, key):
+                    reached = True
+                elif key not in self._pending:
+                    # Rows shift between pages while new filings arrive.
+                    new.setdefault(key, row)
+            if reached or len(rows) < self.limit or self.watermark is None:
+                caught_up = True
+                break
+        trades = sorted(new.values(), key=lambda row: row["filingDate"])
+        if not caught_up:
+            warnings.warn(
+                f"InsiderFeed read {pages} pages without reaching the watermark "
+                f"{self.watermark}; raise max_pages to read the trades in between",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            self._pending.update((trade_key(row), row["filingDate"]) for row in trades)
+            self._save()
+        elif trades or self._pending:
+            self._advance(trades)
+        return trades
+
+    def _advance(self, trades: list[InsiderTrade]) -> None:
+        filed = self._pending | {trade_key(row): row["filingDate"] for row in trades}
+        latest = max(filed.values())
+        keys = {key for key, date in filed.items() if date == latest}
+        if latest == self.watermark:
+            self._keys |= keys
+        else:
+            self.watermark, self._keys = latest, keys
+        self._pending = {}
+        self._save()
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "filingDate": self.watermark,
+            "keys": sorted(self._keys),
+            "pending": self._pending,
+        }
+        partial = self.path.with_name(f"{self.path.name}.tmp")
+        partial.write_text(json.dumps(state))
+        partial.replace(self.path)
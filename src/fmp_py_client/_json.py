@@ -0,0 +1,42 @@
+"""JSON decoding backends."""
+
+import json
+from collections.abc import Callable
+from typing import Any, Literal
+
+type JSONDecoder = Callable[[bytes], Any]
+type DecoderName = Literal["auto", "orjson", "msgspec", "json"]
+
+
+def _orjson() -> JSONDecoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec() -> JSONDecoder:
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+def get_decoder(name: DecoderName = "auto") -> JSONDecoder:
+    """Return a function decoding a JSON response body from bytes.
+
+    ``auto`` picks orjson, then msgspec, whichever is installed first, and
+    falls back to the standard library.
+    """
+    if name == "json":
+        return json.loads
+    if name == "orjson":
+        return _orjson()
+    if name == "msgspec":
+        return _msgspec()
+    if name != "auto":
+        raise ValueError(f"Unknown JSON decoder: {name!r}")
+    for factory in (_orjson, _msgspec):
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return json.loads
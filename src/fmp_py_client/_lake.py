@@ -0,0 +1,248 @@
+"""Local Parquet mirror of the bulk endpoints."""
+
+import asyncio
+import json
+import os
+from collections.abc import Iterable, Mapping
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fmp_py_client._columnar import column_kinds
+from fmp_py_client._concurrency import gather_limited
+from fmp_py_client._types import Period
+from fmp_py_client.models import (
+    BalanceSheetStatement,
+    BalanceSheetStatementGrowth,
+    CashFlowStatement,
+    CashFlowStatementGrowth,
+    EODFull,
+    IncomeStatement,
+    IncomeStatementGrowth,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from fmp_py_client._client import AsyncFMPClient
+
+# Endpoint -> (row model, request params identifying one partition).
+LAKE_ENDPOINTS: dict[str, tuple[type, tuple[str, ...]]] = {
+    "income-statement-bulk": (IncomeStatement, ("year", "period")),
+    "balance-sheet-statement-bulk": (BalanceSheetStatement, ("year", "period")),
+    "cash-flow-statement-bulk": (CashFlowStatement, ("year", "period")),
+    "income-statement-growth-bulk": (IncomeStatementGrowth, ("year", "period")),
+    "balance-sheet-statement-growth-bulk": (
+        BalanceSheetStatementGrowth,
+        ("year", "period"),
+    ),
+    "cash-flow-statement-growth-bulk": (CashFlowStatementGrowth, ("year", "period")),
+    "eod-bulk": (EODFull, ("date",)),
+}
+
+STATEMENT_ENDPOINTS = tuple(
+    name for name, (_, keys) in LAKE_ENDPOINTS.items() if keys == ("year", "period")
+)
+
+# Request param -> partition directory key. The keys differ from every model
+# field, since Hive readers replace a file column with a same-named partition.
+PARTITION_KEYS = {
+    "year": "fiscal_year",
+    "period": "report_period",
+    "date": "trade_date",
+}
+
+MANIFEST = "_manifest.json"
+
+
+def _partition_parts(endpoint: str, keys: Mapping[str, Any]) -> list[str]:
+    _, names = LAKE_ENDPOINTS[endpoint]
+    return [f"{PARTITION_KEYS[name]}={keys[name]}" for name in names]
+
+
+def _arrow_schema(model: type) -> "pa.Schema":
+    import pyarrow as pa
+
+    # Int fields may hold fractional values, such as crypto volumes, and every
+    # partition needs the same schema, so they are always stored as float64.
+    types = {"float": pa.float64(), "int": pa.float64(), "bool": pa.bool_()}
+    return pa.schema(
+        (name, types.get(kind, pa.string()))
+        for name, kind in column_kinds(model).items()
+    )
+
+
+def _coerce(kind: str, value: Any) -> Any:
+    # CSV values that do not fit the column type are stored as nulls.
+    if value is None:
+        return None
+    if kind in ("float", "int"):
+        ok = isinstance(value, int | float) and not isinstance(value, bool)
+        return float(value) if ok else None
+    if kind == "bool":
+        return value if isinstance(value, bool) else None
+    return str(value)
+
+
+class ParquetLake:
+    """Partitioned Parquet store mirroring the bulk statement and EOD endpoints.
+
+    Each endpoint is written Hive-style under ``root``, e.g.
+    ``income-statement-bulk/fiscal_year=2023/report_period=annual/part-0.parquet``
+    or ``eod-bulk/trade_date=2024-01-02/part-0.parquet``, so readers such as
+    ``pyarrow.dataset`` can prune partitions and push down predicates. The
+    partition keys never shadow row columns such as ``period`` or ``date``. A
+    manifest records the partitions already fetched; reruns only download
+    partitions that are missing or were still incomplete when fetched
+    (statement years that may still receive filings, or today's EOD).
+    Requires pyarrow.
+
+    Usage:
+        lake = ParquetLake("~/data/fmp")
+        async with AsyncFMPClient("your-api-key") as client:
+            await lake.sync_statements(client, years=range(2015, 2025))
+            await lake.sync_eod(client, dates=["2024-01-02", "2024-01-03"])
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        *,
+        batch_size: int = 100_000,
+    ) -> None:
+        self.root = Path(root).expanduser()
+        self.batch_size = batch_size
+        self._manifest: dict[str, Any] | None = None
+
+    def partition_path(self, endpoint: str, **keys: Any) -> Path:
+        """Return the Parquet file of one partition, keyed by request params."""
+        parts = _partition_parts(endpoint, keys)
+        return self.root.joinpath(endpoint, *parts, "part-0.parquet")
+
+    def has_partition(self, endpoint: str, **keys: Any) -> bool:
+        """Return whether a partition was fetched and is known to be complete."""
+        entry = self._load_manifest().get(self._manifest_key(endpoint, keys))
+        return entry is not None and entry["complete"]
+
+    async def sync_statements(
+        self,
+        client: "AsyncFMPClient",
+        *,
+        years: Iterable[int],
+        periods: Iterable[Period | str] = (Period.ANNUAL, Period.QUARTER),
+        endpoints: Iterable[str] = STATEMENT_ENDPOINTS,
+        concurrency: int = 2,
+        refresh: bool = False,
+    ) -> list[Path]:
+        """Fetch missing statement partitions and return the files written."""
+        partitions = [
+            (endpoint, {"year": year, "period": str(period)})
+            for endpoint in endpoints
+            for year in years
+            for period in periods
+        ]
+        return await self._sync(client, partitions, concurrency, refresh)
+
+    async def sync_eod(
+        self,
+        client: "AsyncFMPClient",
+        *,
+        dates: Iterable[str | date],
+        concurrency: int = 2,
+        refresh: bool = False,
+    ) -> list[Path]:
+        """Fetch missing end-of-day partitions and return the files written."""
+        partitions = [("eod-bulk", {"date": str(day)}) for day in dates]
+        return await self._sync(client, partitions, concurrency, refresh)
+
+    async def _sync(
+        self,
+        client: "AsyncFMPClient",
+        partitions: list[tuple[str, dict[str, Any]]],
+        concurrency: int,
+        refresh: bool,
+    ) -> list[Path]:
+        missing = [
+            (endpoint, keys)
+            for endpoint, keys in partitions
+            if refresh or not self.has_partition(endpoint, **keys)
+        ]
+        return await gather_limited(
+            (
+                self._fetch_partition(client, endpoint, keys)
+                for endpoint, keys in missing
+            ),
+            concurrency,
+        )
+
+    async def _fetch_partition(
+        self,
+        client: "AsyncFMPClient",
+        endpoint: str,
+        keys: dict[str, Any],
+    ) -> Path:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        model, _ = LAKE_ENDPOINTS[endpoint]
+        kinds = column_kinds(model)
+        schema = _arrow_schema(model)
+        path = self.partition_path(endpoint, **keys)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.tmp")
+        writer = pq.ParquetWriter(partial, schema)
+        rows = 0
+
+        def write(batch: list[Mapping[str, Any]]) -> None:
+            columns = {
+                name: [_coerce(kind, row.get(name)) for row in batch]
+                for name, kind in kinds.items()
+            }
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+
+        try:
+            batch: list[Mapping[str, Any]] = []
+            async for row in client._stream_csv(endpoint, model, params=dict(keys)):
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    await asyncio.to_thread(write, batch)
+                    rows += len(batch)
+                    batch = []
+            if batch or not rows:
+                await asyncio.to_thread(write, batch)
+                rows += len(batch)
+            writer.close()
+        except BaseException:
+            writer.close()
+            partial.unlink(missing_ok=True)
+            raise
+        partial.replace(path)
+        self._record(endpoint, keys, rows)
+        return path
+
+    def _manifest_key(self, endpoint: str, keys: Mapping[str, Any]) -> str:
+        return "/".join([endpoint, *_partition_parts(endpoint, keys)])
+
+    def _load_manifest(self) -> dict[str, Any]:
+        if self._manifest is None:
+            path = self.root / MANIFEST
+            self._manifest = json.loads(path.read_text()) if path.exists() else {}
+        return self._manifest
+
+    def _record(self, endpoint: str, keys: Mapping[str, Any], rows: int) -> None:
+        today = datetime.now(UTC).date()
+        if "date" in keys:
+            complete = str(keys["date"]) < today.isoformat()
+        else:
+            # Filings for the last full year keep arriving well into this one.
+            complete = int(keys["year"]) < today.year - 1
+        manifest = self._load_manifest()
+        manifest[self._manifest_key(endpoint, keys)] = {
+            "rows": rows,
+            "fetched_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "complete": complete,
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        partial = self.root / f"{MANIFEST}.tmp"
+        partial.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        partial.replace(self.root / MANIFEST)
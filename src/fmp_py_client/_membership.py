@@ -0,0 +1,222 @@
+"""Point-in-time index membership from historical constituent changes."""
+
+import asyncio
+import bisect
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from fmp_py_client._client import AsyncFMPClient
+
+# Index name -> (current constituents method, historical changes method).
+INDEXES = {
+    "sp500": ("sp500_constituent", "historical_sp500_constituent"),
+    "nasdaq": ("nasdaq_constituent", "historical_nasdaq_constituent"),
+    "dowjones": ("dowjones_constituent", "historical_dowjones_constituent"),
+}
+
+type Event = dict[str, str | None]
+
+
+class MembershipPeriod(NamedTuple):
+    """A period during which a symbol belonged to an index.
+
+    The symbol is a member from ``start`` up to but excluding ``end``.
+    ``start`` is ``None`` when membership predates the recorded changes and
+    ``end`` is ``None`` while the symbol is still a member.
+    """
+
+    index: str
+    start: str | None
+    end: str | None
+
+
+def _event(row: Mapping[str, Any]) -> Event:
+    return {
+        "date": row["date"],
+        "added": row.get("symbol") or None,
+        "removed": row.get("removedTicker") or None,
+    }
+
+
+def _event_key(event: Mapping[str, str | None]) -> tuple[str, str, str]:
+    return (event["date"] or "", event["added"] or "", event["removed"] or "")
+
+
+class _Timeline:
+    """Membership of one index after each change date."""
+
+    def __init__(
+        self, name: str, current: Iterable[str], events: Iterable[Event]
+    ) -> None:
+        self.current = sorted(set(current))
+        self.events = sorted(events, key=_event_key)
+        self.periods: dict[str, list[MembershipPeriod]] = {}
+
+        # Undo changes from the newest back to find who was a member before.
+        members = set(self.current)
+        ends: dict[str, str | None] = dict.fromkeys(members)
+        for event in reversed(self.events):
+            date, added, removed = event["date"], event["added"], event["removed"]
+            if added is not None and added in members:
+                members.discard(added)
+                self._period(added, MembershipPeriod(name, date, ends.pop(added)))
+            if removed is not None and removed not in members:
+                members.add(removed)
+                ends[removed] = date
+        for symbol in members:
+            self._period(symbol, MembershipPeriod(name, None, ends[symbol]))
+        for periods in self.periods.values():
+            periods.sort(key=lambda p: p.start or "")
+
+        # Replay forwards, keeping the members after each change date.
+        self.initial = tuple(sorted(members))
+        self.dates: list[str] = []
+        self.snapshots: list[tuple[str, ...]] = []
+        for event in self.events:
+            if event["removed"] is not None:
+                members.discard(event["removed"])
+            if event["added"] is not None:
+                members.add(event["added"])
+            if self.dates and self.dates[-1] == event["date"]:
+                self.snapshots[-1] = tuple(sorted(members))
+            else:
+                self.dates.append(event["date"])  # type: ignore[arg-type]
+                self.snapshots.append(tuple(sorted(members)))
+
+    def _period(self, symbol: str, period: MembershipPeriod) -> None:
+        self.periods.setdefault(symbol, []).append(period)
+
+    def members_on(self, date: str) -> tuple[str, ...]:
+        i = bisect.bisect_right(self.dates, date)
+        return self.snapshots[i - 1] if i else self.initial
+
+
+class IndexMembership:
+    """Point-in-time members of the S&P 500, Nasdaq and Dow Jones indexes.
+
+    Today's constituents and the historical add/remove changes are replayed
+    once into a snapshot per change date and a list of membership periods
+    per symbol, so `members_on` is a binary search and `membership_history`
+    a dictionary lookup. `save` and `load` keep the changes on disk;
+    `refresh` fetches them again and rebuilds only the indexes that changed.
+
+    Usage:
+        membership = await IndexMembership.build(client)
+        membership.save("~/data/membership.json")
+
+        membership = IndexMembership.load("~/data/membership.json")
+        await membership.refresh(client)
+        universe = membership.members_on("sp500", "2008-09-15")
+        membership.membership_history("AAPL")
+    """
+
+    def __init__(self, data: Mapping[str, Mapping[str, Any]] | None = None) -> None:
+        self._timelines: dict[str, _Timeline] = {}
+        for name, entry in (data or {}).items():
+            self._timelines[name] = _Timeline(name, entry["current"], entry["events"])
+
+    @property
+    def indexes(self) -> list[str]:
+        """Names of the loaded indexes."""
+        return list(self._timelines)
+
+    def _timeline(self, index: str) -> _Timeline:
+        timeline = self._timelines.get(index)
+        if timeline is None:
+            raise KeyError(f"Index not loaded: {index!r}")
+        return timeline
+
+    def members_on(self, index: str, date: str) -> list[str]:
+        """Return the symbols in ``index`` at the close of ``date``.
+
+        Changes dated ``date`` are included. Before the first recorded change
+        the earliest known membership is returned.
+        """
+        return list(self._timeline(index).members_on(date))
+
+    def is_member(self, index: str, symbol: str, date: str) -> bool:
+        """Return whether ``symbol`` was in ``index`` on ``date``."""
+        for period in self._timeline(index).periods.get(symbol, ()):
+            if (period.start or "") <= date and (
+                period.end is None or date < period.end
+            ):
+                return True
+        return False
+
+    def membership_history(
+        self, symbol: str, index: str | None = None
+    ) -> list[MembershipPeriod]:
+        """Return the periods ``symbol`` spent in each index, oldest first."""
+        names = self.indexes if index is None else [index]
+        periods = [
+            period
+            for name in names
+            for period in self._timeline(name).periods.get(symbol, ())
+        ]
+        return sorted(periods, key=lambda p: (p.start or "", p.index))
+
+    @classmethod
+    async def build(
+        cls,
+        client: "AsyncFMPClient",
+        indexes: Sequence[str] = tuple(INDEXES),
+    ) -> "IndexMembership":
+        """Fetch constituents and changes for ``indexes`` and build the timelines."""
+        membership = cls()
+        await membership.refresh(client, indexes)
+        return membership
+
+    async def refresh(
+        self,
+        client: "AsyncFMPClient",
+        indexes: Sequence[str] | None = None,
+    ) -> dict[str, int]:
+        """Fetch the latest constituents and changes and apply what is new.
+
+        ``indexes`` defaults to those already loaded. Returns the number of
+        new changes per index; unchanged indexes are not rebuilt.
+        """
+        names = list(indexes if indexes is not None else self.indexes)
+        for name in names:
+            if name not in INDEXES:
+                raise ValueError(f"Unknown index: {name!r}")
+
+        async def fetch(name: str) -> tuple[list[Any], list[Any]]:
+            current, historical = INDEXES[name]
+            return await asyncio.gather(
+                getattr(client, current)(), getattr(client, historical)()
+            )
+
+        results = await asyncio.gather(*(fetch(name) for name in names))
+        added: dict[str, int] = {}
+        for name, (current_rows, change_rows) in zip(names, results, strict=True):
+            old = self._timelines.get(name)
+            events = {_event_key(e): e for e in (old.events if old else [])}
+            new = [e for e in map(_event, change_rows) if _event_key(e) not in events]
+            current = sorted({row["symbol"] for row in current_rows})
+            added[name] = len(new)
+            if old is None or new or current != old.current:
+                events.update((_event_key(e), e) for e in new)
+                self._timelines[name] = _Timeline(name, current, events.values())
+        return added
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """Write the constituents and changes to a JSON file atomically."""
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            name: {"current": timeline.current, "events": timeline.events}
+            for name, timeline in self._timelines.items()
+        }
+        partial = path.with_name(f"{path.name}.tmp")
+        partial.write_text(json.dumps(data, separators=(",", ":")))
+        partial.replace(path)
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> "IndexMembership":
+        """Read membership written by `save`."""
+        return cls(json.loads(Path(path).expanduser().read_text()))
@@ -0,0 +1,163 @@
+"""Polling news stream across the latest-news endpoints."""
+
+import asyncio
+import hashlib
+import time
+from collections.abc import AsyncIterator, Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from fmp_py_client._exceptions import FMPAuthenticationError, FMPError
+from fmp_py_client.models import FMPArticle, NewsArticle
+
+if TYPE_CHECKING:
+    from fmp_py_client._client import AsyncFMPClient
+
+# Feed name -> client method returning its latest page.
+FEEDS = {
+    "general": "news_general_latest",
+    "stock": "news_stock_latest",
+    "press_releases": "news_press_releases_latest",
+    "crypto": "news_crypto_latest",
+    "forex": "news_forex_latest",
+    "articles": "fmp_articles",
+}
+
+
+def _digest(kind: str, value: str) -> bytes:
+    return hashlib.blake2b(f"{kind}:{value}".encode(), digest_size=8).digest()
+
+
+def article_keys(article: Mapping[str, Any]) -> list[bytes]:
+    """Return hashes of an article's URL and normalized title."""
+    keys = []
+    url = (article.get("url") or article.get("link") or "").strip().rstrip("/")
+    if url:
+        keys.append(_digest("url", url))
+    title = " ".join((article.get("title") or "").lower().split())
+    if title:
+        keys.append(_digest("title", title))
+    return keys
+
+
+def published(article: Mapping[str, Any]) -> str:
+    """Return an article's publish time (``publishedDate`` or ``date``)."""
+    return article.get("publishedDate") or article.get("date") or ""
+
+
+class SeenSet:
+    """Set of recent hashes holding at most ``max_size``, oldest evicted first."""
+
+    def __init__(self, max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._items: dict[bytes, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def add(self, key: bytes) -> None:
+        self._items.pop(key, None)
+        self._items[key] = None
+        if len(self._items) > self.max_size:
+            del self._items[next(iter(self._items))]
+
+
+class NewsStream:
+    """Polls the latest-news feeds concurrently and yields only fresh articles.
+
+    Each feed is polled on its own interval: it halves (down to
+    ``min_interval``) after a poll that found new articles and grows by half
+    (up to ``max_interval``) after one that did not, so busy feeds are read
+    often and quiet ones rarely. Articles are deduplicated across feeds by
+    URL and by normalized title, remembering the last ``seen_size`` hashes.
+    The new articles of each polling round are yielded in publish order.
+
+    By default the articles already on the feeds when the stream starts are
+    only marked as seen; pass ``backlog=True`` to yield them too. Failed
+    polls are retried after a longer interval, except authentication errors,
+    which are raised.
+
+    Usage:
+        stream = NewsStream(["general", "stock", "press_releases"])
+        async for article in stream.stream(client):
+            handle(article)
+    """
+
+    def __init__(
+        self,
+        feeds: Iterable[str] = tuple(FEEDS),
+        *,
+        limit: int = 50,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0,
+        seen_size: int = 10_000,
+        backlog: bool = False,
+    ) -> None:
+        self.feeds = list(feeds)
+        for feed in self.feeds:
+            if feed not in FEEDS:
+                raise ValueError(f"Unknown news feed: {feed!r}")
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= max_interval")
+        self.limit = limit
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.seen = SeenSet(seen_size)
+        self.intervals = dict.fromkeys(self.feeds, min_interval)
+        # Feeds whose articles on the first poll are yielded, not just seen.
+        self._primed = set(self.feeds) if backlog else set()
+
+    def _fresh(self, articles: Iterable[Any]) -> list[Any]:
+        # Marks articles as seen; returns those not seen before.
+        fresh = []
+        for article in articles:
+            keys = article_keys(article)
+            if not any(key in self.seen for key in keys):
+                fresh.append(article)
+            for key in keys:
+                self.seen.add(key)
+        return fresh
+
+    def _adapt(self, feed: str, found: bool) -> None:
+        interval = self.intervals[feed]
+        interval = interval / 2 if found else interval * 1.5
+        self.intervals[feed] = min(self.max_interval, max(self.min_interval, interval))
+
+    async def _poll(self, client: "AsyncFMPClient", feed: str) -> list[Any] | None:
+        try:
+            return await getattr(client, FEEDS[feed])(page=0, limit=self.limit)
+        except FMPAuthenticationError:
+            raise
+        except FMPError:
+            return None
+
+    async def stream(
+        self, client: "AsyncFMPClient"
+    ) -> AsyncIterator[NewsArticle | FMPArticle]:
+        """Poll the feeds forever, yielding new articles as they appear."""
+        next_poll = dict.fromkeys(self.feeds, 0.0)
+        while True:
+            now = time.monotonic()
+            due = [feed for feed in self.feeds if next_poll[feed] <= now]
+            if not due:
+                await asyncio.sleep(min(next_poll.values()) - now)
+                continue
+            pages = await asyncio.gather(*(self._poll(client, feed) for feed in due))
+            fresh = []
+            for feed, articles in zip(due, pages, strict=True):
+                if articles is None:
+                    self._adapt(feed, found=False)
+                else:
+                    new = self._fresh(articles)
+                    if feed in self._primed:
+                        fresh.extend(new)
+                        self._adapt(feed, found=bool(new))
+                    self._primed.add(feed)
+                next_poll[feed] = time.monotonic() + self.intervals[feed]
+            fresh.sort(key=published)
+            for article in fresh:
+                yield article
@@ -0,0 +1,95 @@
+"""Auto-pagination for page/limit and multi-part endpoints."""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+
+async def paginate[T](
+    fetch: Callable[..., Awaitable[list[T]]],
+    /,
+    *,
+    limit: int | None = None,
+    start_page: int = 0,
+    prefetch: int = 2,
+    **params: Any,
+) -> AsyncIterator[T]:
+    """Yield rows from consecutive pages of a page/limit endpoint.
+
+    While the caller consumes page N, up to ``prefetch`` following pages are
+    already being fetched. Iteration stops at the first empty page or at a
+    page shorter than ``limit`` (or than the first page when ``limit`` is not
+    given); read-ahead requests past the end are cancelled.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+    if limit is not None:
+        params["limit"] = limit
+    pending: deque[asyncio.Future[list[T]]] = deque()
+    next_page = start_page
+
+    def schedule() -> None:
+        nonlocal next_page
+        while len(pending) <= prefetch:
+            pending.append(asyncio.ensure_future(fetch(page=next_page, **params)))
+            next_page += 1
+
+    page_size = limit
+    try:
+        schedule()
+        while pending:
+            rows = await pending.popleft()
+            if not rows:
+                return
+            if page_size is None:
+                page_size = len(rows)
+            last = len(rows) < page_size
+            if not last:
+                schedule()
+            for row in rows:
+                yield row
+            if last:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def fetch_parts[R](
+    load: Callable[[int], Awaitable[R]],
+    /,
+    *,
+    is_empty: Callable[[R], bool],
+    concurrency: int = 4,
+) -> AsyncIterator[R]:
+    """Yield the results of numbered parts 0, 1, 2, ... in order.
+
+    The part count is not known up front, so up to ``concurrency`` parts are
+    loaded speculatively; iteration stops at the first empty part and loads
+    of later parts are cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    pending: deque[asyncio.Future[R]] = deque()
+    next_part = 0
+
+    def schedule() -> None:
+        nonlocal next_part
+        while len(pending) < concurrency:
+            pending.append(asyncio.ensure_future(load(next_part)))
+            next_part += 1
+
+    try:
+        schedule()
+        while pending:
+            result = await pending.popleft()
+            if is_empty(result):
+                return
+            schedule()
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
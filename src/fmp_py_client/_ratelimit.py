@@ -0,0 +1,101 @@
+"""Client-side token-bucket rate limiting."""
+
+import asyncio
+import time
+from collections.abc import Mapping
+
+QUOTE_PATH_PREFIXES = (
+    "quote",
+    "aftermarket-",
+    "stock-price-change",
+    "batch-",
+)
+
+
+def endpoint_group(path: str) -> str:
+    """Return the budget group (``bulk``, ``quotes`` or ``default``) for a path."""
+    name = path.strip("/")
+    if name.endswith("-bulk"):
+        return "bulk"
+    if name.startswith(QUOTE_PATH_PREFIXES):
+        return "quotes"
+    return "default"
+
+
+class TokenBucket:
+    """Token bucket that paces callers to a sustained request rate.
+
+    Waiters are served in arrival order, so a large fan-out is released
+    evenly at the configured rate instead of racing for freed tokens.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        *,
+        burst: int | None = None,
+    ) -> None:
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._rate = requests_per_minute / 60.0
+        self._capacity = float(
+            burst if burst is not None else max(1, round(self._rate))
+        )
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def requests_per_minute(self) -> float:
+        return self._rate * 60.0
+
+    @property
+    def burst(self) -> int:
+        return int(self._capacity)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class RateLimiter:
+    """Global request budget with optional per-endpoint-group budgets.
+
+    Usage:
+        limiter = RateLimiter(
+            300,
+            groups={"bulk": TokenBucket(10), "quotes": TokenBucket(200)},
+        )
+        async with AsyncFMPClient("your-api-key", rate_limiter=limiter) as client:
+            ...
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        *,
+        burst: int | None = None,
+        groups: Mapping[str, TokenBucket] | None = None,
+    ) -> None:
+        self._global = TokenBucket(requests_per_minute, burst=burst)
+        self._groups = dict(groups or {})
+
+    async def acquire(self, path: str) -> None:
+        """Wait for budget to send one request to ``path``."""
+        bucket = self._groups.get(endpoint_group(path))
+        if bucket is not None:
+            await bucket.acquire()
+        await self._global.acquire()
@@ -0,0 +1,63 @@
+"""Retry policy for transient request failures."""
+
+import random
+from collections.abc import Iterable
+
+from fmp_py_client._exceptions import (
+    FMPAPIError,
+    FMPConnectionError,
+    FMPError,
+    FMPRateLimitError,
+    FMPTimeoutError,
+)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """Retry schedule with jittered exponential backoff.
+
+    Rate-limit responses that carry a ``Retry-After`` header wait exactly that
+    long; other retryable failures back off exponentially from
+    ``backoff_base`` up to ``backoff_max`` seconds. ``deadline`` bounds the
+    total time spent on one request, including all waits.
+
+    Usage:
+        policy = RetryPolicy(max_attempts=5, deadline=60.0)
+        async with AsyncFMPClient("your-api-key", retry=policy) as client:
+            ...
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        *,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        deadline: float | None = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.deadline = deadline
+
+    def is_retryable(self, error: FMPError) -> bool:
+        """Return whether ``error`` is worth another attempt."""
+        if isinstance(error, (FMPTimeoutError, FMPConnectionError)):
+            return True
+        if isinstance(error, FMPAPIError):
+            return error.status_code in self.retry_statuses
+        return False
+
+    def delay(self, attempt: int, error: FMPError) -> float:
+        """Return seconds to wait after the ``attempt``-th failed attempt."""
+        if isinstance(error, FMPRateLimitError) and error.retry_after is not None:
+            return error.retry_after
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
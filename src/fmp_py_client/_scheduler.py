@@ -0,0 +1,107 @@
+"""Bounded request concurrency with priority classes."""
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from fmp_py_client._ratelimit import endpoint_group
+from fmp_py_client._types import Priority
+
+# Priority set with ``AsyncBaseClient.priority`` for the current task.
+current_priority: ContextVar[Priority | None] = ContextVar("fmp_priority", default=None)
+
+DEFAULT_GROUP_PRIORITIES: Mapping[str, Priority] = {
+    "quotes": Priority.REALTIME,
+    "default": Priority.INTERACTIVE,
+    "bulk": Priority.BATCH,
+}
+
+
+class Scheduler:
+    """Cap on concurrent requests that serves waiters by priority.
+
+    At most ``max_concurrency`` requests are in flight at once. When all
+    slots are busy, a freed slot goes to the waiting request with the
+    highest priority, and to the longest waiting among equals, so a large
+    batch backlog only uses capacity that interactive and realtime calls
+    leave free. A request's priority is the one set with
+    ``client.priority(...)``, or else that of its endpoint group:
+    ``quotes`` are realtime, ``bulk`` is batch and everything else is
+    interactive.
+
+    Usage:
+        scheduler = Scheduler(64, groups={"default": Priority.BATCH})
+        async with AsyncFMPClient("your-api-key", scheduler=scheduler) as client:
+            with client.priority(Priority.REALTIME):
+                quote = await client.quote(symbol="AAPL")
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 64,
+        *,
+        groups: Mapping[str, Priority] | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._groups = {**DEFAULT_GROUP_PRIORITIES, **(groups or {})}
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    @property
+    def active(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests queued for a slot."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    def priority_for(self, path: str) -> Priority:
+        """Return the priority of a request to ``path`` in the current context."""
+        priority = current_priority.get()
+        if priority is not None:
+            return priority
+        return self._groups.get(endpoint_group(path), Priority.INTERACTIVE)
+
+    async def acquire(self, priority: Priority) -> None:
+        """Wait for a free slot."""
+        if self._active < self.max_concurrency:
+            # Slots are handed straight to live waiters, so any left are
+            # cancelled ones.
+            self._waiters.clear()
+            self._active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Handed a slot just as we were cancelled: pass it on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot, handing it to the next waiter if there is one."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    @asynccontextmanager
+    async def slot(self, path: str) -> AsyncIterator[None]:
+        """Hold a slot for one request to ``path``."""
+        await self.acquire(self.priority_for(path))
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,304 @@
+"""Offline symbol, company name and CIK search."""
+
+import asyncio
+import bisect
+import json
+import re
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fmp_py_client.models import CIKSearchResult, SearchResult
+
+if TYPE_CHECKING:
+    from fmp_py_client._client import AsyncFMPClient
+
+# Rows per delisted-companies page read by `SearchIndex.refresh`.
+DELISTED_PAGE_SIZE = 100
+
+# Legal-form words ignored when matching CIK filers to listed companies.
+_LEGAL_FORMS = frozenset(
+    {"inc", "incorporated", "corp", "corporation", "co", "company", "ltd",
+     "limited", "plc", "llc", "lp", "sa", "ag", "nv", "the", "holdings"}
+)  # fmt: skip
+
+
+def _tokens(text: str) -> list[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def _grams(tokens: list[str]) -> set[str]:
+    padded = f" {' '.join(tokens)} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _entity_key(name: str) -> str:
+    return " ".join(t for t in _tokens(name) if t not in _LEGAL_FORMS)
+
+
+def _cik_key(cik: str | int) -> str:
+    return str(cik).strip().zfill(10)
+
+
+def _record(entry: Mapping[str, Any]) -> SearchResult:
+    # Accepts list entries (``exchange``) and saved results (``stockExchange``).
+    record: dict[str, Any] = {
+        "symbol": entry["symbol"],
+        "name": entry.get("name") or "",
+    }
+    exchange = entry.get("exchange") or entry.get("stockExchange")
+    if exchange:
+        record["stockExchange"] = exchange
+    if entry.get("exchangeShortName"):
+        record["exchangeShortName"] = entry["exchangeShortName"]
+    return record  # type: ignore[return-value]
+
+
+async def _collect(rows: Any) -> list[Any]:
+    return [row async for row in rows]
+
+
+async def _delisted_since(client: "AsyncFMPClient", since: str) -> list[Any]:
+    # Pages are newest first: stop at the first page older than the watermark.
+    rows: list[Any] = []
+    page = 0
+    while True:
+        batch = await client.delisted_companies(page=page, limit=DELISTED_PAGE_SIZE)
+        rows.extend(batch)
+        if len(batch) < DELISTED_PAGE_SIZE or any(
+            row["delistedDate"] < since for row in batch
+        ):
+            return rows
+        page += 1
+
+
+class SearchIndex:
+    """In-memory index answering symbol, name and CIK searches locally.
+
+    `build` loads ``stock_list``, ``etf_list``,
+    ``financial_statement_symbol_list`` and ``cik_list`` once; `save` and
+    `load` persist the index as JSON, and `refresh` applies symbol changes
+    and delistings published since the last build or refresh. Lookups never
+    touch the network.
+
+    Ticker prefixes are found by bisecting a sorted symbol list. Company
+    names are matched through a trigram index and ranked by trigram
+    similarity and whole-word matches, so partial and slightly misspelled
+    names still match. CIK filers are linked to the listed company with the same name.
+
+    Usage:
+        index = await SearchIndex.build(client)
+        index.save("~/data/search.json")
+
+        index = SearchIndex.load("~/data/search.json")
+        await index.refresh(client)
+        index.search_name("alphabet")
+        index.search_cik(320193)
+    """
+
+    def __init__(
+        self,
+        symbols: Iterable[Mapping[str, Any]] = (),
+        ciks: Iterable[Mapping[str, Any]] = (),
+        *,
+        watermarks: Mapping[str, str] | None = None,
+    ) -> None:
+        self._records: dict[str, SearchResult] = {}
+        self._name_tokens: dict[str, list[str]] = {}
+        self._by_gram: dict[str, set[str]] = {}
+        self._by_entity: dict[str, str] = {}
+        self._sorted: list[str] | None = None
+        self._ciks: dict[str, CIKSearchResult] = {}
+        # Latest symbol-change and delisting dates already applied.
+        self.watermarks: dict[str, str] = dict(watermarks or {})
+        for entry in symbols:
+            if entry["symbol"] not in self._records:
+                self._add(_record(entry))
+        for entry in ciks:
+            self._ciks[_cik_key(entry["cik"])] = {
+                "cik": entry["cik"],
+                "name": entry["name"],
+            }
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._records
+
+    def _add(self, record: SearchResult) -> None:
+        symbol = record["symbol"]
+        self._records[symbol] = record
+        tokens = _tokens(record["name"])
+        self._name_tokens[symbol] = tokens
+        for gram in _grams(tokens):
+            self._by_gram.setdefault(gram, set()).add(symbol)
+        self._by_entity.setdefault(_entity_key(record["name"]), symbol)
+        self._sorted = None
+
+    def _remove(self, symbol: str) -> SearchResult | None:
+        record = self._records.pop(symbol, None)
+        if record is None:
+            return None
+        tokens = self._name_tokens.pop(symbol)
+        for gram in _grams(tokens):
+            self._by_gram[gram].discard(symbol)
+        key = _entity_key(record["name"])
+        if self._by_entity.get(key) == symbol:
+            del self._by_entity[key]
+        self._sorted = None
+        return record
+
+    def _matches_exchange(self, symbol: str, exchange: str | None) -> bool:
+        if exchange is None:
+            return True
+        return self._records[symbol].get("exchangeShortName") == exchange
+
+    def get(self, symbol: str) -> SearchResult | None:
+        """Return the entry for an exact ticker, or ``None``."""
+        return self._records.get(symbol.upper())
+
+    def search_symbol(
+        self, query: str, *, limit: int = 10, exchange: str | None = None
+    ) -> list[SearchResult]:
+        """Return tickers starting with ``query``, exact and shortest first."""
+        if self._sorted is None:
+            self._sorted = sorted(self._records)
+        prefix = query.strip().upper()
+        if not prefix:
+            return []
+        start = bisect.bisect_left(self._sorted, prefix)
+        end = bisect.bisect_left(self._sorted, prefix + "\uffff", start)
+        matches = [
+            symbol
+            for symbol in self._sorted[start:end]
+            if self._matches_exchange(symbol, exchange)
+        ]
+        matches.sort(key=lambda symbol: (len(symbol), symbol))
+        return [self._records[symbol] for symbol in matches[:limit]]
+
+    def search_name(
+        self, query: str, *, limit: int = 10, exchange: str | None = None
+    ) -> list[SearchResult]:
+        """Return companies whose names best match ``query``, best first.
+
+        Names containing every query word (or a word starting with it) rank
+        above names that only share letter sequences with the query.
+        """
+        tokens = _tokens(query)
+        if not tokens:
+            return []
+        grams = _grams(tokens)
+        shared: Counter[str] = Counter()
+        for gram in grams:
+            shared.update(self._by_gram.get(gram, ()))
+        if exchange is not None:
+            shared = Counter(
+                {s: n for s, n in shared.items() if self._matches_exchange(s, exchange)}
+            )
+        phrase = " ".join(tokens)
+        scored = []
+        # Only names sharing the most trigrams can rank near the top.
+        for symbol, count in shared.most_common(max(10 * limit, 100)):
+            name_tokens = self._name_tokens[symbol]
+            similarity = 2 * count / (len(grams) + len(_grams(name_tokens)))
+            words = all(
+                any(word.startswith(token) for word in name_tokens) for token in tokens
+            )
+            starts = " ".join(name_tokens).startswith(phrase)
+            scored.append((-(similarity + words + starts), len(symbol), symbol))
+        scored.sort()
+        return [self._records[symbol] for *_, symbol in scored[:limit]]
+
+    def search_cik(self, cik: str | int) -> list[CIKSearchResult]:
+        """Return the filer with this CIK and its ticker if it is listed."""
+        entry = self._ciks.get(_cik_key(cik))
+        if entry is None:
+            return []
+        result: CIKSearchResult = dict(entry)  # type: ignore[assignment]
+        ticker = self._by_entity.get(_entity_key(entry["name"]))
+        if ticker is not None:
+            result["ticker"] = ticker
+        return [result]
+
+    @classmethod
+    async def build(cls, client: "AsyncFMPClient") -> "SearchIndex":
+        """Build an index from the symbol and CIK lists."""
+        stocks, etfs, statements, ciks = await asyncio.gather(
+            client.stock_list(),
+            client.etf_list(),
+            client.financial_statement_symbol_list(),
+            _collect(client.iter_cik_list()),
+        )
+        index = cls([*stocks, *etfs, *statements], ciks)
+        # The lists already reflect earlier changes and delistings; only the
+        # newest dates are needed, and delistings are listed newest first.
+        changes, delisted = await asyncio.gather(
+            client.symbol_change(),
+            client.delisted_companies(page=0, limit=DELISTED_PAGE_SIZE),
+        )
+        index._advance("symbol-change", (row["date"] for row in changes))
+        index._advance("delisted", (row["delistedDate"] for row in delisted))
+        return index
+
+    def _advance(self, name: str, dates: Iterable[str]) -> None:
+        latest = max(dates, default="")
+        if latest > self.watermarks.get(name, ""):
+            self.watermarks[name] = latest
+
+    async def refresh(self, client: "AsyncFMPClient") -> dict[str, int]:
+        """Apply symbol changes and delistings newer than the last refresh.
+
+        Rows dated on the watermark day are checked again, since the day may
+        not have been complete at the last refresh. Delisting pages are read
+        newest first, only until one passes the watermark, so a refresh
+        usually costs one page. Returns how many tickers were renamed and
+        removed.
+        """
+        changes, delisted = await asyncio.gather(
+            client.symbol_change(),
+            _delisted_since(client, self.watermarks.get("delisted", "")),
+        )
+        since = self.watermarks.get("symbol-change", "")
+        renamed = 0
+        for change in sorted(changes, key=lambda row: row["date"]):
+            if change["date"] < since or (
+                # Already applied unless the old ticker is still listed.
+                change["date"] == since and change["oldSymbol"] not in self._records
+            ):
+                continue
+            record = self._remove(change["oldSymbol"]) or self._remove(
+                change["newSymbol"]
+            )
+            name = change.get("name") or (record or {}).get("name", "")
+            self._add({**(record or {}), "symbol": change["newSymbol"], "name": name})
+            renamed += 1
+        since = self.watermarks.get("delisted", "")
+        removed = 0
+        for row in delisted:
+            if row["delistedDate"] >= since and self._remove(row["symbol"]):
+                removed += 1
+        self._advance("symbol-change", (row["date"] for row in changes))
+        self._advance("delisted", (row["delistedDate"] for row in delisted))
+        return {"renamed": renamed, "delisted": removed}
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """Write the index to a JSON file, replacing it atomically."""
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "symbols": list(self._records.values()),
+            "ciks": list(self._ciks.values()),
+            "watermarks": self.watermarks,
+        }
+        partial = path.with_name(f"{path.name}.tmp")
+        partial.write_text(json.dumps(data, separators=(",", ":")))
+        partial.replace(path)
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> "SearchIndex":
+        """Read an index written by `save`."""
+        data = json.loads(Path(path).expanduser().read_text())
+        return cls(data["symbols"], data["ciks"], watermarks=data["watermarks"])
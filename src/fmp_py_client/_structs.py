@@ -0,0 +1,141 @@
+"""Compact struct types generated from the TypedDict response models."""
+
+import functools
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from types import UnionType
+from typing import Any, Union, get_args, get_origin, get_type_hints, is_typeddict
+
+from fmp_py_client._json import JSONDecoder
+
+
+class SlotsStruct:
+    """Base for ``__slots__`` structs used when msgspec is not installed.
+
+    Fields the API omits are ``None``; keys not defined on the model are
+    dropped, matching msgspec's behavior.
+    """
+
+    __slots__ = ()
+    __struct_fields__: tuple[str, ...] = ()
+
+    def __init__(self, **values: Any) -> None:
+        for name in self.__struct_fields__:
+            setattr(self, name, values.get(name))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__struct_fields__
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__struct_fields__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _fields(model: type) -> dict[str, Any]:
+    if not is_typeddict(model):
+        raise TypeError(f"{model!r} is not a TypedDict response model")
+    return get_type_hints(model)
+
+
+def _loose(tp: Any) -> Any:
+    # The API sends fractional values in int fields, e.g. crypto volumes.
+    if tp is int or (get_origin(tp) in (Union, UnionType) and int in get_args(tp)):
+        return tp | float
+    return tp
+
+
+@functools.cache
+def struct_type(model: type) -> type:
+    """Return the struct class for a TypedDict model, with identical field names.
+
+    Uses a ``msgspec.Struct`` when msgspec is installed and a ``__slots__``
+    class otherwise. Every field defaults to ``None``; ``int`` fields also
+    accept floats, which the API sends for e.g. crypto volumes.
+    """
+    fields = _fields(model)
+    try:
+        import msgspec
+    except ImportError:
+        return type(
+            model.__name__,
+            (SlotsStruct,),
+            {
+                "__slots__": tuple(fields),
+                "__struct_fields__": tuple(fields),
+                "__module__": model.__module__,
+                "__doc__": model.__doc__,
+            },
+        )
+    return msgspec.defstruct(
+        model.__name__,
+        [(name, _loose(tp) | None, None) for name, tp in fields.items()],
+        module=model.__module__,
+        kw_only=True,
+    )
+
+
+def to_structs(rows: Iterable[Mapping[str, Any]], model: type) -> list[Any]:
+    """Convert decoded rows into structs of ``model``."""
+    cls = struct_type(model)
+    names = _fields(model).keys()
+    return [cls(**{k: row[k] for k in names if k in row}) for row in rows]
+
+
+def struct_decoder(model: type, fallback: JSONDecoder) -> JSONDecoder:
+    """Return a decoder from a JSON array body straight to structs of ``model``."""
+    cls = struct_type(model)
+    try:
+        import msgspec
+    except ImportError:
+        return lambda body: to_structs(fallback(body), model)
+    # Lax mode tolerates the API's loose typing, e.g. integral floats.
+    decoder = msgspec.json.Decoder(list[cls], strict=False)  # type: ignore[valid-type]
+
+    def decode(body: bytes) -> list[Any]:
+        try:
+            return decoder.decode(body)
+        except msgspec.ValidationError:
+            # Values of an unexpected type are kept as sent, as with dicts.
+            return to_structs(fallback(body), model)
+
+    return decode
+
+
+def composite[F: Callable[..., Any]](method: F) -> F:
+    """Mark a method whose rows are merged from several requests.
+
+    `fetch_structs` and `fetch_columns` cannot decode such a method's
+    responses directly, so they convert its merged rows afterwards.
+    """
+    method.__fmp_composite__ = True  # type: ignore[attr-defined]
+    return method
+
+
+def is_composite(method: Callable[..., Any]) -> bool:
+    """Return whether ``method`` was marked with `composite`."""
+    return getattr(method, "__fmp_composite__", False)
+
+
+def row_model(method: Callable[..., Any]) -> type:
+    """Return the TypedDict row model of a method returning ``list[Model]``.
+
+    Methods returning ``AsyncIterator[Model]`` are accepted as well.
+    """
+    returns = get_type_hints(method).get("return")
+    args = get_args(returns)
+    if (
+        get_origin(returns) not in (list, AsyncIterator)
+        or len(args) != 1
+        or not is_typeddict(args[0])
+    ):
+        name = getattr(method, "__name__", repr(method))
+        raise TypeError(f"{name} does not return a list of response models")
+    return args[0]
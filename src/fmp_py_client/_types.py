@@ -1,7 +1,9 @@
 """Type aliases and enumerations for the FMP client."""
 
-from enum import StrEnum
-from typing import Any
+from enum import IntEnum, StrEnum
+from typing import Any, NamedTuple
+
+from fmp_py_client._exceptions import FMPError
 
 type JSONObject = dict[str, Any]
 type JSONArray = list[JSONObject]
@@ -24,3 +26,44 @@ class Timeframe(StrEnum):
     ONE_HOUR = "1hour"
     FOUR_HOUR = "4hour"
     ONE_DAY = "1day"
+
+
+class Priority(IntEnum):
+    """Request priority class; lower values are served first."""
+
+    REALTIME = 0
+    INTERACTIVE = 1
+    BATCH = 2
+
+
+class BatchResult[T](NamedTuple):
+    """Rows merged from a chunked batch request.
+
+    ``items`` follows the order of the requested symbols and ``missing``
+    lists requested symbols the API returned no row for.
+    """
+
+    items: list[T]
+    missing: list[str]
+
+
+class SymbolResult[T](NamedTuple):
+    """Outcome of one symbol's request in `AsyncFMPClient.map`.
+
+    Exactly one of ``value`` and ``error`` is set.
+    """
+
+    symbol: str
+    value: T | None
+    error: FMPError | None
+
+
+class MapResult[T](NamedTuple):
+    """Results of `AsyncFMPClient.map_all` keyed by symbol.
+
+    ``results`` follows the order of the requested symbols; ``errors`` holds
+    the symbols whose request failed.
+    """
+
+    results: dict[str, T]
+    errors: dict[str, FMPError]
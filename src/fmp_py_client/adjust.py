@@ -0,0 +1,237 @@
+"""Split and dividend adjustment of end-of-day prices with NumPy.
+
+Adjusted views are derived from the raw series returned by
+``historical_price_eod_non_split_adjusted`` and the ``splits`` and
+``dividends`` history, so only one price series has to be downloaded.
+
+Usage:
+    raw = await client.historical_price_eod_non_split_adjusted("AAPL")
+    adjuster = Adjuster(
+        raw,
+        splits=await client.splits(symbol="AAPL"),
+        dividends=await client.dividends(symbol="AAPL"),
+    )
+    split_adjusted = adjuster.split_adjusted()
+    total_return = adjuster.dividend_adjusted()
+
+    # Later: apply a newly announced action without refetching history
+    adjuster.add_actions(dividends=[new_dividend])
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from fmp_py_client.models import Dividend, EODFull, StockSplit
+
+PRICE_FIELDS = ("open", "high", "low", "close")
+
+
+def _dates(values: Iterable[str]) -> np.ndarray:
+    return np.array(list(values), dtype="datetime64[D]")
+
+
+def _apply(
+    dates: np.ndarray, action_dates: np.ndarray, ratios: np.ndarray
+) -> np.ndarray:
+    # Each action scales every bar before its date: multiply the ratio in at
+    # the action's position and take the product of everything after each bar.
+    marks = np.ones(len(dates) + 1)
+    np.multiply.at(marks, np.searchsorted(dates, action_dates), ratios)
+    return np.cumprod(marks[::-1])[::-1][1:]
+
+
+def _split_ratio(split: Mapping[str, Any]) -> float:
+    return split["denominator"] / split["numerator"]
+
+
+def _dividend_ratio(close: np.ndarray, position: int, amount: float) -> float:
+    # Ratio from the close on the last bar before the ex-date; 1 if none.
+    if position == 0 or not amount:
+        return 1.0
+    return 1.0 - amount / close[position - 1]
+
+
+def split_factors(dates: np.ndarray, splits: Sequence[Mapping[str, Any]]) -> np.ndarray:
+    """Return the factor converting each raw price to its split-adjusted value.
+
+    ``dates`` are bar dates in chronological order. Volumes are adjusted by
+    dividing by the factor.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    ratios = np.array([_split_ratio(split) for split in splits], dtype=np.float64)
+    return _apply(dates, _dates(split["date"] for split in splits), ratios)
+
+
+def dividend_factors(
+    dates: np.ndarray, close: np.ndarray, dividends: Sequence[Mapping[str, Any]]
+) -> np.ndarray:
+    """Return the dividend factor of each bar from raw closes.
+
+    Each dividend scales earlier prices by ``1 - dividend / close``, using
+    the raw close on the last bar before the ex-date and the raw
+    ``dividend`` amount.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    close = np.asarray(close, dtype=np.float64)
+    action_dates = _dates(dividend["date"] for dividend in dividends)
+    positions = np.searchsorted(dates, action_dates)
+    ratios = np.array(
+        [
+            _dividend_ratio(close, int(position), dividend.get("dividend") or 0.0)
+            for position, dividend in zip(positions, dividends, strict=True)
+        ],
+        dtype=np.float64,
+    )
+    return _apply(dates, action_dates, ratios)
+
+
+class Adjuster:
+    """Split- and dividend-adjusted views of one symbol's raw price history.
+
+    Factors are computed once for the whole history. New bars and new
+    corporate actions only update the bars they affect, so adjusted history
+    can be re-derived without downloading it again. Actions dated after the
+    last bar are held until a bar on or after their date is added.
+    """
+
+    def __init__(
+        self,
+        bars: Sequence[Mapping[str, Any]],
+        *,
+        splits: Sequence[StockSplit] = (),
+        dividends: Sequence[Dividend] = (),
+    ) -> None:
+        self._actions: list[tuple[str, Mapping[str, Any]]] = []
+        self._pending: list[tuple[str, Mapping[str, Any]]] = []
+        self._seen: set[tuple[str, str]] = set()
+        self._load(bars)
+        self.add_actions(splits=splits, dividends=dividends)
+
+    def _load(self, bars: Sequence[Mapping[str, Any]]) -> None:
+        ordered = sorted(bars, key=lambda bar: bar["date"])
+        self._symbol = ordered[-1].get("symbol") if ordered else None
+        self._dates = _dates(bar["date"] for bar in ordered)
+        self._prices = {
+            field: np.array([bar[field] for bar in ordered], dtype=np.float64)
+            for field in PRICE_FIELDS
+        }
+        self._volume = np.array(
+            [bar.get("volume") or 0 for bar in ordered], dtype=np.float64
+        )
+        self.split_factor = np.ones(len(ordered))
+        self.dividend_factor = np.ones(len(ordered))
+
+    def _recompute(self) -> None:
+        splits = [action for kind, action in self._actions if kind == "split"]
+        dividends = [action for kind, action in self._actions if kind == "dividend"]
+        self.split_factor = split_factors(self._dates, splits)
+        self.dividend_factor = dividend_factors(
+            self._dates, self._prices["close"], dividends
+        )
+
+    def add_actions(
+        self,
+        *,
+        splits: Iterable[StockSplit] = (),
+        dividends: Iterable[Dividend] = (),
+    ) -> int:
+        """Apply new splits and dividends and return how many were new.
+
+        Actions already applied (same kind and date) are ignored, so the full
+        ``splits`` and ``dividends`` history can be passed on every refresh.
+        """
+        added = 0
+        for kind, actions in (("split", splits), ("dividend", dividends)):
+            for action in actions:
+                key = (kind, action["date"])
+                if key in self._seen:
+                    continue
+                self._seen.add(key)
+                self._pending.append((kind, action))
+                added += 1
+        self._apply_pending()
+        return added
+
+    def _apply_pending(self) -> None:
+        if not len(self._dates):
+            return
+        last = str(self._dates[-1])
+        ready = [item for item in self._pending if item[1]["date"] <= last]
+        self._pending = [item for item in self._pending if item[1]["date"] > last]
+        for kind, action in sorted(ready, key=lambda item: item[1]["date"]):
+            self._actions.append((kind, action))
+            position = int(np.searchsorted(self._dates, np.datetime64(action["date"])))
+            if kind == "split":
+                self.split_factor[:position] *= _split_ratio(action)
+            else:
+                amount = action.get("dividend") or 0.0
+                ratio = _dividend_ratio(self._prices["close"], position, amount)
+                self.dividend_factor[:position] *= ratio
+
+    def extend(self, bars: Sequence[Mapping[str, Any]]) -> None:
+        """Add raw bars, such as the latest day from an incremental update.
+
+        Bars newer than the last one are appended with unit factors. Bars
+        that overlap the existing history replace it and all factors are
+        recomputed.
+        """
+        if not bars:
+            return
+        last = str(self._dates[-1]) if len(self._dates) else ""
+        if all(bar["date"] > last for bar in bars):
+            new = sorted(bars, key=lambda bar: bar["date"])
+            self._dates = np.concatenate(
+                (self._dates, _dates(bar["date"] for bar in new))
+            )
+            for field in PRICE_FIELDS:
+                values = np.array([bar[field] for bar in new], dtype=np.float64)
+                self._prices[field] = np.concatenate((self._prices[field], values))
+            volume = np.array([bar.get("volume") or 0 for bar in new], np.float64)
+            self._volume = np.concatenate((self._volume, volume))
+            self.split_factor = np.concatenate((self.split_factor, np.ones(len(new))))
+            self.dividend_factor = np.concatenate(
+                (self.dividend_factor, np.ones(len(new)))
+            )
+            self._symbol = self._symbol or new[-1].get("symbol")
+        else:
+            merged = {bar["date"]: bar for bar in self._rows(1.0, 1.0)}
+            merged.update((bar["date"], bar) for bar in bars)
+            self._load(list(merged.values()))
+            self._recompute()
+        self._apply_pending()
+
+    def _rows(self, price_factor: Any, volume_factor: Any) -> list[EODFull]:
+        price_factor = np.broadcast_to(price_factor, self._dates.shape)
+        volume = np.rint(self._volume / volume_factor).astype(np.int64)
+        prices = {field: self._prices[field] * price_factor for field in PRICE_FIELDS}
+        rows: list[EODFull] = []
+        for i in range(len(self._dates) - 1, -1, -1):
+            row: dict[str, Any] = {"symbol": self._symbol, "date": str(self._dates[i])}
+            for field in PRICE_FIELDS:
+                row[field] = prices[field][i].item()
+            row["volume"] = int(volume[i])
+            rows.append(row)  # type: ignore[arg-type]
+        return rows
+
+    def raw(self) -> list[EODFull]:
+        """Return the raw bars, newest first."""
+        return self._rows(1.0, 1.0)
+
+    def split_adjusted(self) -> list[EODFull]:
+        """Return split-adjusted bars, newest first.
+
+        Prices are scaled by the split factor and volumes by its inverse,
+        like ``historical_price_eod_full``.
+        """
+        return self._rows(self.split_factor, self.split_factor)
+
+    def dividend_adjusted(self) -> list[EODFull]:
+        """Return split- and dividend-adjusted bars, newest first.
+
+        Like ``historical_price_eod_dividend_adjusted``, earlier prices are
+        reduced by each dividend so returns include reinvested dividends.
+        Volumes are split-adjusted.
+        """
+        return self._rows(self.split_factor * self.dividend_factor, self.split_factor)
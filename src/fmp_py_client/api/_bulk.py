@@ -1,5 +1,13 @@
 """Bulk data API endpoints."""
 
+import asyncio
+import os
+import shutil
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import Any
+
+from fmp_py_client._pagination import fetch_parts
 from fmp_py_client.models import (
     CompanyProfile,
     DCFValuation,
@@ -16,6 +24,76 @@ from fmp_py_client.models import (
 )
 
 
+async def _iter_all_parts[T](
+    stream_part: Callable[..., AsyncIterator[T]],
+    concurrency: int,
+) -> AsyncIterator[T]:
+    # Parts are buffered whole so they can be yielded in order.
+    async def load(part: int) -> list[T]:
+        return [row async for row in stream_part(part=part)]
+
+    async for rows in fetch_parts(
+        load, is_empty=lambda rows: not rows, concurrency=concurrency
+    ):
+        for row in rows:
+            yield row
+
+
+def _append_part(source: Path, out: Any, keep_header: bool) -> None:
+    with source.open("rb") as f:
+        if not keep_header:
+            f.readline()
+        shutil.copyfileobj(f, out)
+
+
+async def _download_parts(
+    client: Any,
+    endpoint: str,
+    path: str | os.PathLike[str],
+    concurrency: int,
+) -> int:
+    dest = Path(path).expanduser()
+    dest.parent.mkdir(parents=True, exist_ok=True)
+
+    async def load(part: int) -> Path | None:
+        part_path = dest.with_name(f"{dest.name}.part{part}")
+        header_done = has_rows = False
+        try:
+            with part_path.open("wb") as f:
+                async for chunk in client._stream_body(endpoint, {"part": part}):
+                    if not has_rows:
+                        data = chunk
+                        if not header_done:
+                            _, newline, data = chunk.partition(b"\n")
+                            header_done = bool(newline)
+                        has_rows = bool(data.strip())
+                    await asyncio.to_thread(f.write, chunk)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        if not has_rows:
+            part_path.unlink()
+            return None
+        return part_path
+
+    parts = 0
+    partial = dest.with_name(f"{dest.name}.tmp")
+    try:
+        with partial.open("wb") as out:
+            async for part_path in fetch_parts(
+                load, is_empty=lambda p: p is None, concurrency=concurrency
+            ):
+                assert part_path is not None
+                await asyncio.to_thread(_append_part, part_path, out, parts == 0)
+                part_path.unlink()
+                parts += 1
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    partial.replace(dest)
+    return parts
+
+
 class BulkMixin:
     """Bulk data download endpoints."""
 
@@ -30,22 +108,88 @@ class BulkMixin:
             params={"part": part},
         )
 
+    def iter_profile_bulk(
+        self,
+        *,
+        part: int | None = None,
+    ) -> AsyncIterator[CompanyProfile]:
+        """Stream bulk company profiles row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "profile-bulk",
+            CompanyProfile,
+            params={"part": part},
+        )
+
+    def iter_profile_bulk_all(
+        self,
+        *,
+        concurrency: int = 4,
+    ) -> AsyncIterator[CompanyProfile]:
+        """Stream every part of the bulk company profiles, fetching parts in parallel.
+
+        Parts are yielded in order; the part count is discovered by stopping
+        at the first empty part. Each part is read fully before its rows are
+        yielded, so up to ``concurrency`` parts are held in memory at once;
+        lower it, or use `download_profile_bulk` for large pulls.
+        """
+        return _iter_all_parts(self.iter_profile_bulk, concurrency)
+
+    async def download_profile_bulk(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        concurrency: int = 4,
+    ) -> int:
+        """Download every part of the bulk company profiles into one CSV file.
+
+        Returns the number of parts written.
+        """
+        return await _download_parts(self, "profile-bulk", path, concurrency)
+
     async def rating_bulk(self) -> list[RatingSnapshot]:
         """Get bulk ratings."""
         return await self._request("rating-bulk")  # type: ignore[attr-defined]
 
+    def iter_rating_bulk(self) -> AsyncIterator[RatingSnapshot]:
+        """Stream bulk ratings row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "rating-bulk",
+            RatingSnapshot,
+        )
+
     async def dcf_bulk(self) -> list[DCFValuation]:
         """Get bulk DCF valuations."""
         return await self._request("dcf-bulk")  # type: ignore[attr-defined]
 
+    def iter_dcf_bulk(self) -> AsyncIterator[DCFValuation]:
+        """Stream bulk DCF valuations row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "dcf-bulk",
+            DCFValuation,
+        )
+
     async def scores_bulk(self) -> list[FinancialScores]:
         """Get bulk financial scores."""
         return await self._request("scores-bulk")  # type: ignore[attr-defined]
 
+    def iter_scores_bulk(self) -> AsyncIterator[FinancialScores]:
+        """Stream bulk financial scores row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "scores-bulk",
+            FinancialScores,
+        )
+
     async def price_target_summary_bulk(self) -> list[PriceTargetSummary]:
         """Get bulk price target summaries."""
         return await self._request("price-target-summary-bulk")  # type: ignore[attr-defined]
 
+    def iter_price_target_summary_bulk(self) -> AsyncIterator[PriceTargetSummary]:
+        """Stream bulk price target summaries row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "price-target-summary-bulk",
+            PriceTargetSummary,
+        )
+
     async def etf_holder_bulk(
         self,
         *,
@@ -57,22 +201,88 @@ class BulkMixin:
             params={"part": part},
         )
 
+    def iter_etf_holder_bulk(
+        self,
+        *,
+        part: int | None = None,
+    ) -> AsyncIterator[ETFHolding]:
+        """Stream bulk ETF holder data row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "etf-holder-bulk",
+            ETFHolding,
+            params={"part": part},
+        )
+
+    def iter_etf_holder_bulk_all(
+        self,
+        *,
+        concurrency: int = 4,
+    ) -> AsyncIterator[ETFHolding]:
+        """Stream every part of the bulk ETF holder data, fetching parts in parallel.
+
+        Parts are yielded in order; the part count is discovered by stopping
+        at the first empty part. Each part is read fully before its rows are
+        yielded, so up to ``concurrency`` parts are held in memory at once;
+        lower it, or use `download_etf_holder_bulk` for large pulls.
+        """
+        return _iter_all_parts(self.iter_etf_holder_bulk, concurrency)
+
+    async def download_etf_holder_bulk(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        concurrency: int = 4,
+    ) -> int:
+        """Download every part of the bulk ETF holder data into one CSV file.
+
+        Returns the number of parts written.
+        """
+        return await _download_parts(self, "etf-holder-bulk", path, concurrency)
+
     async def upgrades_downgrades_consensus_bulk(self) -> list[GradesConsensus]:
         """Get bulk upgrades/downgrades consensus."""
         return await self._request("upgrades-downgrades-consensus-bulk")  # type: ignore[attr-defined]
 
+    def iter_upgrades_downgrades_consensus_bulk(self) -> AsyncIterator[GradesConsensus]:
+        """Stream bulk upgrades/downgrades consensus row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "upgrades-downgrades-consensus-bulk",
+            GradesConsensus,
+        )
+
     async def key_metrics_ttm_bulk(self) -> list[KeyMetrics]:
         """Get bulk TTM key metrics."""
         return await self._request("key-metrics-ttm-bulk")  # type: ignore[attr-defined]
 
+    def iter_key_metrics_ttm_bulk(self) -> AsyncIterator[KeyMetrics]:
+        """Stream bulk TTM key metrics row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "key-metrics-ttm-bulk",
+            KeyMetrics,
+        )
+
     async def ratios_ttm_bulk(self) -> list[FinancialRatios]:
         """Get bulk TTM ratios."""
         return await self._request("ratios-ttm-bulk")  # type: ignore[attr-defined]
 
+    def iter_ratios_ttm_bulk(self) -> AsyncIterator[FinancialRatios]:
+        """Stream bulk TTM ratios row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "ratios-ttm-bulk",
+            FinancialRatios,
+        )
+
     async def peers_bulk(self) -> list[StockPeer]:
         """Get bulk peer comparisons."""
         return await self._request("peers-bulk")  # type: ignore[attr-defined]
 
+    def iter_peers_bulk(self) -> AsyncIterator[StockPeer]:
+        """Stream bulk peer comparisons row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "peers-bulk",
+            StockPeer,
+        )
+
     async def earnings_surprises_bulk(
         self,
         *,
@@ -84,9 +294,33 @@ class BulkMixin:
             params={"year": year},
         )
 
+    def iter_earnings_surprises_bulk(
+        self,
+        *,
+        year: int | None = None,
+    ) -> AsyncIterator[EarningsReport]:
+        """Stream bulk earnings surprises row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "earnings-surprises-bulk",
+            EarningsReport,
+            params={"year": year},
+        )
+
     async def eod_bulk(self, *, date: str | None = None) -> list[EODFull]:
         """Get bulk end-of-day data for a specific date (YYYY-MM-DD)."""
         return await self._request(  # type: ignore[attr-defined]
             "eod-bulk",
             params={"date": date},
         )
+
+    def iter_eod_bulk(
+        self,
+        *,
+        date: str | None = None,
+    ) -> AsyncIterator[EODFull]:
+        """Stream bulk end-of-day data for a specific date (YYYY-MM-DD) row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "eod-bulk",
+            EODFull,
+            params={"date": date},
+        )
@@ -1,5 +1,8 @@
 """Company profile and data API endpoints."""
 
+from collections.abc import AsyncIterator
+
+from fmp_py_client._pagination import paginate
 from fmp_py_client.models import (
     CompanyNote,
     CompanyProfile,
@@ -170,6 +173,21 @@ class CompanyMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_shares_float_all(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[ShareFloat]:
+        """Iterate over shares float data for all companies across all pages."""
+        return paginate(
+            self.shares_float_all,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def executive_compensation_benchmark(self) -> list[CompensationBenchmark]:
         """Get executive compensation benchmark."""
         return await self._request("executive-compensation-benchmark")  # type: ignore[attr-defined]
@@ -1,5 +1,8 @@
 """Crowdfunding and fundraising API endpoints."""
 
+from collections.abc import AsyncIterator
+
+from fmp_py_client._pagination import paginate
 from fmp_py_client.models import CrowdfundingOffering, EquityOffering, IPOProspectus
 
 
@@ -18,6 +21,21 @@ class CrowdfundingMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_crowdfunding_offerings_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[CrowdfundingOffering]:
+        """Iterate over latest crowdfunding offerings across all pages."""
+        return paginate(
+            self.crowdfunding_offerings_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def crowdfunding_offerings_search(
         self,
         *,
@@ -52,6 +70,21 @@ class CrowdfundingMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_fundraising_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[EquityOffering]:
+        """Iterate over latest fundraising data across all pages."""
+        return paginate(
+            self.fundraising_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def fundraising_search(
         self, *, name: str | None = None
     ) -> list[EquityOffering]:
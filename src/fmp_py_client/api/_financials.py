@@ -1,7 +1,9 @@
 """Financial statements API endpoints."""
 
+from collections.abc import AsyncIterator
 from typing import Any
 
+from fmp_py_client._pagination import paginate
 from fmp_py_client._types import JSONObject, Period
 from fmp_py_client.models import (
     BalanceSheetStatement,
@@ -99,6 +101,23 @@ class FinancialsMixin:
             params={"symbol": symbol, "page": page, "limit": limit},
         )
 
+    def iter_latest_financial_statements(
+        self,
+        *,
+        symbol: str | None = None,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[LatestFinancialStatement]:
+        """Iterate over latest financial statements across all pages."""
+        return paginate(
+            self.latest_financial_statements,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+            symbol=symbol,
+        )
+
     async def income_statement_growth(
         self,
         *,
@@ -249,6 +268,19 @@ class FinancialsMixin:
             params={"year": year, "period": period},
         )
 
+    def iter_income_statement_bulk(
+        self,
+        *,
+        year: int | None = None,
+        period: Period | None = None,
+    ) -> AsyncIterator[IncomeStatement]:
+        """Stream bulk income statements row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "income-statement-bulk",
+            IncomeStatement,
+            params={"year": year, "period": period},
+        )
+
     async def balance_sheet_statement_bulk(
         self,
         *,
@@ -261,6 +293,19 @@ class FinancialsMixin:
             params={"year": year, "period": period},
         )
 
+    def iter_balance_sheet_statement_bulk(
+        self,
+        *,
+        year: int | None = None,
+        period: Period | None = None,
+    ) -> AsyncIterator[BalanceSheetStatement]:
+        """Stream bulk balance sheet statements row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "balance-sheet-statement-bulk",
+            BalanceSheetStatement,
+            params={"year": year, "period": period},
+        )
+
     async def cash_flow_statement_bulk(
         self,
         *,
@@ -273,6 +318,19 @@ class FinancialsMixin:
             params={"year": year, "period": period},
         )
 
+    def iter_cash_flow_statement_bulk(
+        self,
+        *,
+        year: int | None = None,
+        period: Period | None = None,
+    ) -> AsyncIterator[CashFlowStatement]:
+        """Stream bulk cash flow statements row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "cash-flow-statement-bulk",
+            CashFlowStatement,
+            params={"year": year, "period": period},
+        )
+
     async def financial_reports_xlsx(
         self,
         *,
@@ -296,6 +354,19 @@ class FinancialsMixin:
             params={"year": year, "period": period},
         )
 
+    def iter_income_statement_growth_bulk(
+        self,
+        *,
+        year: int | None = None,
+        period: Period | None = None,
+    ) -> AsyncIterator[IncomeStatementGrowth]:
+        """Stream bulk income statement growth data row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "income-statement-growth-bulk",
+            IncomeStatementGrowth,
+            params={"year": year, "period": period},
+        )
+
     async def balance_sheet_statement_growth_bulk(
         self,
         *,
@@ -308,6 +379,19 @@ class FinancialsMixin:
             params={"year": year, "period": period},
         )
 
+    def iter_balance_sheet_statement_growth_bulk(
+        self,
+        *,
+        year: int | None = None,
+        period: Period | None = None,
+    ) -> AsyncIterator[BalanceSheetStatementGrowth]:
+        """Stream bulk balance sheet statement growth data row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "balance-sheet-statement-growth-bulk",
+            BalanceSheetStatementGrowth,
+            params={"year": year, "period": period},
+        )
+
     async def cash_flow_statement_growth_bulk(
         self,
         *,
@@ -319,3 +403,16 @@ class FinancialsMixin:
             "cash-flow-statement-growth-bulk",
             params={"year": year, "period": period},
         )
+
+    def iter_cash_flow_statement_growth_bulk(
+        self,
+        *,
+        year: int | None = None,
+        period: Period | None = None,
+    ) -> AsyncIterator[CashFlowStatementGrowth]:
+        """Stream bulk cash flow statement growth data row by row from the CSV file."""
+        return self._stream_csv(  # type: ignore[attr-defined]
+            "cash-flow-statement-growth-bulk",
+            CashFlowStatementGrowth,
+            params={"year": year, "period": period},
+        )
@@ -1,5 +1,8 @@
 """Government trading API endpoints."""
 
+from collections.abc import AsyncIterator
+
+from fmp_py_client._pagination import paginate
 from fmp_py_client.models import GovernmentTrade
 
 
@@ -18,6 +21,21 @@ class GovernmentMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_senate_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[GovernmentTrade]:
+        """Iterate over latest Senate trading activity across all pages."""
+        return paginate(
+            self.senate_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def house_latest(
         self,
         *,
@@ -30,6 +48,21 @@ class GovernmentMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_house_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[GovernmentTrade]:
+        """Iterate over latest House trading activity across all pages."""
+        return paginate(
+            self.house_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def senate_trades(
         self, *, symbol: str | None = None
     ) -> list[GovernmentTrade]:
@@ -1,7 +1,49 @@
 """Historical price API endpoints."""
 
+from collections.abc import Iterable
+from datetime import date, timedelta
+from typing import Any
+
+from fmp_py_client._concurrency import gather_limited
+from fmp_py_client._structs import composite
+from fmp_py_client._types import Timeframe
 from fmp_py_client.models import EODFull, EODLight, HistoricalChart
 
+# Calendar days per request, sized to stay under the server's row cap.
+EOD_WINDOW_DAYS = 5 * 365
+CHART_WINDOW_DAYS: dict[Timeframe, int] = {
+    Timeframe.ONE_MIN: 3,
+    Timeframe.FIVE_MIN: 10,
+    Timeframe.FIFTEEN_MIN: 30,
+    Timeframe.THIRTY_MIN: 60,
+    Timeframe.ONE_HOUR: 90,
+    Timeframe.FOUR_HOUR: 365,
+}
+
+
+def _date_windows(from_date: str, to_date: str, days: int) -> list[tuple[str, str]]:
+    if days < 1:
+        raise ValueError("window_days must be at least 1")
+    start = date.fromisoformat(from_date)
+    end = date.fromisoformat(to_date)
+    if start > end:
+        raise ValueError("from_date must not be after to_date")
+    windows = []
+    while start <= end:
+        stop = min(start + timedelta(days=days - 1), end)
+        windows.append((start.isoformat(), stop.isoformat()))
+        start = stop + timedelta(days=1)
+    return windows
+
+
+def _merge_bars(pages: Iterable[list[Any]]) -> list[Any]:
+    """Merge windowed pages newest first, keeping one bar per timestamp."""
+    bars: dict[str, Any] = {}
+    for page in pages:
+        for bar in page:
+            bars.setdefault(bar["date"], bar)
+    return [bars[key] for key in sorted(bars, reverse=True)]
+
 
 class HistoricalMixin:
     """Historical price data endpoints."""
@@ -135,3 +177,66 @@ class HistoricalMixin:
             "historical-chart/4hour",
             params={"symbol": symbol, "from": from_date, "to": to_date},
         )
+
+    @composite
+    async def historical_price_eod_range(
+        self,
+        symbol: str,
+        *,
+        from_date: str,
+        to_date: str,
+        window_days: int = EOD_WINDOW_DAYS,
+        concurrency: int = 8,
+    ) -> list[EODFull]:
+        """Get full end-of-day prices for a long date range.
+
+        The range is split into windows fetched concurrently and merged into
+        one series, newest first, with duplicate boundary bars removed.
+        """
+        windows = _date_windows(from_date, to_date, window_days)
+        pages = await gather_limited(
+            (
+                self.historical_price_eod_full(symbol, from_date=start, to_date=end)
+                for start, end in windows
+            ),
+            concurrency,
+        )
+        return _merge_bars(pages)
+
+    @composite
+    async def historical_chart_range(
+        self,
+        symbol: str,
+        timeframe: Timeframe | str,
+        *,
+        from_date: str,
+        to_date: str,
+        window_days: int | None = None,
+        concurrency: int = 8,
+    ) -> list[HistoricalChart]:
+        """Get intraday chart data for a long date range.
+
+        The range is split into windows sized for ``timeframe`` (override with
+        ``window_days``), fetched concurrently and merged into one series,
+        newest first, with duplicate boundary bars removed.
+        """
+        timeframe = Timeframe(timeframe)
+        if timeframe not in CHART_WINDOW_DAYS:
+            raise ValueError(
+                f"No intraday chart for {timeframe}; "
+                "use historical_price_eod_range for daily bars"
+            )
+        windows = _date_windows(
+            from_date, to_date, window_days or CHART_WINDOW_DAYS[timeframe]
+        )
+        pages = await gather_limited(
+            (
+                self._request(  # type: ignore[attr-defined]
+                    f"historical-chart/{timeframe}",
+                    params={"symbol": symbol, "from": start, "to": end},
+                )
+                for start, end in windows
+            ),
+            concurrency,
+        )
+        return _merge_bars(pages)
@@ -1,5 +1,8 @@
 """Insider and institutional trading API endpoints."""
 
+from collections.abc import AsyncIterator
+
+from fmp_py_client._pagination import paginate
 from fmp_py_client.models import (
     AcquisitionOwnership,
     IndustryOwnershipSummary,
@@ -28,6 +31,21 @@ class InsiderMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_insider_trading_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[InsiderTrade]:
+        """Iterate over latest insider trades across all pages."""
+        return paginate(
+            self.insider_trading_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def insider_trading_search(
         self,
         *,
@@ -40,6 +58,21 @@ class InsiderMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_insider_trading_search(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[InsiderTrade]:
+        """Iterate over insider trades across all pages."""
+        return paginate(
+            self.insider_trading_search,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def insider_trading_reporting_name(
         self,
         *,
@@ -87,6 +120,21 @@ class InsiderMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_institutional_ownership_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[InstitutionalOwnership]:
+        """Iterate over latest institutional ownership across all pages."""
+        return paginate(
+            self.institutional_ownership_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def institutional_ownership_extract(
         self,
         *,
@@ -132,6 +180,27 @@ class InsiderMixin:
             },
         )
 
+    def iter_institutional_ownership_holder_analytics(
+        self,
+        *,
+        symbol: str | None = None,
+        year: int | None = None,
+        quarter: int | None = None,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[InstitutionalHolderAnalytics]:
+        """Iterate over institutional holder analytics across all pages."""
+        return paginate(
+            self.institutional_ownership_holder_analytics,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+            symbol=symbol,
+            year=year,
+            quarter=quarter,
+        )
+
     async def institutional_ownership_holder_performance_summary(
         self,
         *,
@@ -144,6 +213,21 @@ class InsiderMixin:
             params={"cik": cik, "page": page},
         )
 
+    def iter_institutional_ownership_holder_performance_summary(
+        self,
+        *,
+        cik: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[InstitutionalHolderAnalytics]:
+        """Iterate over institutional holder performance summaries across all pages."""
+        return paginate(
+            self.institutional_ownership_holder_performance_summary,
+            start_page=start_page,
+            prefetch=prefetch,
+            cik=cik,
+        )
+
     async def institutional_ownership_holder_industry_breakdown(
         self,
         *,
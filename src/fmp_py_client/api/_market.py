@@ -1,5 +1,8 @@
 """Market info and lists API endpoints."""
 
+from collections.abc import AsyncIterator
+
+from fmp_py_client._pagination import paginate
 from fmp_py_client.models import (
     CIKEntry,
     DelistedCompany,
@@ -34,6 +37,21 @@ class MarketMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_cik_list(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[CIKEntry]:
+        """Iterate over CIK numbers across all pages."""
+        return paginate(
+            self.cik_list,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def symbol_change(self) -> list[SymbolChange]:
         """Get list of symbol changes."""
         return await self._request("symbol-change")  # type: ignore[attr-defined]
@@ -58,6 +76,21 @@ class MarketMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_delisted_companies(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[DelistedCompany]:
+        """Iterate over delisted companies across all pages."""
+        return paginate(
+            self.delisted_companies,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def available_exchanges(self) -> list[str]:
         """Get list of available exchanges."""
         return await self._request("available-exchanges")  # type: ignore[attr-defined]
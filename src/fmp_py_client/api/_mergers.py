@@ -1,5 +1,8 @@
 """Mergers and acquisitions API endpoints."""
 
+from collections.abc import AsyncIterator
+
+from fmp_py_client._pagination import paginate
 from fmp_py_client.models import MergerAcquisition
 
 
@@ -18,6 +21,21 @@ class MergersMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_mergers_acquisitions_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[MergerAcquisition]:
+        """Iterate over latest M&A activity across all pages."""
+        return paginate(
+            self.mergers_acquisitions_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def mergers_acquisitions_search(
         self, *, name: str | None = None
     ) -> list[MergerAcquisition]:
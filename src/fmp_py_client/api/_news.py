@@ -1,5 +1,8 @@
 """News and analyst data API endpoints."""
 
+from collections.abc import AsyncIterator
+
+from fmp_py_client._pagination import paginate
 from fmp_py_client.models import (
     AnalystEstimates,
     FMPArticle,
@@ -28,6 +31,21 @@ class NewsMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_fmp_articles(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[FMPArticle]:
+        """Iterate over FMP articles across all pages."""
+        return paginate(
+            self.fmp_articles,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def news_general_latest(
         self,
         *,
@@ -40,6 +58,21 @@ class NewsMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_news_general_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[NewsArticle]:
+        """Iterate over latest general news across all pages."""
+        return paginate(
+            self.news_general_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def news_press_releases_latest(
         self,
         *,
@@ -52,6 +85,21 @@ class NewsMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_news_press_releases_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[NewsArticle]:
+        """Iterate over latest press releases across all pages."""
+        return paginate(
+            self.news_press_releases_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def news_stock_latest(
         self,
         *,
@@ -64,6 +112,21 @@ class NewsMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_news_stock_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[NewsArticle]:
+        """Iterate over latest stock news across all pages."""
+        return paginate(
+            self.news_stock_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def news_crypto_latest(
         self,
         *,
@@ -76,6 +139,21 @@ class NewsMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_news_crypto_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[NewsArticle]:
+        """Iterate over latest crypto news across all pages."""
+        return paginate(
+            self.news_crypto_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def news_forex_latest(
         self,
         *,
@@ -88,6 +166,21 @@ class NewsMixin:
             params={"page": page, "limit": limit},
         )
 
+    def iter_news_forex_latest(
+        self,
+        *,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[NewsArticle]:
+        """Iterate over latest forex news across all pages."""
+        return paginate(
+            self.news_forex_latest,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+        )
+
     async def news_press_releases(
         self,
         *,
@@ -146,6 +239,25 @@ class NewsMixin:
             params={"symbol": symbol, "period": period, "page": page, "limit": limit},
         )
 
+    def iter_analyst_estimates(
+        self,
+        *,
+        symbol: str | None = None,
+        period: str | None = None,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[AnalystEstimates]:
+        """Iterate over analyst estimates across all pages."""
+        return paginate(
+            self.analyst_estimates,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+            symbol=symbol,
+            period=period,
+        )
+
     async def ratings_snapshot(
         self, *, symbol: str | None = None
     ) -> list[RatingSnapshot]:
@@ -1,5 +1,10 @@
 """Quotes and price API endpoints."""
 
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from typing import Any
+
+from fmp_py_client._concurrency import gather_limited
+from fmp_py_client._types import BatchResult
 from fmp_py_client.models import (
     AftermarketQuote,
     AftermarketTrade,
@@ -8,6 +13,53 @@ from fmp_py_client.models import (
     StockQuote,
 )
 
+# Keep the comma-joined symbols parameter well inside common URL length limits.
+BATCH_CHUNK_SIZE = 100
+BATCH_MAX_CHARS = 1500
+
+
+def _chunk_symbols(
+    symbols: list[str], chunk_size: int, max_chars: int
+) -> Iterator[list[str]]:
+    chunk: list[str] = []
+    length = 0
+    for symbol in symbols:
+        extra = len(symbol) + (1 if chunk else 0)
+        if chunk and (len(chunk) >= chunk_size or length + extra > max_chars):
+            yield chunk
+            chunk, length = [], 0
+            extra = len(symbol)
+        chunk.append(symbol)
+        length += extra
+    if chunk:
+        yield chunk
+
+
+async def _batch_chunked(
+    fetch: Callable[..., Awaitable[list[Any]]],
+    symbols: Iterable[str],
+    chunk_size: int,
+    concurrency: int,
+) -> BatchResult[Any]:
+    requested = list(dict.fromkeys(s.strip() for s in symbols if s.strip()))
+    chunks = _chunk_symbols(requested, chunk_size, BATCH_MAX_CHARS)
+    pages = await gather_limited(
+        (fetch(symbols=",".join(chunk)) for chunk in chunks), concurrency
+    )
+    by_symbol: dict[str, Any] = {}
+    for page in pages:
+        for row in page:
+            by_symbol.setdefault(row["symbol"].upper(), row)
+    items = []
+    missing = []
+    for symbol in requested:
+        row = by_symbol.get(symbol.upper())
+        if row is None:
+            missing.append(symbol)
+        else:
+            items.append(row)
+    return BatchResult(items, missing)
+
 
 class QuotesMixin:
     """Stock quotes and price endpoints."""
@@ -69,6 +121,35 @@ class QuotesMixin:
             params={"symbols": symbols},
         )
 
+    async def batch_quote_chunked(
+        self,
+        symbols: Iterable[str],
+        *,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+        concurrency: int = 8,
+    ) -> BatchResult[StockQuote]:
+        """Get quotes for any number of symbols.
+
+        Symbols are split into URL-safe chunks fetched concurrently; quotes are
+        returned in input order alongside the symbols that had no quote.
+        """
+        return await _batch_chunked(self.batch_quote, symbols, chunk_size, concurrency)
+
+    async def batch_quote_short_chunked(
+        self,
+        symbols: Iterable[str],
+        *,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+        concurrency: int = 8,
+    ) -> BatchResult[ShortQuote]:
+        """Get short-form quotes for any number of symbols.
+
+        See `batch_quote_chunked` for chunking and ordering behavior.
+        """
+        return await _batch_chunked(
+            self.batch_quote_short, symbols, chunk_size, concurrency
+        )
+
     async def batch_aftermarket_trade(
         self, *, symbols: str | None = None
     ) -> list[AftermarketTrade]:
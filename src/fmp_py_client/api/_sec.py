@@ -1,5 +1,8 @@
 """SEC filings API endpoints."""
 
+from collections.abc import AsyncIterator
+
+from fmp_py_client._pagination import paginate
 from fmp_py_client.models import (
     IndustryClassification,
     SECCompanyProfile,
@@ -25,6 +28,25 @@ class SECMixin:
             params={"from": from_date, "to": to_date, "page": page, "limit": limit},
         )
 
+    def iter_sec_filings_8k(
+        self,
+        *,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[SECFiling]:
+        """Iterate over SEC 8-K filings across all pages."""
+        return paginate(
+            self.sec_filings_8k,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+            from_date=from_date,
+            to_date=to_date,
+        )
+
     async def sec_filings_financials(
         self,
         *,
@@ -39,6 +61,25 @@ class SECMixin:
             params={"from": from_date, "to": to_date, "page": page, "limit": limit},
         )
 
+    def iter_sec_filings_financials(
+        self,
+        *,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[SECFiling]:
+        """Iterate over SEC financial filings across all pages."""
+        return paginate(
+            self.sec_filings_financials,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+            from_date=from_date,
+            to_date=to_date,
+        )
+
     async def sec_filings_search_form_type(
         self,
         *,
@@ -60,6 +101,27 @@ class SECMixin:
             },
         )
 
+    def iter_sec_filings_search_form_type(
+        self,
+        *,
+        form_type: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[SECFiling]:
+        """Iterate over SEC filings by form type across all pages."""
+        return paginate(
+            self.sec_filings_search_form_type,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+            form_type=form_type,
+            from_date=from_date,
+            to_date=to_date,
+        )
+
     async def sec_filings_search_symbol(
         self,
         *,
@@ -81,6 +143,27 @@ class SECMixin:
             },
         )
 
+    def iter_sec_filings_search_symbol(
+        self,
+        *,
+        symbol: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[SECFiling]:
+        """Iterate over SEC filings by symbol across all pages."""
+        return paginate(
+            self.sec_filings_search_symbol,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+            symbol=symbol,
+            from_date=from_date,
+            to_date=to_date,
+        )
+
     async def sec_filings_search_cik(
         self,
         *,
@@ -102,6 +185,27 @@ class SECMixin:
             },
         )
 
+    def iter_sec_filings_search_cik(
+        self,
+        *,
+        cik: int | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        limit: int | None = None,
+        start_page: int = 0,
+        prefetch: int = 2,
+    ) -> AsyncIterator[SECFiling]:
+        """Iterate over SEC filings by CIK across all pages."""
+        return paginate(
+            self.sec_filings_search_cik,
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+            cik=cik,
+            from_date=from_date,
+            to_date=to_date,
+        )
+
     async def sec_filings_company_search_name(
         self, *, company: str | None = None
     ) -> list[SECCompanyProfile]:
@@ -0,0 +1,267 @@
+"""Technical indicators computed locally from price history with NumPy.
+
+The array functions take price arrays in chronological order and return a
+float64 array of the same shape, ``NaN`` until enough bars are available.
+A 2-D ``(n_bars, n_symbols)`` array computes every column at once, so a
+sweep over many symbols costs one pass over time per period length.
+Shorter histories can be left-padded with ``NaN``.
+`compute` works on bars as returned by ``historical_price_eod_full`` or the
+``historical_chart_*`` methods and returns rows shaped like the matching
+``TechnicalMixin`` method, newest first.
+
+Usage:
+    bars = await client.historical_price_eod_full("AAPL")
+    rows = indicators.compute(bars, "rsi", period_length=14)
+
+    close = indicators.prices(bars)["close"]
+    sweep = {n: indicators.sma(close, n) for n in range(5, 105, 5)}
+
+    closes = np.column_stack([close_aapl, close_msft])
+    rsis = {n: indicators.rsi(closes, n) for n in range(5, 105, 5)}
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, Literal
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+type Indicator = Literal[
+    "sma", "ema", "wma", "dema", "tema", "rsi", "standard_deviation", "williams", "adx"
+]
+
+PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _check(period_length: int) -> None:
+    if period_length < 1:
+        raise ValueError("period_length must be at least 1")
+
+
+def _rolling(values: np.ndarray, n: int) -> np.ndarray:
+    # Windows along the time axis, as the last axis.
+    if len(values) < n:
+        return np.empty((0, *values.shape[1:], n))
+    return sliding_window_view(values, n, axis=0)
+
+
+def _pad(values: np.ndarray, length: int) -> np.ndarray:
+    out = np.full((length, *values.shape[1:]), np.nan)
+    if len(values):
+        out[length - len(values) :] = values
+    return out
+
+
+def _first_valid(values: np.ndarray) -> np.ndarray:
+    # Index of the first non-NaN bar per column, or the length if none.
+    valid = ~np.isnan(values)
+    return np.where(valid.any(axis=0), valid.argmax(axis=0), len(values))
+
+
+def _smooth(
+    values: np.ndarray, period_length: int, alpha: float, first: np.ndarray
+) -> np.ndarray:
+    # Exponential smoothing along time: column j is seeded with the mean of
+    # rows first[j] .. first[j] + n - 1, then current += alpha * (x - current).
+    columns = values.reshape(len(values), -1)
+    rows, width = columns.shape
+    out = np.full(columns.shape, np.nan)
+    seed_rows = np.broadcast_to(first, (width,)) + period_length - 1
+    live = np.flatnonzero(seed_rows < rows)
+    if len(live) == 0:
+        return out.reshape(values.shape)
+    window = seed_rows[live] - np.arange(period_length)[:, None]
+    seeds = np.full(width, np.nan)
+    seeds[live] = columns[window, live].mean(axis=0)
+    if width == 1:
+        # A single series is faster as a plain float loop than as 1-wide arrays.
+        start = int(seed_rows[0])
+        current = float(seeds[0])
+        smoothed = [current]
+        for value in columns[start + 1 :, 0].tolist():
+            current += alpha * (value - current)
+            smoothed.append(current)
+        out[start:, 0] = smoothed
+        return out.reshape(values.shape)
+    # One pass over time updates every column; unseeded columns stay NaN.
+    seeded_at = {
+        int(row): live[seed_rows[live] == row] for row in np.unique(seed_rows[live])
+    }
+    current = np.full(width, np.nan)
+    for i in range(int(seed_rows[live].min()), rows):
+        current += alpha * (columns[i] - current)
+        hit = seeded_at.get(i)
+        if hit is not None:
+            current[hit] = seeds[hit]
+        out[i] = current
+    return out.reshape(values.shape)
+
+
+def sma(close: np.ndarray, period_length: int) -> np.ndarray:
+    """Simple moving average."""
+    _check(period_length)
+    close = np.asarray(close, dtype=np.float64)
+    return _pad(_rolling(close, period_length).mean(axis=-1), len(close))
+
+
+def ema(close: np.ndarray, period_length: int) -> np.ndarray:
+    """Exponential moving average, seeded with the SMA of the first window.
+
+    Leading ``NaN`` values are skipped, so EMAs can be chained.
+    """
+    _check(period_length)
+    values = np.asarray(close, dtype=np.float64)
+    return _smooth(
+        values, period_length, 2.0 / (period_length + 1), _first_valid(values)
+    )
+
+
+def wma(close: np.ndarray, period_length: int) -> np.ndarray:
+    """Linearly weighted moving average, the newest bar weighted most."""
+    _check(period_length)
+    close = np.asarray(close, dtype=np.float64)
+    weights = np.arange(1, period_length + 1, dtype=np.float64)
+    windows = _rolling(close, period_length)
+    return _pad(windows @ weights / weights.sum(), len(close))
+
+
+def dema(close: np.ndarray, period_length: int) -> np.ndarray:
+    """Double exponential moving average: ``2 * EMA - EMA(EMA)``."""
+    first = ema(close, period_length)
+    return 2 * first - ema(first, period_length)
+
+
+def tema(close: np.ndarray, period_length: int) -> np.ndarray:
+    """Triple exponential moving average."""
+    first = ema(close, period_length)
+    second = ema(first, period_length)
+    return 3 * first - 3 * second + ema(second, period_length)
+
+
+def _wilder(values: np.ndarray, period_length: int, start: np.ndarray) -> np.ndarray:
+    # Wilder smoothing: mean of the first window, then (prev * (n - 1) + x) / n.
+    return _smooth(values, period_length, 1.0 / period_length, start)
+
+
+def rsi(close: np.ndarray, period_length: int) -> np.ndarray:
+    """Relative strength index with Wilder smoothing."""
+    _check(period_length)
+    close = np.asarray(close, dtype=np.float64)
+    change = np.diff(close, axis=0, prepend=np.nan)
+    start = _first_valid(close) + 1
+    gain = _wilder(np.clip(change, 0, None), period_length, start)
+    loss = _wilder(np.clip(-change, 0, None), period_length, start)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = 100 - 100 / (1 + gain / loss)
+    return np.where(loss == 0, np.where(np.isnan(gain), np.nan, 100.0), value)
+
+
+def standard_deviation(close: np.ndarray, period_length: int) -> np.ndarray:
+    """Rolling population standard deviation."""
+    _check(period_length)
+    close = np.asarray(close, dtype=np.float64)
+    return _pad(_rolling(close, period_length).std(axis=-1), len(close))
+
+
+def williams(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period_length: int
+) -> np.ndarray:
+    """Williams %R, from 0 (at the period high) to -100 (at the period low)."""
+    _check(period_length)
+    close = np.asarray(close, dtype=np.float64)
+    highest = _pad(
+        _rolling(np.asarray(high, np.float64), period_length).max(-1), len(close)
+    )
+    lowest = _pad(
+        _rolling(np.asarray(low, np.float64), period_length).min(-1), len(close)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (highest - close) / (highest - lowest) * -100
+
+
+def adx(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period_length: int
+) -> np.ndarray:
+    """Average directional index with Wilder smoothing."""
+    _check(period_length)
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    prev_close = np.roll(close, 1, axis=0)
+    true_range = np.maximum(
+        high - low, np.maximum(abs(high - prev_close), abs(low - prev_close))
+    )
+    up = np.diff(high, axis=0, prepend=np.nan)
+    down = -np.diff(low, axis=0, prepend=np.nan)
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+    # Ratios of Wilder means equal those of Wilder's running sums.
+    start = _first_valid(close) + 1
+    tr = _wilder(true_range, period_length, start)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100 * _wilder(plus_dm, period_length, start) / tr
+        minus_di = 100 * _wilder(minus_dm, period_length, start) / tr
+        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+    dx = np.where(plus_di + minus_di == 0, 0.0, dx)
+    return _wilder(dx, period_length, start + period_length - 1)
+
+
+def prices(bars: Sequence[Mapping[str, Any]]) -> dict[str, np.ndarray]:
+    """Return ``date`` and OHLCV arrays from bars, in chronological order."""
+    ordered = sorted(bars, key=lambda bar: bar["date"])
+    columns: dict[str, np.ndarray] = {
+        "date": np.array([bar["date"] for bar in ordered], dtype=object)
+    }
+    for field in PRICE_FIELDS:
+        columns[field] = np.array([bar.get(field) for bar in ordered], dtype=np.float64)
+    return columns
+
+
+_CLOSE_ONLY: dict[str, Callable[[np.ndarray, int], np.ndarray]] = {
+    "sma": sma,
+    "ema": ema,
+    "wma": wma,
+    "dema": dema,
+    "tema": tema,
+    "rsi": rsi,
+    "standard_deviation": standard_deviation,
+}
+
+# Result field of each indicator in the API's rows.
+FIELDS = {name: name for name in _CLOSE_ONLY} | {
+    "standard_deviation": "standardDeviation",
+    "williams": "williams",
+    "adx": "adx",
+}
+
+
+def compute(
+    bars: Sequence[Mapping[str, Any]],
+    indicator: Indicator,
+    period_length: int,
+) -> list[dict[str, Any]]:
+    """Compute an indicator and return rows like the ``TechnicalMixin`` method.
+
+    Each row holds the bar's date and OHLCV plus the indicator value under
+    the same key as the API's response. Rows are newest first and bars
+    before the indicator has a value are omitted.
+    """
+    if indicator not in FIELDS:
+        raise ValueError(f"Unknown indicator: {indicator!r}")
+    data = prices(bars)
+    if indicator in _CLOSE_ONLY:
+        values = _CLOSE_ONLY[indicator](data["close"], period_length)
+    else:
+        function = williams if indicator == "williams" else adx
+        values = function(data["high"], data["low"], data["close"], period_length)
+    field = FIELDS[indicator]
+    rows = []
+    for i in np.flatnonzero(~np.isnan(values))[::-1]:
+        row: dict[str, Any] = {"date": data["date"][i]}
+        for name in PRICE_FIELDS:
+            row[name] = data[name][i].item()
+        volume = data["volume"][i]
+        row["volume"] = None if np.isnan(volume) else int(volume)
+        row[field] = values[i].item()
+        rows.append(row)
+    return rows
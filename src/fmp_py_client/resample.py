@@ -0,0 +1,101 @@
+"""OHLCV resampling of intraday bars with NumPy.
+
+Usage:
+    minutes = await client.historical_chart_1min("AAPL", from_date="2024-01-02")
+    bars_5min = resample(minutes, "5min")
+    bars_90min = resample(minutes, "90min")
+"""
+
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from fmp_py_client._types import Timeframe
+from fmp_py_client.models import HistoricalChart
+
+MINUTES_PER_DAY = 24 * 60
+_UNITS = {"min": 1, "hour": 60, "day": MINUTES_PER_DAY}
+
+
+def timeframe_minutes(timeframe: Timeframe | str | int) -> int:
+    """Return the length of a timeframe such as ``"5min"`` or ``"2hour"``."""
+    if isinstance(timeframe, int):
+        minutes = timeframe
+    else:
+        match = re.fullmatch(r"(\d+)\s*(min|hour|day)", str(timeframe))
+        if match is None:
+            raise ValueError(f"Unknown timeframe: {timeframe!r}")
+        minutes = int(match[1]) * _UNITS[match[2]]
+    if not 1 <= minutes <= MINUTES_PER_DAY:
+        raise ValueError(f"Timeframe must be between 1min and 1day: {timeframe!r}")
+    return minutes
+
+
+def _parse_time(value: str) -> int:
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def resample(
+    bars: Sequence[Mapping[str, Any]],
+    timeframe: Timeframe | str | int,
+    *,
+    session_open: str = "09:30",
+) -> list[HistoricalChart]:
+    """Aggregate intraday bars into bars of a longer timeframe.
+
+    ``timeframe`` is a `Timeframe`, a string such as ``"2min"`` or
+    ``"90min"``, or a number of minutes. Bars are grouped into windows
+    counted from ``session_open`` on each day, so 1-hour bars start at 9:30,
+    10:30 and so on, and no window spans two days; the last window of a
+    session may be shorter. Each bar takes the first open, highest high,
+    lowest low, last close and total volume of its window and is dated with
+    the window's start (just the day for ``"1day"``). Input may be in any
+    order; the result is newest first like the ``historical_chart_*``
+    methods.
+    """
+    minutes = timeframe_minutes(timeframe)
+    if not bars:
+        return []
+    times = np.array([bar["date"] for bar in bars], dtype="datetime64[m]")
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+
+    def column(name: str) -> np.ndarray:
+        return np.array([bars[i].get(name) for i in order], dtype=np.float64)
+
+    days = times.astype("datetime64[D]")
+    if minutes == MINUTES_PER_DAY:
+        starts = days.astype("datetime64[m]")
+    else:
+        opening = np.timedelta64(_parse_time(session_open), "m")
+        elapsed = (times - days - opening).astype(np.int64)
+        window = np.timedelta64(minutes, "m")
+        starts = days + opening + (elapsed // minutes) * window
+
+    edges = np.flatnonzero(starts[1:] != starts[:-1]) + 1
+    first = np.concatenate(([0], edges))
+    last = np.concatenate((edges - 1, [len(times) - 1]))
+    opens = column("open")[first]
+    highs = np.maximum.reduceat(column("high"), first)
+    lows = np.minimum.reduceat(column("low"), first)
+    closes = column("close")[last]
+    volumes = np.add.reduceat(np.nan_to_num(column("volume")), first)
+
+    if minutes == MINUTES_PER_DAY:
+        labels = [str(day) for day in starts[first].astype("datetime64[D]")]
+    else:
+        labels = [str(start).replace("T", " ") + ":00" for start in starts[first]]
+    return [
+        {
+            "date": labels[i],
+            "open": opens[i].item(),
+            "high": highs[i].item(),
+            "low": lows[i].item(),
+            "close": closes[i].item(),
+            "volume": int(volumes[i]),
+        }
+        for i in range(len(first) - 1, -1, -1)
+    ]
@@ -1,7 +1,10 @@
 """Pytest configuration and fixtures."""
 
-import pytest
+import asyncio
+import importlib
+
 import httpx
+import pytest
 
 
 @pytest.fixture
@@ -28,3 +31,75 @@ def mock_transport():
             return self.handler(request)
 
     return MockTransport
+
+
+@pytest.fixture
+def fake_clock(request, monkeypatch):
+    """Replace ``time.monotonic`` and ``asyncio.sleep`` with a virtual clock.
+
+    The modules to patch are listed in the test module's ``CLOCK_MODULES``.
+    Sleeps are recorded and advance the clock unless ``frozen`` is set.
+    """
+    real_sleep = asyncio.sleep
+
+    class FakeClock:
+        def __init__(self):
+            self.now = 0.0
+            self.sleeps: list[float] = []
+            self.frozen = False
+
+        def monotonic(self) -> float:
+            return self.now
+
+        async def sleep(self, delay: float) -> None:
+            self.sleeps.append(delay)
+            if not self.frozen:
+                self.now += delay
+            await real_sleep(0)
+
+    clock = FakeClock()
+    for name in request.module.CLOCK_MODULES:
+        module = importlib.import_module(name)
+        monkeypatch.setattr(module.time, "monotonic", clock.monotonic)
+        monkeypatch.setattr(module.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.fixture
+def gated_transport():
+    """Create a transport that holds every request until its gate is set."""
+
+    class GatedTransport(httpx.AsyncBaseTransport):
+        def __init__(self, status_code: int = 200):
+            self.gate = asyncio.Event()
+            self.requests: list[httpx.Request] = []
+            self.status_code = status_code
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        @property
+        def paths(self) -> list[str]:
+            return [r.url.path.rsplit("/", 1)[-1] for r in self.requests]
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await self.gate.wait()
+            self.in_flight -= 1
+            if self.status_code != 200:
+                return httpx.Response(self.status_code, text="error")
+            return httpx.Response(200, json=[{"url": str(request.url)}])
+
+    return GatedTransport
+
+
+@pytest.fixture
+def settle():
+    """Return a coroutine that lets pending tasks run until they block."""
+
+    async def settle() -> None:
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    return settle
@@ -0,0 +1,122 @@
+"""Tests for local split and dividend adjustment."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fmp_py_client.adjust import Adjuster, dividend_factors, split_factors
+
+SPLIT = {"symbol": "AAPL", "date": "2024-01-04", "numerator": 2, "denominator": 1}
+DIVIDEND = {"symbol": "AAPL", "date": "2024-01-05", "dividend": 1.0}
+
+
+def raw_bar(day: str, close: float, volume: int = 1000) -> dict:
+    return {
+        "symbol": "AAPL",
+        "date": day,
+        "open": close,
+        "high": close + 2,
+        "low": close - 2,
+        "close": close,
+        "volume": volume,
+    }
+
+
+def raw_bars() -> list[dict]:
+    """Return raw bars around a 2-for-1 split, newest first like the API."""
+    return [
+        raw_bar("2024-01-05", 99.0),
+        raw_bar("2024-01-04", 100.0),
+        raw_bar("2024-01-03", 200.0),
+        raw_bar("2024-01-02", 196.0),
+    ]
+
+
+class TestFactors:
+    """Tests for the vectorized factor functions."""
+
+    def test_split_factors(self):
+        """Test that splits scale every bar before their date."""
+        dates = np.array(["2024-01-02", "2024-01-03", "2024-01-04"], "datetime64[D]")
+        splits = [SPLIT, {**SPLIT, "date": "2024-01-03", "numerator": 3}]
+
+        assert split_factors(dates, splits).tolist() == pytest.approx([1 / 6, 0.5, 1.0])
+
+    def test_dividend_factors_use_prior_close(self):
+        """Test the dividend ratio from the close before the ex-date."""
+        dates = np.array(["2024-01-04", "2024-01-05"], "datetime64[D]")
+
+        factors = dividend_factors(dates, np.array([100.0, 99.0]), [DIVIDEND])
+
+        assert factors.tolist() == pytest.approx([0.99, 1.0])
+
+    def test_dividend_before_history_is_ignored(self):
+        """Test that a dividend without an earlier bar has no effect."""
+        dates = np.array(["2024-01-05"], "datetime64[D]")
+
+        assert dividend_factors(dates, np.array([99.0]), [DIVIDEND]).tolist() == [1.0]
+
+
+class TestAdjuster:
+    """Tests for Adjuster."""
+
+    def test_split_adjusted(self):
+        """Test split-adjusted prices and volumes, newest first."""
+        adjuster = Adjuster(raw_bars(), splits=[SPLIT])
+
+        rows = adjuster.split_adjusted()
+
+        assert [row["date"] for row in rows] == [
+            "2024-01-05",
+            "2024-01-04",
+            "2024-01-03",
+            "2024-01-02",
+        ]
+        assert [row["close"] for row in rows] == [99.0, 100.0, 100.0, 98.0]
+        assert rows[2]["high"] == 101.0
+        assert [row["volume"] for row in rows] == [1000, 1000, 2000, 2000]
+        assert adjuster.raw() == raw_bars()
+
+    def test_dividend_adjusted(self):
+        """Test that dividends reduce earlier split-adjusted prices."""
+        adjuster = Adjuster(raw_bars(), splits=[SPLIT], dividends=[DIVIDEND])
+
+        rows = adjuster.dividend_adjusted()
+
+        assert [row["close"] for row in rows] == pytest.approx(
+            [99.0, 99.0, 99.0, 97.02]
+        )
+        assert rows[-1]["volume"] == 2000
+
+    def test_incremental_action_matches_full_adjustment(self):
+        """Test that adding an action later equals adjusting from scratch."""
+        adjuster = Adjuster(raw_bars(), dividends=[DIVIDEND])
+
+        added = adjuster.add_actions(splits=[SPLIT], dividends=[DIVIDEND])
+
+        assert added == 1
+        full = Adjuster(raw_bars(), splits=[SPLIT], dividends=[DIVIDEND])
+        assert adjuster.dividend_adjusted() == full.dividend_adjusted()
+
+    def test_future_action_waits_for_its_bar(self):
+        """Test that an action dated after the last bar applies once reached."""
+        bars = raw_bars()
+        adjuster = Adjuster(bars[2:])
+        adjuster.add_actions(splits=[SPLIT])
+
+        assert adjuster.split_factor.tolist() == [1.0, 1.0]
+
+        adjuster.extend(bars[:2])
+
+        assert adjuster.split_factor.tolist() == [0.5, 0.5, 1.0, 1.0]
+        full = Adjuster(bars, splits=[SPLIT])
+        assert adjuster.split_adjusted() == full.split_adjusted()
+
+    def test_extend_with_overlap_recomputes(self):
+        """Test that corrected bars replace stored ones."""
+        adjuster = Adjuster(raw_bars(), splits=[SPLIT], dividends=[DIVIDEND])
+
+        adjuster.extend([raw_bar("2024-01-04", 50.0)])
+
+        assert adjuster.dividend_factor[:2].tolist() == pytest.approx([0.98, 0.98])
+        assert adjuster.raw()[1]["close"] == 50.0
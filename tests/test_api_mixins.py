@@ -3,7 +3,7 @@
 import pytest
 import httpx
 
-from fmp_py_client import AsyncFMPClient, Period
+from fmp_py_client import AsyncFMPClient, Period, Timeframe
 
 
 class TestQuotesMixin:
@@ -86,6 +86,61 @@ class TestQuotesMixin:
 
         assert result == expected
 
+    @pytest.mark.asyncio
+    async def test_batch_quote_chunked(self, api_key, mock_transport):
+        """Test batch_quote_chunked splits, merges in order and reports missing."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "/stable/batch-quote" in str(request.url)
+            symbols = request.url.params["symbols"].split(",")
+            requested.append(symbols)
+            return httpx.Response(
+                200, json=[{"symbol": s} for s in reversed(symbols) if s != "ZZZZ"]
+            )
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            result = await client.batch_quote_chunked(
+                ["AAPL", "MSFT", "ZZZZ", "GOOG", "AAPL", "NVDA"], chunk_size=2
+            )
+
+        assert sorted(len(chunk) for chunk in requested) == [1, 2, 2]
+        assert [row["symbol"] for row in result.items] == [
+            "AAPL",
+            "MSFT",
+            "GOOG",
+            "NVDA",
+        ]
+        assert result.missing == ["ZZZZ"]
+
+    @pytest.mark.asyncio
+    async def test_batch_quote_short_chunked(self, api_key, mock_transport):
+        """Test batch_quote_short_chunked uses the short batch endpoint."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "/stable/batch-quote-short" in str(request.url)
+            symbols = request.url.params["symbols"].split(",")
+            return httpx.Response(200, json=[{"symbol": s} for s in symbols])
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            items, missing = await client.batch_quote_short_chunked(
+                iter(["aapl", "MSFT"])
+            )
+
+        assert [row["symbol"] for row in items] == ["aapl", "MSFT"]
+        assert missing == []
+
+    def test_chunk_symbols_respects_char_limit(self):
+        """Test that chunks never exceed the character budget."""
+        from fmp_py_client.api._quotes import _chunk_symbols
+
+        chunks = list(_chunk_symbols(["AAAA"] * 10, chunk_size=100, max_chars=14))
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+        assert all(len(",".join(chunk)) <= 14 for chunk in chunks)
+
 
 class TestSearchMixin:
     """Tests for search API endpoints."""
@@ -407,6 +462,85 @@ class TestHistoricalMixin:
 
         assert result == expected
 
+    @pytest.mark.asyncio
+    async def test_historical_price_eod_range(self, api_key, mock_transport):
+        """Test historical_price_eod_range shards, dedupes and sorts bars."""
+        windows = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "/stable/historical-price-eod/full" in str(request.url)
+            start = request.url.params["from"]
+            end = request.url.params["to"]
+            windows.append((start, end))
+            # Each window also returns the bar just past its end.
+            bars = [{"date": d, "close": 1.0} for d in (start, end)]
+            bars.append({"date": "2024-01-07", "close": 2.0})
+            return httpx.Response(200, json=bars)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            result = await client.historical_price_eod_range(
+                "AAPL", from_date="2024-01-01", to_date="2024-01-10", window_days=3
+            )
+
+        assert sorted(windows) == [
+            ("2024-01-01", "2024-01-03"),
+            ("2024-01-04", "2024-01-06"),
+            ("2024-01-07", "2024-01-09"),
+            ("2024-01-10", "2024-01-10"),
+        ]
+        dates = [bar["date"] for bar in result]
+        assert dates == sorted(set(dates), reverse=True)
+        assert dates[0] == "2024-01-10"
+        assert dates[-1] == "2024-01-01"
+
+    @pytest.mark.asyncio
+    async def test_historical_chart_range(self, api_key, mock_transport):
+        """Test historical_chart_range uses interval-sized windows."""
+        windows = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "/stable/historical-chart/1min" in str(request.url)
+            windows.append(request.url.params["from"])
+            return httpx.Response(
+                200, json=[{"date": request.url.params["from"] + " 09:30:00"}]
+            )
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            result = await client.historical_chart_range(
+                "AAPL", "1min", from_date="2024-01-01", to_date="2024-01-09"
+            )
+
+        assert sorted(windows) == ["2024-01-01", "2024-01-04", "2024-01-07"]
+        assert [bar["date"] for bar in result] == [
+            "2024-01-07 09:30:00",
+            "2024-01-04 09:30:00",
+            "2024-01-01 09:30:00",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_historical_chart_range_rejects_daily(self, api_key):
+        """Test that daily bars are not fetched through the chart endpoint."""
+        client = AsyncFMPClient(api_key)
+
+        with pytest.raises(ValueError):
+            await client.historical_chart_range(
+                "AAPL", Timeframe.ONE_DAY, from_date="2024-01-01", to_date="2024-01-02"
+            )
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_historical_range_rejects_inverted_dates(self, api_key):
+        """Test that from_date after to_date is rejected."""
+        client = AsyncFMPClient(api_key)
+
+        with pytest.raises(ValueError):
+            await client.historical_price_eod_range(
+                "AAPL", from_date="2024-02-01", to_date="2024-01-01"
+            )
+        await client.aclose()
+
 
 class TestModuleImports:
     """Tests for module imports and exports."""
@@ -444,6 +578,11 @@ class TestModuleImports:
         # Core exports that must always be present
         core_exports = {
             "AsyncFMPClient",
+            "BatchResult",
+            "CacheBackend",
+            "CachePolicy",
+            "ConnectionConfig",
+            "EODStore",
             "FMPAPIError",
             "FMPAuthenticationError",
             "FMPConnectionError",
@@ -451,8 +590,24 @@ class TestModuleImports:
             "FMPNotFoundError",
             "FMPRateLimitError",
             "FMPTimeoutError",
+            "IndexMembership",
+            "InsiderFeed",
+            "MapResult",
+            "MembershipPeriod",
+            "MemoryCache",
+            "NewsStream",
+            "ParquetLake",
             "Period",
+            "Priority",
+            "RateLimiter",
+            "RetryPolicy",
+            "SQLiteCache",
+            "Scheduler",
+            "SearchIndex",
+            "SymbolResult",
             "Timeframe",
+            "TokenBucket",
+            "struct_type",
         }
 
         # Model exports added for typed responses
@@ -0,0 +1,314 @@
+"""Tests for the response cache module."""
+
+import math
+import sqlite3
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, FMPAPIError, Period
+from fmp_py_client._cache import CachePolicy, MemoryCache, SQLiteCache, cache_key
+
+CLOCK_MODULES = ("fmp_py_client._cache",)
+
+
+class TestCacheKey:
+    """Tests for cache_key."""
+
+    def test_excludes_api_key_and_none(self):
+        """Test that the API key and unset params do not affect the key."""
+        key = cache_key("quote", {"symbol": "AAPL", "limit": None, "apikey": "k"})
+
+        assert key == "quote?symbol=AAPL"
+
+    def test_param_order_is_normalized(self):
+        """Test that parameter order does not affect the key."""
+        a = cache_key("/income-statement", {"symbol": "AAPL", "period": "annual"})
+        b = cache_key("income-statement", {"period": Period.ANNUAL, "symbol": "AAPL"})
+
+        assert a == b
+
+
+class TestCachePolicy:
+    """Tests for CachePolicy class."""
+
+    def test_default_ttls(self):
+        """Test built-in lifetimes for common endpoints."""
+        policy = CachePolicy()
+
+        assert policy.ttl_for("quote", {"symbol": "AAPL"}) == 5.0
+        assert policy.ttl_for("available-exchanges", {}) == 86400.0
+
+    def test_uncached_by_default(self):
+        """Test that unlisted paths are not cached without a default TTL."""
+        assert CachePolicy().ttl_for("income-statement", {}) is None
+
+    def test_default_ttl(self):
+        """Test that default_ttl applies to unlisted paths."""
+        policy = CachePolicy(default_ttl=30.0)
+
+        assert policy.ttl_for("income-statement", {}) == 30.0
+
+    def test_override_and_disable(self):
+        """Test that custom TTLs override defaults and zero disables caching."""
+        policy = CachePolicy({"quote": 0, "profile": 60.0})
+
+        assert policy.ttl_for("quote", {}) is None
+        assert policy.ttl_for("profile", {}) == 60.0
+
+    def test_past_history_never_expires(self):
+        """Test that EOD ranges ending in the past are cached forever."""
+        policy = CachePolicy()
+        params = {"symbol": "AAPL", "from": "2020-01-01", "to": "2020-12-31"}
+
+        assert policy.ttl_for("historical-price-eod/full", params) == math.inf
+
+    def test_open_ended_history_not_cached(self):
+        """Test that EOD ranges reaching today are not cached forever."""
+        policy = CachePolicy()
+
+        assert policy.ttl_for("historical-price-eod/full", {"symbol": "AAPL"}) is None
+        assert policy.ttl_for("historical-price-eod/full", {"to": "2999-01-01"}) is None
+
+    def test_past_history_disabled(self):
+        """Test that permanent history caching can be turned off."""
+        policy = CachePolicy(cache_past_history=False)
+
+        assert policy.ttl_for("historical-price-eod/full", {"to": "2020-01-01"}) is None
+
+
+class TestMemoryCache:
+    """Tests for MemoryCache class."""
+
+    @pytest.mark.asyncio
+    async def test_get_set(self, fake_clock):
+        """Test storing and retrieving a body."""
+        cache = MemoryCache()
+        await cache.set("k", b"[]", 10.0)
+
+        assert await cache.get("k") == b"[]"
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_expiry(self, fake_clock):
+        """Test that entries expire after their TTL."""
+        cache = MemoryCache()
+        await cache.set("k", b"[]", 10.0)
+        fake_clock.now = 10.0
+
+        assert await cache.get("k") is None
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_size(self, fake_clock):
+        """Test that least recently used entries are evicted over the cap."""
+        cache = MemoryCache(max_bytes=25)
+        await cache.set("a", b"x" * 9, 60.0)
+        await cache.set("b", b"x" * 9, 60.0)
+        await cache.get("a")
+        await cache.set("c", b"x" * 9, 60.0)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+        assert cache.size == 20
+
+    @pytest.mark.asyncio
+    async def test_oversized_entry_skipped(self, fake_clock):
+        """Test that entries larger than the cap are not stored."""
+        cache = MemoryCache(max_bytes=10)
+        await cache.set("k", b"x" * 100, 60.0)
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_replace_entry(self, fake_clock):
+        """Test that re-setting a key replaces its body and size."""
+        cache = MemoryCache()
+        await cache.set("k", b"xx", 60.0)
+        await cache.set("k", b"xxxx", 60.0)
+
+        assert await cache.get("k") == b"xxxx"
+        assert cache.size == 5
+
+    @pytest.mark.asyncio
+    async def test_clear(self, fake_clock):
+        """Test clearing the cache."""
+        cache = MemoryCache()
+        await cache.set("k", b"[]", 60.0)
+        await cache.clear()
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+class TestSQLiteCache:
+    """Tests for SQLiteCache class."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache" / "responses.db")
+        yield cache
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_get_set(self, cache):
+        """Test storing and retrieving a body."""
+        await cache.set("k", b'[{"symbol": "AAPL"}]', 60.0)
+
+        assert await cache.get("k") == b'[{"symbol": "AAPL"}]'
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_uses_wal_and_compression(self, cache):
+        """Test that the database is in WAL mode and bodies are compressed."""
+        body = b"[" + b'{"close": 1.0},' * 1000 + b"{}]"
+        await cache.set("k", body, 60.0)
+
+        conn = sqlite3.connect(cache.path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        stored, expires_at = conn.execute(
+            "SELECT body, expires_at FROM responses WHERE key = 'k'"
+        ).fetchone()
+        conn.close()
+
+        assert mode == "wal"
+        assert len(stored) < len(body)
+        assert expires_at is not None
+
+    @pytest.mark.asyncio
+    async def test_expiry(self, cache, monkeypatch):
+        """Test that expired entries are not returned and are removed."""
+        now = [1000.0]
+        monkeypatch.setattr("fmp_py_client._cache.time.time", lambda: now[0])
+        await cache.set("k", b"[]", 10.0)
+        now[0] = 1010.0
+
+        assert await cache.get("k") is None
+        assert await cache.purge_expired() == 0
+
+    @pytest.mark.asyncio
+    async def test_forever(self, cache):
+        """Test that an infinite TTL is stored without an expiry."""
+        await cache.set("k", b"[]", math.inf)
+
+        assert await cache.get("k") == b"[]"
+
+    @pytest.mark.asyncio
+    async def test_purge_expired(self, cache, monkeypatch):
+        """Test purging expired entries."""
+        now = [1000.0]
+        monkeypatch.setattr("fmp_py_client._cache.time.time", lambda: now[0])
+        await cache.set("a", b"[]", 10.0)
+        await cache.set("b", b"[]", 100.0)
+        now[0] = 1050.0
+
+        assert await cache.purge_expired() == 1
+        assert await cache.get("b") == b"[]"
+
+    @pytest.mark.asyncio
+    async def test_shared_between_instances(self, cache):
+        """Test that separate handles on one file see each other's writes."""
+        await cache.set("k", b"[1]", 60.0)
+        other = SQLiteCache(cache.path)
+        try:
+            assert await other.get("k") == b"[1]"
+            await other.set("k", b"[2]", 60.0)
+        finally:
+            other.close()
+
+        assert await cache.get("k") == b"[2]"
+
+    @pytest.mark.asyncio
+    async def test_clear(self, cache):
+        """Test clearing the cache."""
+        await cache.set("k", b"[]", 60.0)
+        await cache.clear()
+
+        assert await cache.get("k") is None
+
+
+class TestClientCache:
+    """Tests for caching through the client."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_request(self, api_key, mock_transport):
+        """Test that cached responses are served without a network call."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=[{"symbol": "AAPL"}])
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key, httpx_client=http_client, cache=MemoryCache()
+            )
+            first = await client.profile(symbol="AAPL")
+            second = await client.profile(symbol="AAPL")
+            await client.profile(symbol="MSFT")
+
+        assert first == second == [{"symbol": "AAPL"}]
+        assert first is not second
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_uncached_path_always_requests(self, api_key, mock_transport):
+        """Test that paths without a TTL bypass the cache."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=[])
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key, httpx_client=http_client, cache=MemoryCache()
+            )
+            await client.income_statement(symbol="AAPL")
+            await client.income_statement(symbol="AAPL")
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, api_key, mock_transport):
+        """Test that failed responses are not stored."""
+        responses = [httpx.Response(500, text="error"), httpx.Response(200, json=[])]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key, httpx_client=http_client, cache=MemoryCache()
+            )
+            with pytest.raises(FMPAPIError):
+                await client.profile(symbol="AAPL")
+            result = await client.profile(symbol="AAPL")
+
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_warm_start(self, api_key, mock_transport, tmp_path):
+        """Test that a new client warm-starts from an on-disk cache."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=[{"symbol": "AAPL"}])
+
+        policy = CachePolicy(default_ttl=3600.0)
+        for _ in range(2):
+            cache = SQLiteCache(tmp_path / "responses.db")
+            async with httpx.AsyncClient(
+                transport=mock_transport(handler)
+            ) as http_client:
+                client = AsyncFMPClient(
+                    api_key, httpx_client=http_client, cache=cache, cache_policy=policy
+                )
+                result = await client.income_statement(symbol="AAPL")
+            cache.close()
+
+        assert result == [{"symbol": "AAPL"}]
+        assert len(calls) == 1
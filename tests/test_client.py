@@ -3,7 +3,7 @@
 import pytest
 import httpx
 
-from fmp_py_client import AsyncFMPClient
+from fmp_py_client import AsyncFMPClient, ConnectionConfig
 from fmp_py_client._base import BASE_URL
 
 
@@ -152,3 +152,56 @@ class TestAsyncFMPClient:
             )
 
         assert result == expected_data
+
+
+class TestConnectionConfig:
+    """Tests for connection pool configuration."""
+
+    def test_default_pool(self, api_key):
+        """Test that the owned client gets the high-concurrency defaults."""
+        client = AsyncFMPClient(api_key, timeout=10.0)
+
+        pool = client._client._transport._pool
+        assert pool._max_connections == 512
+        assert pool._max_keepalive_connections == 256
+        assert pool._keepalive_expiry == 60.0
+        assert client._client.timeout == httpx.Timeout(10.0)
+
+    def test_custom_pool_and_timeouts(self, api_key):
+        """Test custom limits and per-phase timeouts."""
+        connection = ConnectionConfig(
+            1000,
+            100,
+            keepalive_expiry=5.0,
+            connect_timeout=2.0,
+            pool_timeout=1.0,
+        )
+
+        client = AsyncFMPClient(api_key, timeout=30.0, connection=connection)
+
+        pool = client._client._transport._pool
+        assert pool._max_connections == 1000
+        assert pool._max_keepalive_connections == 100
+        assert client._client.timeout == httpx.Timeout(30.0, connect=2.0, pool=1.0)
+
+    def test_http2(self, api_key):
+        """Test enabling HTTP/2 on the owned client."""
+        pytest.importorskip("h2")
+
+        client = AsyncFMPClient(api_key, connection=ConnectionConfig(http2=True))
+
+        assert client._client._transport._pool._http2 is True
+
+    def test_rejects_connection_with_httpx_client(self, api_key):
+        """Test that pool settings cannot be combined with a custom client."""
+        with pytest.raises(ValueError):
+            AsyncFMPClient(
+                api_key,
+                httpx_client=httpx.AsyncClient(),
+                connection=ConnectionConfig(),
+            )
+
+    def test_invalid_max_connections(self):
+        """Test that an empty pool is rejected."""
+        with pytest.raises(ValueError):
+            ConnectionConfig(max_connections=0)
@@ -0,0 +1,112 @@
+"""Tests for coalescing identical in-flight requests."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, FMPAPIError
+
+
+class TestCoalescing:
+    """Tests for single-flight request deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_call(
+        self, api_key, gated_transport, settle
+    ):
+        """Test that concurrent identical requests issue one HTTP call."""
+        transport = gated_transport()
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client, coalesce=True)
+            tasks = [
+                asyncio.create_task(client.quote(symbol="AAPL")) for _ in range(10)
+            ]
+            await settle()
+            transport.gate.set()
+            results = await asyncio.gather(*tasks)
+
+        assert len(transport.requests) == 1
+        assert all(result is results[0] for result in results)
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_params_not_shared(self, api_key, gated_transport, settle):
+        """Test that requests with different params are sent separately."""
+        transport = gated_transport()
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client, coalesce=True)
+            tasks = [
+                asyncio.create_task(client.quote(symbol="AAPL")),
+                asyncio.create_task(client.quote(symbol="MSFT")),
+                asyncio.create_task(client.profile(symbol="AAPL")),
+            ]
+            await settle()
+            transport.gate.set()
+            await asyncio.gather(*tasks)
+
+        assert len(transport.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, api_key, gated_transport, settle):
+        """Test that requests are not coalesced unless enabled."""
+        transport = gated_transport()
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            tasks = [asyncio.create_task(client.quote(symbol="AAPL")) for _ in range(3)]
+            await settle()
+            transport.gate.set()
+            await asyncio.gather(*tasks)
+
+        assert len(transport.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_not_shared(self, api_key, gated_transport):
+        """Test that a completed request is not reused by later callers."""
+        transport = gated_transport()
+        transport.gate.set()
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client, coalesce=True)
+            await client.quote(symbol="AAPL")
+            await client.quote(symbol="AAPL")
+
+        assert len(transport.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_error_shared_by_waiters(self, api_key, gated_transport, settle):
+        """Test that every waiter receives the shared request's error."""
+        transport = gated_transport(status_code=500)
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client, coalesce=True)
+            tasks = [asyncio.create_task(client.quote(symbol="AAPL")) for _ in range(3)]
+            await settle()
+            transport.gate.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert len(transport.requests) == 1
+        assert all(isinstance(result, FMPAPIError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(
+        self, api_key, gated_transport, settle
+    ):
+        """Test that cancelling one caller leaves the shared request running."""
+        transport = gated_transport()
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client, coalesce=True)
+            first = asyncio.create_task(client.quote(symbol="AAPL"))
+            second = asyncio.create_task(client.quote(symbol="AAPL"))
+            await settle()
+            first.cancel()
+            await settle()
+            transport.gate.set()
+            result = await second
+
+        assert first.cancelled()
+        assert result[0]["url"].endswith("symbol=AAPL&apikey=test-api-key")
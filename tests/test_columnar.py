@@ -0,0 +1,174 @@
+"""Tests for columnar decoding."""
+
+import json
+import sys
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, struct_type
+from fmp_py_client._columnar import column_decoder, column_kinds, rows_to_columns
+from fmp_py_client.models import EODFull, HistoricalChart, TreasuryRate
+
+np = pytest.importorskip("numpy")
+
+ROWS = [
+    {
+        "symbol": "AAPL",
+        "date": "2024-01-03",
+        "open": 184.2,
+        "high": 185.9,
+        "low": 183.4,
+        "close": 184.3,
+        "volume": 58414500,
+        "vwap": 184.5,
+    },
+    {
+        "symbol": "AAPL",
+        "date": "2024-01-02",
+        "open": 187,
+        "high": 188.4,
+        "low": 183.9,
+        "close": 185.6,
+        "volume": 82488700,
+    },
+]
+BODY = json.dumps(ROWS).encode()
+
+
+@pytest.fixture(params=["msgspec", "stdlib"])
+def decoder_backend(request, monkeypatch):
+    """Run each test with and without msgspec."""
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+    else:
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+    struct_type.cache_clear()
+    yield request.param
+    struct_type.cache_clear()
+
+
+class TestColumnDecoder:
+    """Tests for column_decoder."""
+
+    def test_kinds(self):
+        """Test that field types map to column kinds."""
+        kinds = column_kinds(EODFull)
+
+        assert kinds["date"] == "date"
+        assert kinds["close"] == "float"
+        assert kinds["volume"] == "int"
+        assert kinds["symbol"] == "object"
+
+    def test_typed_columns(self, decoder_backend):
+        """Test that rows decode into typed arrays."""
+        columns = column_decoder(EODFull, json.loads)(BODY)
+
+        assert columns["close"].dtype == np.float64
+        assert columns["open"].tolist() == [184.2, 187.0]
+        assert columns["volume"].dtype == np.int64
+        assert columns["date"].dtype == np.dtype("datetime64[D]")
+        assert str(columns["date"][1]) == "2024-01-02"
+        assert columns["symbol"].tolist() == ["AAPL", "AAPL"]
+
+    def test_missing_values(self, decoder_backend):
+        """Test that missing values become NaN and NaT."""
+        columns = column_decoder(EODFull, json.loads)(BODY)
+
+        assert columns["vwap"][0] == 184.5
+        assert np.isnan(columns["vwap"][1])
+        assert columns["unadjustedVolume"].dtype == np.float64
+        assert np.isnan(columns["unadjustedVolume"]).all()
+
+    def test_fractional_volume(self, decoder_backend):
+        """Test that fractional volumes widen to float64 instead of truncating."""
+        rows = [
+            {"symbol": "BTCUSD", "date": "2024-01-02", "volume": volume}
+            for volume in (3, 1234.567)
+        ]
+
+        columns = column_decoder(EODFull, json.loads)(json.dumps(rows).encode())
+
+        assert columns["volume"].dtype == np.float64
+        assert columns["volume"].tolist() == [3.0, 1234.567]
+        assert rows_to_columns(rows, EODFull)["volume"].tolist() == [3.0, 1234.567]
+        assert rows_to_columns(rows[:1], EODFull)["volume"].dtype == np.int64
+
+    def test_empty_body(self, decoder_backend):
+        """Test that an empty response yields empty columns."""
+        columns = column_decoder(TreasuryRate, json.loads)(b"[]")
+
+        assert set(columns) == set(column_kinds(TreasuryRate))
+        assert all(len(column) == 0 for column in columns.values())
+
+    def test_intraday_timestamps(self, decoder_backend):
+        """Test that intraday dates keep their time of day."""
+        body = b'[{"date": "2024-01-02 09:30:00", "close": 1.0}]'
+        columns = column_decoder(HistoricalChart, json.loads)(body)
+
+        assert columns["date"][0] == np.datetime64("2024-01-02T09:30:00")
+
+
+class TestFetchColumns:
+    """Tests for AsyncFMPClient.fetch_columns and fetch_arrow."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_columns(self, api_key, mock_transport):
+        """Test that a client method's rows are returned as arrays."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=BODY)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            columns = await client.fetch_columns(
+                client.historical_price_eod_full, symbol="AAPL"
+            )
+
+        assert columns["close"].tolist() == [184.3, 185.6]
+
+    @pytest.mark.asyncio
+    async def test_range_method(self, api_key, mock_transport):
+        """Test that windows are merged before the columns are built."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=BODY)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            columns = await client.fetch_columns(
+                client.historical_chart_range,
+                "AAPL",
+                "5min",
+                from_date="2024-01-01",
+                to_date="2024-01-30",
+            )
+            daily = await client.fetch_columns(
+                client.historical_price_eod_range,
+                "AAPL",
+                from_date="2020-01-01",
+                to_date="2024-01-10",
+                window_days=365,
+            )
+
+        assert columns["close"].tolist() == [184.3, 185.6]
+        assert columns["date"].dtype == np.dtype("datetime64[D]")
+        assert daily["volume"].tolist() == [58414500, 82488700]
+
+    @pytest.mark.asyncio
+    async def test_fetch_arrow(self, api_key, mock_transport):
+        """Test that rows can be returned as an Arrow table."""
+        pa = pytest.importorskip("pyarrow")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=BODY)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            table = await client.fetch_arrow(
+                client.historical_price_eod_full, symbol="AAPL"
+            )
+
+        assert table.num_rows == 2
+        assert table.schema.field("close").type == pa.float64()
+        assert table.column("symbol").to_pylist() == ["AAPL", "AAPL"]
@@ -0,0 +1,159 @@
+"""Tests for the concurrency helpers."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, FMPNotFoundError
+from fmp_py_client._concurrency import gather_limited
+
+
+class TestGatherLimited:
+    """Tests for gather_limited."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_order(self):
+        """Test that results follow input order regardless of completion order."""
+
+        async def work(i: int) -> int:
+            await asyncio.sleep(0.001 * (5 - i))
+            return i
+
+        assert await gather_limited((work(i) for i in range(5)), 5) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """Test that no more than limit awaitables run at once."""
+        running = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+        await gather_limited([work() for _ in range(20)], 3)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_raises_first_error(self):
+        """Test that a failure is re-raised unwrapped."""
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await gather_limited([fail()], 2)
+
+    @pytest.mark.asyncio
+    async def test_invalid_limit(self):
+        """Test that a limit below one is rejected."""
+        with pytest.raises(ValueError):
+            await gather_limited([], 0)
+
+
+def profile_handler(request: httpx.Request) -> httpx.Response:
+    """Serve a profile per symbol; ``MISSING`` is not found."""
+    symbol = request.url.params["symbol"]
+    if symbol == "MISSING":
+        return httpx.Response(404, text="not found")
+    return httpx.Response(200, json=[{"symbol": symbol}])
+
+
+class TestMap:
+    """Tests for AsyncFMPClient.map and map_all."""
+
+    @pytest.mark.asyncio
+    async def test_map_collects_errors_and_progress(self, api_key, mock_transport):
+        """Test that failures are reported per symbol without stopping the rest."""
+        symbols = ["AAPL", "MISSING", "MSFT", "AAPL"]
+        progress: list[tuple[int, int]] = []
+
+        async with httpx.AsyncClient(
+            transport=mock_transport(profile_handler)
+        ) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            results = [
+                result
+                async for result in client.map(
+                    client.profile,
+                    symbols,
+                    concurrency=2,
+                    progress=lambda done, total: progress.append((done, total)),
+                )
+            ]
+
+        by_symbol = {result.symbol: result for result in results}
+        assert sorted(by_symbol) == ["AAPL", "MISSING", "MSFT"]
+        assert by_symbol["AAPL"].value == [{"symbol": "AAPL"}]
+        assert by_symbol["AAPL"].error is None
+        assert isinstance(by_symbol["MISSING"].error, FMPNotFoundError)
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    @pytest.mark.asyncio
+    async def test_map_limits_concurrency(self, api_key):
+        """Test that at most ``concurrency`` calls run at once."""
+        running = 0
+        peak = 0
+
+        async def fetch(*, symbol: str, limit: int) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return f"{symbol}:{limit}"
+
+        client = AsyncFMPClient(api_key)
+        values = [
+            r.value
+            async for r in client.map(
+                fetch, map(str, range(10)), concurrency=3, limit=4
+            )
+        ]
+        await client.aclose()
+
+        assert peak == 3
+        assert sorted(values) == sorted(f"{i}:4" for i in range(10))
+
+    @pytest.mark.asyncio
+    async def test_map_all(self, api_key, mock_transport):
+        """Test aggregated results in request order and errors by symbol."""
+        async with httpx.AsyncClient(
+            transport=mock_transport(profile_handler)
+        ) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            results, errors = await client.map_all(
+                client.profile, ["MSFT", "MISSING", "AAPL"]
+            )
+
+        assert list(results) == ["MSFT", "AAPL"]
+        assert list(errors) == ["MISSING"]
+
+    @pytest.mark.asyncio
+    async def test_map_cancels_on_early_exit(self, api_key):
+        """Test that breaking out of the loop cancels calls still running."""
+        cancelled: list[str] = []
+
+        async def fetch(*, symbol: str) -> str:
+            if symbol != "A":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(symbol)
+                    raise
+            return symbol
+
+        client = AsyncFMPClient(api_key)
+        results = client.map(fetch, ["A", "B", "C"], concurrency=2)
+        async for result in results:
+            assert result.symbol == "A"
+            break
+        await results.aclose()
+        await client.aclose()
+
+        assert cancelled == ["B"]
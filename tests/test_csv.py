@@ -0,0 +1,214 @@
+"""Tests for streaming CSV parsing of bulk endpoints."""
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, FMPAPIError
+from fmp_py_client._csv import CSVRowParser
+from fmp_py_client.models import CompanyProfile, EODFull
+
+EOD_CSV = (
+    '"symbol","date","open","high","low","close","adjClose","volume"\r\n'
+    '"AAPL","2024-01-02","187.15","188.44","183.89","185.64","185.64","82488700"\r\n'
+    '"MSFT","2024-01-02","373.86","375.90","366.77","370.87","","25258600"\r\n'
+)
+
+
+def parse_in_chunks(text: str, size: int, model: type = EODFull) -> list[dict]:
+    parser = CSVRowParser(model)
+    rows = []
+    for start in range(0, len(text), size):
+        rows.extend(parser.feed(text[start : start + size]))
+    rows.extend(parser.close())
+    return rows
+
+
+class TestCSVRowParser:
+    """Tests for CSVRowParser."""
+
+    def test_typed_rows(self):
+        """Test that fields are converted per the model."""
+        rows = parse_in_chunks(EOD_CSV, len(EOD_CSV))
+
+        assert rows[0] == {
+            "symbol": "AAPL",
+            "date": "2024-01-02",
+            "open": 187.15,
+            "high": 188.44,
+            "low": 183.89,
+            "close": 185.64,
+            "adjClose": 185.64,
+            "volume": 82488700,
+        }
+        assert rows[1]["adjClose"] is None
+
+    @pytest.mark.parametrize("size", [1, 7, 64])
+    def test_arbitrary_chunk_boundaries(self, size):
+        """Test that rows are identical however the text is split."""
+        assert parse_in_chunks(EOD_CSV, size) == parse_in_chunks(EOD_CSV, 4096)
+
+    def test_quoted_newlines_and_commas(self):
+        """Test quoted fields spanning lines and containing commas."""
+        text = (
+            "symbol,companyName,description,price\n"
+            'AAPL,"Apple, Inc.","Designs phones.\nAnd ""Macs"".",185.5\n'
+            "MSFT,Microsoft,Software,370\n"
+        )
+
+        rows = parse_in_chunks(text, 5, CompanyProfile)
+
+        assert rows[0]["companyName"] == "Apple, Inc."
+        assert rows[0]["description"] == 'Designs phones.\nAnd "Macs".'
+        assert rows[1]["price"] == 370.0
+
+    def test_bom_and_missing_final_newline(self):
+        """Test a leading byte order mark and an unterminated last row."""
+        rows = parse_in_chunks("\ufeffsymbol,volume\nAAPL,1.5E7", 3)
+
+        assert rows == [{"symbol": "AAPL", "volume": 15000000}]
+
+    def test_unknown_columns_and_bad_numbers(self):
+        """Test that extra columns and unparsable numbers are kept as text."""
+        rows = parse_in_chunks("symbol,close,exchange\nAAPL,n/a,NASDAQ\n", 100)
+
+        assert rows == [{"symbol": "AAPL", "close": "n/a", "exchange": "NASDAQ"}]
+
+
+class TestStreamCSV:
+    """Tests for the streaming bulk methods."""
+
+    @pytest.mark.asyncio
+    async def test_iter_eod_bulk(self, api_key, mock_transport):
+        """Test streaming rows from a bulk CSV response."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "/stable/eod-bulk" in str(request.url)
+            assert request.url.params["date"] == "2024-01-02"
+            return httpx.Response(200, text=EOD_CSV)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            rows = [row async for row in client.iter_eod_bulk(date="2024-01-02")]
+
+        assert [row["symbol"] for row in rows] == ["AAPL", "MSFT"]
+        assert rows[1]["close"] == 370.87
+
+    @pytest.mark.asyncio
+    async def test_iter_statement_bulk(self, api_key, mock_transport):
+        """Test that statement bulk methods stream with their params."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "/stable/income-statement-bulk" in str(request.url)
+            assert request.url.params["year"] == "2023"
+            return httpx.Response(200, text="symbol,revenue\nAAPL,383285000000\n")
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            rows = [row async for row in client.iter_income_statement_bulk(year=2023)]
+
+        assert rows == [{"symbol": "AAPL", "revenue": 383285000000}]
+
+    @pytest.mark.asyncio
+    async def test_error_status(self, api_key, mock_transport):
+        """Test that error responses raise the usual exceptions."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, text="error")
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            with pytest.raises(FMPAPIError):
+                async for _ in client.iter_dcf_bulk():
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_stream_columns(self, api_key, mock_transport):
+        """Test consuming a stream in batches of columns."""
+        np = pytest.importorskip("numpy")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=EOD_CSV)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            batches = [
+                batch
+                async for batch in client.stream_columns(
+                    client.iter_eod_bulk, date="2024-01-02", batch_size=1
+                )
+            ]
+
+        assert len(batches) == 2
+        assert batches[0]["volume"].dtype == np.int64
+        assert batches[1]["symbol"].tolist() == ["MSFT"]
+
+
+def parts_handler(parts: list[str], seen: list[str] | None = None):
+    """Serve numbered CSV parts, then header-only parts."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        part = int(request.url.params["part"])
+        if seen is not None:
+            seen.append(request.url.path)
+        body = parts[part] if part < len(parts) else "symbol,price\n"
+        return httpx.Response(200, text=body)
+
+    return handler
+
+
+PARTS = [
+    "symbol,price\nAAPL,185.5\nMSFT,370\n",
+    "symbol,price\nNVDA,495.2\n",
+    "symbol,price\nTSLA,248.4\n",
+]
+
+
+class TestBulkParts:
+    """Tests for the multi-part bulk helpers."""
+
+    @pytest.mark.asyncio
+    async def test_iter_profile_bulk_all(self, api_key, mock_transport):
+        """Test that every part is streamed in order."""
+        seen: list[str] = []
+        transport = mock_transport(parts_handler(PARTS, seen))
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            rows = [row async for row in client.iter_profile_bulk_all(concurrency=2)]
+
+        assert [row["symbol"] for row in rows] == ["AAPL", "MSFT", "NVDA", "TSLA"]
+        assert rows[2]["price"] == 495.2
+        assert set(seen) == {"/stable/profile-bulk"}
+
+    @pytest.mark.asyncio
+    async def test_download_etf_holder_bulk(self, api_key, mock_transport, tmp_path):
+        """Test that parts are merged into one file with a single header."""
+        transport = mock_transport(parts_handler(PARTS))
+        dest = tmp_path / "out" / "holders.csv"
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            parts = await client.download_etf_holder_bulk(dest, concurrency=3)
+
+        assert parts == 3
+        assert dest.read_text() == (
+            "symbol,price\nAAPL,185.5\nMSFT,370\nNVDA,495.2\nTSLA,248.4\n"
+        )
+        assert [p.name for p in dest.parent.iterdir()] == ["holders.csv"]
+
+    @pytest.mark.asyncio
+    async def test_download_error_cleans_up(self, api_key, mock_transport, tmp_path):
+        """Test that a failed part leaves no partial files behind."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["part"] == "1":
+                return httpx.Response(500, text="error")
+            return httpx.Response(200, text=PARTS[0])
+
+        dest = tmp_path / "profiles.csv"
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            with pytest.raises(FMPAPIError):
+                await client.download_profile_bulk(dest, concurrency=2)
+
+        assert list(tmp_path.iterdir()) == []
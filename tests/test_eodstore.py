@@ -0,0 +1,172 @@
+"""Tests for the local EOD store."""
+
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, EODStore, FMPNotFoundError
+from fmp_py_client._eodstore import trading_days
+
+HOLIDAYS = ["2024-01-01", "2024-01-15"]
+
+
+def bar(symbol: str, day: str, close: float = 100.0) -> dict:
+    return {
+        "symbol": symbol,
+        "date": day,
+        "open": close,
+        "high": close,
+        "low": close,
+        "close": close,
+        "volume": 1000,
+    }
+
+
+class FakeAPI:
+    """Serve EOD history, holidays and bulk files from in-memory bars."""
+
+    def __init__(self, bars: dict[str, list[str]]):
+        self.bars = bars
+        self.close = 100.0
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        params = request.url.params
+        if path.endswith("/holidays-by-exchange"):
+            return httpx.Response(200, json=[{"date": day} for day in HOLIDAYS])
+        if path.endswith("/eod-bulk"):
+            lines = ["symbol,date,open,high,low,close,volume"]
+            for symbol, days in self.bars.items():
+                if params["date"] in days:
+                    lines.append(f"{symbol},{params['date']},1,1,1,1,10")
+            return httpx.Response(200, text="\n".join(lines) + "\n")
+        symbol = params["symbol"]
+        if symbol == "MISSING":
+            return httpx.Response(404, text="not found")
+        days = [
+            day
+            for day in self.bars.get(symbol, [])
+            if params.get("from", "") <= day <= params.get("to", "9999")
+        ]
+        return httpx.Response(
+            200, json=[bar(symbol, day, self.close) for day in reversed(days)]
+        )
+
+    def history_requests(self) -> list[tuple[str, str, str]]:
+        return [
+            (r.url.params["symbol"], r.url.params["from"], r.url.params["to"])
+            for r in self.requests
+            if "historical-price-eod" in r.url.path
+        ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EODStore(tmp_path / "eod.db")
+    yield store
+    store.close()
+
+
+class TestTradingDays:
+    """Tests for trading_days."""
+
+    def test_skips_weekends_and_holidays(self):
+        """Test that weekends and holidays are excluded."""
+        days = trading_days("2023-12-29", "2024-01-03", HOLIDAYS)
+
+        assert days == ["2023-12-29", "2024-01-02", "2024-01-03"]
+
+
+class TestEODStore:
+    """Tests for EODStore."""
+
+    @pytest.mark.asyncio
+    async def test_update_fetches_only_tail(self, api_key, mock_transport, store):
+        """Test that a second update only requests bars from the last date on."""
+        api = FakeAPI({"AAPL": ["2024-01-02", "2024-01-03"]})
+        today = datetime.now(UTC).date().isoformat()
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            first, _ = await store.update(client, ["AAPL"], start="2024-01-01")
+            api.bars["AAPL"].append("2024-01-04")
+            second, _ = await store.update(client, ["AAPL"])
+
+        assert first == {"AAPL": 2}
+        assert second == {"AAPL": 2}
+        assert api.history_requests()[-1] == ("AAPL", "2024-01-03", today)
+        bars = await store.load("AAPL")
+        assert [b["date"] for b in bars] == ["2024-01-02", "2024-01-03", "2024-01-04"]
+        assert await store.last_date("AAPL") == "2024-01-04"
+
+    @pytest.mark.asyncio
+    async def test_update_replaces_last_bar(self, api_key, mock_transport, store):
+        """Test that a bar stored during the day is replaced by the final one."""
+        api = FakeAPI({"AAPL": ["2024-01-02"]})
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            await store.update(client, ["AAPL"], start="2024-01-01")
+            api.close = 101.0
+            await store.update(client, ["AAPL"])
+
+        bars = await store.load("AAPL")
+        assert [(b["date"], b["close"]) for b in bars] == [("2024-01-02", 101.0)]
+
+    @pytest.mark.asyncio
+    async def test_update_collects_errors(self, api_key, mock_transport, store):
+        """Test that a failing symbol is reported without stopping the others."""
+        api = FakeAPI({"AAPL": ["2024-01-02"], "MSFT": ["2024-01-02"]})
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            written, errors = await store.update(
+                client, ["AAPL", "MISSING", "MSFT"], start="2024-01-01"
+            )
+
+        assert written == {"AAPL": 1, "MSFT": 1}
+        assert list(errors) == ["MISSING"]
+        assert isinstance(errors["MISSING"], FMPNotFoundError)
+        assert await store.symbols() == ["AAPL", "MSFT"]
+
+    @pytest.mark.asyncio
+    async def test_update_from_bulk(self, api_key, mock_transport, store):
+        """Test appending a day for stored symbols from one bulk call."""
+        api = FakeAPI({"AAPL": ["2024-01-02"], "MSFT": ["2024-01-02"]})
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            await store.update(client, ["AAPL"], start="2024-01-01")
+            api.bars["AAPL"].append("2024-01-03")
+            api.bars["MSFT"].append("2024-01-03")
+            written = await store.update_from_bulk(client, date="2024-01-03")
+
+        assert written == 1
+        assert await store.symbols() == ["AAPL"]
+        assert await store.last_date("AAPL") == "2024-01-03"
+
+    @pytest.mark.asyncio
+    async def test_backfill_gaps(self, api_key, mock_transport, store):
+        """Test that missing trading days are detected and refetched once."""
+        full = ["2024-01-10", "2024-01-11", "2024-01-12", "2024-01-16"]
+        api = FakeAPI({"AAPL": ["2024-01-09", "2024-01-17"]})
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            await store.update(client, ["AAPL"], start="2024-01-01")
+            assert await store.find_gaps("AAPL", HOLIDAYS) == [
+                ("2024-01-10", "2024-01-16")
+            ]
+
+            api.bars["AAPL"] += full[:3]  # 2024-01-16 has no bar upstream
+            written, errors = await store.backfill(client)
+            again, _ = await store.backfill(client)
+
+        assert written == {"AAPL": 3}
+        assert errors == {}
+        assert again == {}
+        assert api.history_requests()[-1] == ("AAPL", "2024-01-10", "2024-01-16")
+        assert await store.find_gaps("AAPL", HOLIDAYS) == []
@@ -0,0 +1,202 @@
+"""Tests for the local technical indicator engine."""
+
+from typing import get_type_hints
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fmp_py_client import indicators
+from fmp_py_client.models import (
+    TechnicalIndicatorADX,
+    TechnicalIndicatorMA,
+    TechnicalIndicatorRSI,
+    TechnicalIndicatorStdDev,
+    TechnicalIndicatorWilliams,
+)
+
+# Wilder's RSI worked example (14 periods).
+WILDER_CLOSES = [
+    44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84, 46.08,
+    45.89, 46.03, 45.61, 46.28, 46.28, 46.00, 46.03, 46.41, 46.22, 45.64,
+]  # fmt: skip
+WILDER_RSI = [70.46, 66.25, 66.48, 69.35, 66.29, 57.92]
+
+
+def make_bars(count: int = 60) -> list[dict]:
+    """Return deterministic daily bars, newest first like the API."""
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1, count))
+    bars = []
+    for i, price in enumerate(close):
+        bars.append(
+            {
+                "symbol": "AAPL",
+                "date": f"2024-{1 + i // 28:02d}-{1 + i % 28:02d}",
+                "open": price - 0.5,
+                "high": price + 1.0 + rng.random(),
+                "low": price - 1.0 - rng.random(),
+                "close": price,
+                "volume": 1000 + i,
+            }
+        )
+    return bars[::-1]
+
+
+def naive_ema(values: list[float], n: int) -> list[float]:
+    out = [sum(values[:n]) / n]
+    for value in values[n:]:
+        out.append(out[-1] + 2 / (n + 1) * (value - out[-1]))
+    return out
+
+
+class TestArrayIndicators:
+    """Tests for the array indicator functions."""
+
+    def test_sma_and_wma(self):
+        """Test simple and weighted moving averages."""
+        close = np.array([1.0, 2.0, 3.0, 4.0])
+
+        assert np.isnan(indicators.sma(close, 3)[:2]).all()
+        assert indicators.sma(close, 3)[2:].tolist() == [2.0, 3.0]
+        assert indicators.wma(close, 3)[3] == pytest.approx((2 + 6 + 12) / 6)
+
+    def test_ema_matches_reference(self):
+        """Test the EMA against a straightforward implementation."""
+        close = [row["close"] for row in make_bars()[::-1]]
+
+        result = indicators.ema(np.array(close), 10)
+
+        assert np.isnan(result[:9]).all()
+        assert result[9:] == pytest.approx(naive_ema(close, 10))
+
+    def test_dema_tema_remove_lag_on_linear_series(self):
+        """Test that DEMA and TEMA track a straight line exactly."""
+        close = np.arange(1.0, 31.0)
+
+        assert indicators.dema(close, 5)[-1] == pytest.approx(30.0)
+        assert indicators.tema(close, 5)[-1] == pytest.approx(30.0)
+        assert np.isnan(indicators.dema(close, 5)[7])
+
+    def test_rsi_wilder_example(self):
+        """Test RSI against Wilder's worked example."""
+        result = indicators.rsi(np.array(WILDER_CLOSES), 14)
+
+        assert np.isnan(result[:14]).all()
+        assert result[14:] == pytest.approx(WILDER_RSI, abs=0.01)
+
+    def test_rsi_without_losses(self):
+        """Test that a series without losses has an RSI of 100."""
+        assert indicators.rsi(np.arange(1.0, 10.0), 3)[-1] == 100.0
+
+    def test_standard_deviation(self):
+        """Test the rolling population standard deviation."""
+        close = np.array([2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0])
+
+        assert indicators.standard_deviation(close, 8)[-1] == pytest.approx(2.0)
+
+    def test_williams(self):
+        """Test Williams %R at the period high, low and midpoint."""
+        high = np.array([10.0, 12.0, 11.0, 11.0])
+        low = np.array([8.0, 9.0, 8.0, 10.0])
+        close = np.array([9.0, 12.0, 8.0, 9.5])
+
+        result = indicators.williams(high, low, close, 2)
+
+        assert result[1:].tolist() == [-0.0, -100.0, -50.0]
+
+    def test_adx_trending_series(self):
+        """Test that a steady uptrend has a high, bounded ADX."""
+        base = np.arange(40.0)
+
+        result = indicators.adx(base + 1, base - 1, base, 5)
+
+        assert np.isnan(result[:9]).all()
+        assert result[-1] == pytest.approx(100.0)
+
+    @pytest.mark.parametrize(
+        "name", ["sma", "ema", "wma", "dema", "tema", "rsi", "standard_deviation"]
+    )
+    def test_2d_matches_columns(self, name):
+        """Test that each column of a 2-D input matches the 1-D result."""
+        function = getattr(indicators, name)
+        bars = indicators.prices(make_bars())
+        close = np.column_stack([bars["close"], bars["close"][::-1]])
+        # A shorter history, left-padded with NaN.
+        close = np.column_stack([close, np.r_[np.full(20, np.nan), close[20:, 0]]])
+
+        result = function(close, 5)
+
+        assert result.shape == close.shape
+        for j in range(3):
+            valid = ~np.isnan(close[:, j])
+            expected = np.full(len(close), np.nan)
+            expected[valid] = function(close[valid, j], 5)
+            np.testing.assert_allclose(result[:, j], expected)
+
+    def test_2d_high_low_indicators(self):
+        """Test Williams %R and ADX across several symbols at once."""
+        bars = indicators.prices(make_bars())
+        high, low, close = (
+            np.column_stack([bars[field], bars[field] * 2])
+            for field in ("high", "low", "close")
+        )
+
+        for function in (indicators.williams, indicators.adx):
+            result = function(high, low, close, 5)
+            expected = function(bars["high"], bars["low"], bars["close"], 5)
+            np.testing.assert_allclose(result[:, 0], expected)
+            assert result.shape == close.shape
+
+    def test_invalid_period(self):
+        """Test that period lengths below one are rejected."""
+        with pytest.raises(ValueError):
+            indicators.sma(np.array([1.0]), 0)
+
+
+class TestCompute:
+    """Tests for compute."""
+
+    @pytest.mark.parametrize(
+        ("indicator", "model"),
+        [
+            ("sma", TechnicalIndicatorMA),
+            ("ema", TechnicalIndicatorMA),
+            ("wma", TechnicalIndicatorMA),
+            ("dema", TechnicalIndicatorMA),
+            ("tema", TechnicalIndicatorMA),
+            ("rsi", TechnicalIndicatorRSI),
+            ("standard_deviation", TechnicalIndicatorStdDev),
+            ("williams", TechnicalIndicatorWilliams),
+            ("adx", TechnicalIndicatorADX),
+        ],
+    )
+    def test_rows_match_api_shape(self, indicator, model):
+        """Test that rows carry the API's fields, newest first."""
+        bars = make_bars()
+
+        rows = indicators.compute(bars, indicator, 5)
+
+        assert rows
+        assert set(rows[0]) <= set(get_type_hints(model))
+        assert indicators.FIELDS[indicator] in rows[0]
+        assert rows[0]["date"] == bars[0]["date"]
+        assert [row["date"] for row in rows] == sorted(
+            (row["date"] for row in rows), reverse=True
+        )
+        assert isinstance(rows[0]["volume"], int)
+
+    def test_sma_values(self):
+        """Test that row values equal the array computation."""
+        bars = make_bars()
+        close = indicators.prices(bars)["close"]
+
+        rows = indicators.compute(bars, "sma", 10)
+
+        assert len(rows) == len(bars) - 9
+        assert rows[0]["sma"] == pytest.approx(close[-10:].mean())
+
+    def test_unknown_indicator(self):
+        """Test that unknown indicator names are rejected."""
+        with pytest.raises(ValueError):
+            indicators.compute(make_bars(), "macd", 5)  # type: ignore[arg-type]
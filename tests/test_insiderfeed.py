@@ -0,0 +1,122 @@
+"""Tests for the incremental insider trading feed."""
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, InsiderFeed
+
+
+def trade(filed: str, cik: str, shares: int = 100) -> dict:
+    return {
+        "symbol": "AAPL",
+        "filingDate": filed,
+        "transactionDate": filed[:10],
+        "reportingCik": cik,
+        "transactionType": "S-Sale",
+        "reportingName": f"Insider {cik}",
+        "securitiesTransacted": shares,
+        "price": 190.0,
+        "link": f"https://www.sec.gov/Archives/{cik}-{filed[:10]}.txt",
+    }
+
+
+class FakeFeed:
+    """Serve insider_trading_latest pages, newest first."""
+
+    def __init__(self, trades: list[dict]):
+        self.trades = trades
+        self.pages: list[int] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        limit = int(request.url.params["limit"])
+        self.pages.append(page)
+        rows = sorted(
+            self.trades, key=lambda t: t.get("filingDate") or "", reverse=True
+        )
+        return httpx.Response(200, json=rows[page * limit : (page + 1) * limit])
+
+
+class TestInsiderFeed:
+    """Tests for InsiderFeed."""
+
+    @pytest.mark.asyncio
+    async def test_poll_returns_only_new_trades(self, api_key, mock_transport):
+        """Test that later polls stop at the watermark and skip seen rows."""
+        api = FakeFeed([trade(f"2024-01-0{d} 10:00:00", str(d)) for d in range(1, 6)])
+        feed = InsiderFeed(limit=2)
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            first = await feed.poll(client)
+            api.pages.clear()
+            empty = await feed.poll(client)
+            api.trades += [
+                trade("2024-01-05 10:00:00", "6"),  # same time as the watermark
+                trade("2024-01-06 09:00:00", "7"),
+                trade("2024-01-06 11:00:00", "8"),
+            ]
+            new = await feed.poll(client)
+
+        assert [t["reportingCik"] for t in first] == ["4", "5"]
+        assert empty == []
+        assert api.pages == [0, 0, 1]
+        assert [t["reportingCik"] for t in new] == ["6", "7", "8"]
+        assert feed.watermark == "2024-01-06 11:00:00"
+
+    @pytest.mark.asyncio
+    async def test_watermark_persists(self, api_key, mock_transport, tmp_path):
+        """Test that a restarted feed resumes from the saved watermark."""
+        path = tmp_path / "feed" / "insider.json"
+        api = FakeFeed([trade("2024-01-02 10:00:00", "1")])
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            await InsiderFeed(path).poll(client)
+            api.trades.append(trade("2024-01-03 10:00:00", "2"))
+            restarted = InsiderFeed(path)
+            new = await restarted.poll(client)
+
+        assert restarted.watermark == "2024-01-03 10:00:00"
+        assert [t["reportingCik"] for t in new] == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_keeps_watermark_until_reached(self, api_key, mock_transport):
+        """Test that a walk cut off by max_pages loses no trades."""
+        api = FakeFeed([trade("2024-01-01 10:00:00", "0")])
+        feed = InsiderFeed(limit=2, max_pages=2)
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            await feed.poll(client)
+            api.trades += [trade(f"2024-01-0{d} 10:00:00", str(d)) for d in range(2, 8)]
+            with pytest.warns(RuntimeWarning, match="max_pages"):
+                newest = await feed.poll(client)
+            assert feed.watermark == "2024-01-01 10:00:00"
+
+            feed.max_pages = 5
+            rest = await feed.poll(client)
+
+        assert [t["reportingCik"] for t in newest] == ["4", "5", "6", "7"]
+        assert [t["reportingCik"] for t in rest] == ["2", "3"]
+        assert feed.watermark == "2024-01-07 10:00:00"
+
+    @pytest.mark.asyncio
+    async def test_skips_rows_without_filing_date(self, api_key, mock_transport):
+        """Test that rows missing filingDate are ignored."""
+        api = FakeFeed([trade("2024-01-02 10:00:00", "1")])
+        feed = InsiderFeed()
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            await feed.poll(client)
+            api.trades.append({**trade("2024-01-03 09:00:00", "2"), "filingDate": None})
+            api.trades.append(trade("2024-01-03 10:00:00", "3"))
+            new = await feed.poll(client)
+
+        assert [t["reportingCik"] for t in new] == ["3"]
+
+    def test_invalid_limit(self):
+        """Test that empty pages are rejected."""
+        with pytest.raises(ValueError):
+            InsiderFeed(limit=0)
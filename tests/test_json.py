@@ -0,0 +1,68 @@
+"""Tests for the JSON decoding module."""
+
+import json
+import sys
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient
+from fmp_py_client._json import get_decoder
+
+BODY = b'[{"symbol": "AAPL", "price": 150.25, "volume": 1000, "name": "Apple \\u00e9"}]'
+EXPECTED = [{"symbol": "AAPL", "price": 150.25, "volume": 1000, "name": "Apple é"}]
+
+
+class TestGetDecoder:
+    """Tests for get_decoder."""
+
+    def test_stdlib(self):
+        """Test the standard library decoder."""
+        assert get_decoder("json") is json.loads
+        assert get_decoder("json")(BODY) == EXPECTED
+
+    @pytest.mark.parametrize("name", ["orjson", "msgspec"])
+    def test_fast_decoders(self, name):
+        """Test that fast decoders produce the same result as the stdlib."""
+        pytest.importorskip(name)
+
+        assert get_decoder(name)(BODY) == EXPECTED
+
+    def test_auto_prefers_installed_backend(self, monkeypatch):
+        """Test that auto falls back through the backends in order."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+
+        assert get_decoder("auto") is json.loads
+
+    def test_explicit_missing_backend(self, monkeypatch):
+        """Test that requesting an unavailable backend raises ImportError."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        with pytest.raises(ImportError):
+            get_decoder("orjson")
+
+    def test_unknown_decoder(self):
+        """Test that an unknown decoder name is rejected."""
+        with pytest.raises(ValueError):
+            get_decoder("yaml")  # type: ignore[arg-type]
+
+
+class TestClientDecoder:
+    """Tests for decoder selection on the client."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", ["auto", "json"])
+    async def test_client_decodes_body(self, api_key, mock_transport, name):
+        """Test that the selected decoder parses responses."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=BODY)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key, httpx_client=http_client, json_decoder=name
+            )
+            result = await client.quote(symbol="AAPL")
+
+        assert result == EXPECTED
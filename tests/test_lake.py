@@ -0,0 +1,149 @@
+"""Tests for the Parquet lake."""
+
+import json
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, FMPAPIError, ParquetLake
+
+pq = pytest.importorskip("pyarrow.parquet")
+ds = pytest.importorskip("pyarrow.dataset")
+
+INCOME_CSV = (
+    "symbol,date,fiscalYear,period,revenue,eps\n"
+    "AAPL,2020-09-26,2020,FY,274515000000,3.31\n"
+    "MSFT,2020-06-30,2020,FY,143015000000,n/a\n"
+)
+EOD_CSV = (
+    "symbol,date,open,high,low,close,volume\n"
+    "AAPL,2024-01-02,187,188,183,185,100\n"
+    "BTCUSD,2024-01-02,42000,43000,41000,42500,1234.5\n"
+)
+
+
+def lake_handler(requests: list[httpx.Request]):
+    """Serve bulk CSV files and record the requests."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/eod-bulk"):
+            return httpx.Response(200, text=EOD_CSV)
+        return httpx.Response(200, text=INCOME_CSV)
+
+    return handler
+
+
+class TestParquetLake:
+    """Tests for ParquetLake."""
+
+    @pytest.mark.asyncio
+    async def test_sync_statements(self, api_key, mock_transport, tmp_path):
+        """Test writing statement partitions Hive-style."""
+        requests: list[httpx.Request] = []
+        lake = ParquetLake(tmp_path)
+
+        async with httpx.AsyncClient(
+            transport=mock_transport(lake_handler(requests))
+        ) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            paths = await lake.sync_statements(
+                client,
+                years=[2020],
+                periods=["annual"],
+                endpoints=["income-statement-bulk"],
+            )
+
+        expected = (
+            tmp_path / "income-statement-bulk/fiscal_year=2020/report_period=annual"
+        )
+        assert paths == [expected / "part-0.parquet"]
+        assert requests[0].url.params["year"] == "2020"
+        table = pq.read_table(paths[0])
+        assert table.column("revenue").to_pylist() == [274515000000, 143015000000]
+        assert table.column("eps").to_pylist() == [3.31, None]
+
+    @pytest.mark.asyncio
+    async def test_rerun_skips_complete_partitions(
+        self, api_key, mock_transport, tmp_path
+    ):
+        """Test that only missing or incomplete partitions are fetched again."""
+        requests: list[httpx.Request] = []
+
+        async with httpx.AsyncClient(
+            transport=mock_transport(lake_handler(requests))
+        ) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            await ParquetLake(tmp_path).sync_eod(client, dates=["2024-01-02"])
+            assert len(requests) == 1
+
+            lake = ParquetLake(tmp_path)
+            await lake.sync_eod(client, dates=["2024-01-02", "2024-01-03"])
+            await lake.sync_eod(client, dates=["2999-01-01"])
+            await lake.sync_eod(client, dates=["2999-01-01"])
+
+        assert [r.url.params["date"] for r in requests] == [
+            "2024-01-02",
+            "2024-01-03",
+            "2999-01-01",
+            "2999-01-01",
+        ]
+        manifest = json.loads((tmp_path / "_manifest.json").read_text())
+        assert manifest["eod-bulk/trade_date=2024-01-02"]["rows"] == 2
+        assert manifest["eod-bulk/trade_date=2999-01-01"]["complete"] is False
+
+    @pytest.mark.asyncio
+    async def test_dataset_scan(self, api_key, mock_transport, tmp_path):
+        """Test that the lake reads back as a partitioned dataset."""
+        lake = ParquetLake(tmp_path)
+
+        async with httpx.AsyncClient(
+            transport=mock_transport(lake_handler([]))
+        ) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            await lake.sync_eod(client, dates=["2024-01-02", "2024-01-03"])
+
+        dataset = ds.dataset(tmp_path / "eod-bulk", partitioning="hive")
+        table = dataset.to_table(filter=ds.field("trade_date") == "2024-01-03")
+        assert table.num_rows == 2
+        assert table.column("date").to_pylist() == ["2024-01-02", "2024-01-02"]
+        assert table.column("volume").to_pylist() == [100.0, 1234.5]
+
+    @pytest.mark.asyncio
+    async def test_dataset_keeps_row_period(self, api_key, mock_transport, tmp_path):
+        """Test that partition keys do not replace the rows' own columns."""
+        lake = ParquetLake(tmp_path)
+
+        async with httpx.AsyncClient(
+            transport=mock_transport(lake_handler([]))
+        ) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            await lake.sync_statements(
+                client,
+                years=[2020],
+                periods=["annual", "quarter"],
+                endpoints=["income-statement-bulk"],
+            )
+
+        dataset = ds.dataset(tmp_path / "income-statement-bulk", partitioning="hive")
+        table = dataset.to_table(filter=ds.field("report_period") == "quarter")
+        assert table.column("period").to_pylist() == ["FY", "FY"]
+        assert table.column("fiscal_year").to_pylist() == [2020, 2020]
+
+    @pytest.mark.asyncio
+    async def test_failed_partition_not_recorded(
+        self, api_key, mock_transport, tmp_path
+    ):
+        """Test that a failed download leaves no file or manifest entry."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, text="error")
+
+        lake = ParquetLake(tmp_path)
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            with pytest.raises(FMPAPIError):
+                await lake.sync_eod(client, dates=["2024-01-02"])
+
+        assert not lake.has_partition("eod-bulk", date="2024-01-02")
+        assert list(tmp_path.rglob("*.parquet*")) == []
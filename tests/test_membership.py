@@ -0,0 +1,106 @@
+"""Tests for point-in-time index membership."""
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, IndexMembership, MembershipPeriod
+
+
+def change(date: str, added: str = "", removed: str = "") -> dict:
+    return {
+        "date": date,
+        "symbol": added,
+        "addedSecurity": f"{added} Inc." if added else "",
+        "removedTicker": removed,
+        "removedSecurity": f"{removed} Inc." if removed else "",
+        "reason": "Market capitalization change.",
+    }
+
+
+class FakeAPI:
+    """Serve current constituents and historical changes for the S&P 500."""
+
+    def __init__(self):
+        self.current = ["A", "B", "D"]
+        self.changes = [
+            change("2020-01-10", added="D", removed="C"),
+            change("2015-05-01", added="B", removed="E"),
+            change("2010-03-01", added="C"),
+        ]
+        self.paths: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        name = request.url.path.rsplit("/", 1)[-1]
+        self.paths.append(name)
+        if name == "sp500-constituent":
+            return httpx.Response(
+                200, json=[{"symbol": s, "name": f"{s} Inc."} for s in self.current]
+            )
+        return httpx.Response(200, json=self.changes)
+
+
+async def build(api: FakeAPI, api_key, mock_transport) -> IndexMembership:
+    async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+        client = AsyncFMPClient(api_key, httpx_client=http_client)
+        return await IndexMembership.build(client, ["sp500"])
+
+
+class TestIndexMembership:
+    """Tests for IndexMembership."""
+
+    @pytest.mark.asyncio
+    async def test_members_on(self, api_key, mock_transport):
+        """Test membership before, on and between change dates."""
+        membership = await build(FakeAPI(), api_key, mock_transport)
+
+        assert membership.members_on("sp500", "2009-12-31") == ["A", "E"]
+        assert membership.members_on("sp500", "2010-03-01") == ["A", "C", "E"]
+        assert membership.members_on("sp500", "2016-01-04") == ["A", "B", "C"]
+        assert membership.members_on("sp500", "2020-01-10") == ["A", "B", "D"]
+        assert membership.is_member("sp500", "C", "2020-01-09")
+        assert not membership.is_member("sp500", "C", "2020-01-10")
+
+    @pytest.mark.asyncio
+    async def test_membership_history(self, api_key, mock_transport):
+        """Test membership periods of added, removed and long-time members."""
+        membership = await build(FakeAPI(), api_key, mock_transport)
+
+        assert membership.membership_history("C") == [
+            MembershipPeriod("sp500", "2010-03-01", "2020-01-10")
+        ]
+        assert membership.membership_history("A") == [
+            MembershipPeriod("sp500", None, None)
+        ]
+        assert membership.membership_history("E") == [
+            MembershipPeriod("sp500", None, "2015-05-01")
+        ]
+        assert membership.membership_history("ZZZ") == []
+
+    @pytest.mark.asyncio
+    async def test_refresh_and_persist(self, api_key, mock_transport, tmp_path):
+        """Test that refresh applies new changes and survives a save/load."""
+        api = FakeAPI()
+        membership = await build(api, api_key, mock_transport)
+        path = tmp_path / "membership.json"
+        membership.save(path)
+
+        loaded = IndexMembership.load(path)
+        api.current = ["A", "B", "F"]
+        api.changes.insert(0, change("2024-03-18", added="F", removed="D"))
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            counts = await loaded.refresh(client)
+            again = await loaded.refresh(client)
+
+        assert counts == {"sp500": 1}
+        assert again == {"sp500": 0}
+        assert loaded.members_on("sp500", "2024-03-18") == ["A", "B", "F"]
+        assert loaded.members_on("sp500", "2016-01-04") == ["A", "B", "C"]
+        assert loaded.membership_history("D") == [
+            MembershipPeriod("sp500", "2020-01-10", "2024-03-18")
+        ]
+
+    def test_unknown_index(self):
+        """Test that unloaded indexes are reported."""
+        with pytest.raises(KeyError):
+            IndexMembership().members_on("sp500", "2024-01-02")
@@ -0,0 +1,157 @@
+"""Tests for the polling news stream."""
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, FMPAuthenticationError, NewsStream
+from fmp_py_client._newsstream import SeenSet, article_keys
+
+CLOCK_MODULES = ("fmp_py_client._newsstream",)
+
+
+def article(title: str, published: str, url: str | None = None) -> dict:
+    return {
+        "publishedDate": published,
+        "title": title,
+        "site": "example.com",
+        "text": "",
+        "url": url or f"https://example.com/{title.lower().replace(' ', '-')}",
+    }
+
+
+class FakeFeeds:
+    """Serve scripted pages per feed; each poll takes the next page."""
+
+    def __init__(self, pages: dict[str, list[list[dict]]]):
+        self.pages = pages
+        self.polls: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        feed = request.url.path.rsplit("/", 1)[-1]
+        self.polls.append(feed)
+        script = self.pages[feed]
+        page = script.pop(0) if len(script) > 1 else script[0]
+        if page == "unauthorized":
+            return httpx.Response(401, text="bad key")
+        return httpx.Response(200, json=page)
+
+
+async def take(stream, client, count: int) -> list[dict]:
+    items = []
+    async for item in stream.stream(client):
+        items.append(item)
+        if len(items) == count:
+            break
+    return items
+
+
+class TestSeenSet:
+    """Tests for SeenSet."""
+
+    def test_evicts_oldest(self):
+        """Test that the set stays bounded, evicting the oldest key."""
+        seen = SeenSet(2)
+        for key in (b"a", b"b", b"c"):
+            seen.add(key)
+
+        assert len(seen) == 2
+        assert b"a" not in seen
+        assert b"c" in seen
+
+    def test_article_keys_normalize(self):
+        """Test that URL slashes and title case do not change the keys."""
+        first = article("Fed Holds Rates", "2024-01-02", url="https://x.com/a/")
+        second = article("fed  holds rates", "2024-01-02", url="https://x.com/a")
+
+        assert article_keys(first) == article_keys(second)
+
+
+class TestNewsStream:
+    """Tests for NewsStream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_fresh_deduplicated_in_publish_order(
+        self, api_key, mock_transport, fake_clock
+    ):
+        """Test backlog skipping, cross-feed dedupe and publish ordering."""
+        old = article("Old story", "2024-01-02 08:00:00")
+        merger = article("Merger announced", "2024-01-02 09:30:00")
+        api = FakeFeeds(
+            {
+                "general-latest": [
+                    [old],
+                    [article("Markets open", "2024-01-02 09:31:00"), merger, old],
+                ],
+                "press-releases-latest": [
+                    [],
+                    [
+                        article(
+                            "Merger Announced", "2024-01-02 09:30:00", url="https://pr"
+                        ),
+                        article("Earnings release", "2024-01-02 09:00:00"),
+                    ],
+                ],
+            }
+        )
+        stream = NewsStream(["general", "press_releases"], min_interval=5.0)
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            items = await take(stream, client, 3)
+
+        assert [item["title"] for item in items] == [
+            "Earnings release",
+            "Merger announced",
+            "Markets open",
+        ]
+        assert fake_clock.sleeps == [5.0]
+
+    @pytest.mark.asyncio
+    async def test_adaptive_intervals(self, api_key, mock_transport, fake_clock):
+        """Test that quiet feeds slow down and busy feeds speed up."""
+        api = FakeFeeds(
+            {
+                "crypto-latest": [[article("A", "1")], [article("A", "1")]],
+                "forex-latest": [
+                    [article("B", "1")],
+                    [article("C", "2")],
+                    [article("D", "3")],
+                ],
+            }
+        )
+        stream = NewsStream(["crypto", "forex"], min_interval=4.0, max_interval=10.0)
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            await take(stream, client, 2)
+
+        assert stream.intervals == {"crypto": 6.0, "forex": 4.0}
+
+    @pytest.mark.asyncio
+    async def test_backlog(self, api_key, mock_transport, fake_clock):
+        """Test that backlog=True yields the articles already on the feed."""
+        api = FakeFeeds({"fmp-articles": [[{"title": "T", "date": "1", "link": "L"}]]})
+        stream = NewsStream(["articles"], backlog=True)
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            items = await take(stream, client, 1)
+
+        assert items[0]["link"] == "L"
+
+    @pytest.mark.asyncio
+    async def test_authentication_error_is_raised(
+        self, api_key, mock_transport, fake_clock
+    ):
+        """Test that an invalid API key stops the stream."""
+        api = FakeFeeds({"stock-latest": ["unauthorized"]})
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            with pytest.raises(FMPAuthenticationError):
+                await take(NewsStream(["stock"]), client, 1)
+
+    def test_unknown_feed(self):
+        """Test that unknown feed names are rejected."""
+        with pytest.raises(ValueError):
+            NewsStream(["weather"])
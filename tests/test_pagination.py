@@ -0,0 +1,236 @@
+"""Tests for the pagination module."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient
+from fmp_py_client._pagination import fetch_parts, paginate
+
+
+class FakeEndpoint:
+    """Page/limit endpoint backed by a list of rows."""
+
+    def __init__(self, total: int, page_size: int = 3):
+        self.rows = list(range(total))
+        self.page_size = page_size
+        self.pages: list[int] = []
+        self.params: list[dict] = []
+
+    async def __call__(self, *, page: int, limit: int | None = None, **params):
+        self.pages.append(page)
+        self.params.append(params)
+        await asyncio.sleep(0)
+        size = limit or self.page_size
+        return self.rows[page * size : (page + 1) * size]
+
+
+async def collect(iterator) -> list:
+    return [row async for row in iterator]
+
+
+class TestPaginate:
+    """Tests for paginate."""
+
+    @pytest.mark.asyncio
+    async def test_stops_on_short_page(self):
+        """Test that iteration ends after a page shorter than the limit."""
+        endpoint = FakeEndpoint(total=7)
+
+        rows = await collect(paginate(endpoint, limit=3, prefetch=0))
+
+        assert rows == list(range(7))
+        assert endpoint.pages == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_stops_on_empty_page(self):
+        """Test that iteration ends at an empty page."""
+        endpoint = FakeEndpoint(total=6)
+
+        rows = await collect(paginate(endpoint, limit=3, prefetch=0))
+
+        assert rows == list(range(6))
+        assert endpoint.pages == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_infers_page_size_without_limit(self):
+        """Test that the first page size is used when no limit is given."""
+        endpoint = FakeEndpoint(total=5, page_size=2)
+
+        rows = await collect(paginate(endpoint, prefetch=0))
+
+        assert rows == list(range(5))
+        assert endpoint.pages == [0, 1, 2]
+        assert "limit" not in endpoint.params[0]
+
+    @pytest.mark.asyncio
+    async def test_prefetches_ahead(self):
+        """Test that following pages are requested before the first is consumed."""
+        endpoint = FakeEndpoint(total=30)
+        iterator = paginate(endpoint, limit=3, prefetch=2)
+
+        first = await anext(iterator)
+        await asyncio.sleep(0)
+
+        assert first == 0
+        assert endpoint.pages[:3] == [0, 1, 2]
+        await iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_read_ahead(self):
+        """Test that closing early cancels outstanding page requests."""
+        started = []
+        finished = []
+
+        async def slow(*, page: int, limit: int):
+            started.append(page)
+            await asyncio.sleep(0 if page == 0 else 10)
+            finished.append(page)
+            return [page] * limit
+
+        iterator = paginate(slow, limit=2, prefetch=3)
+        assert await anext(iterator) == 0
+        await iterator.aclose()
+
+        assert started == [0, 1, 2, 3]
+        assert finished == [0]
+
+    @pytest.mark.asyncio
+    async def test_passes_params_and_start_page(self):
+        """Test that extra params and start_page are forwarded."""
+        endpoint = FakeEndpoint(total=9)
+
+        rows = await collect(
+            paginate(endpoint, limit=3, start_page=2, prefetch=1, symbol="AAPL")
+        )
+
+        assert rows == [6, 7, 8]
+        assert endpoint.pages[0] == 2
+        assert endpoint.params[0] == {"symbol": "AAPL"}
+
+    @pytest.mark.asyncio
+    async def test_error_propagates(self):
+        """Test that a failing page request raises from the iterator."""
+
+        async def failing(*, page: int, limit: int):
+            if page == 1:
+                raise RuntimeError("boom")
+            return [page] * limit
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await collect(paginate(failing, limit=2, prefetch=1))
+
+    @pytest.mark.asyncio
+    async def test_invalid_prefetch(self):
+        """Test that a negative prefetch is rejected."""
+        with pytest.raises(ValueError):
+            await collect(paginate(FakeEndpoint(total=1), prefetch=-1))
+
+
+class TestIterMethods:
+    """Tests for the iter_* client methods."""
+
+    @pytest.mark.asyncio
+    async def test_iter_insider_trading_latest(self, api_key, mock_transport):
+        """Test iterating over insider trades until a short page."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "/stable/insider-trading/latest" in str(request.url)
+            page = int(request.url.params["page"])
+            assert request.url.params["limit"] == "2"
+            rows = [{"page": page}] * (2 if page < 2 else 1)
+            return httpx.Response(200, json=rows)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            rows = await collect(client.iter_insider_trading_latest(limit=2))
+
+        assert [row["page"] for row in rows] == [0, 0, 1, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_iter_sec_filings_search_symbol(self, api_key, mock_transport):
+        """Test that endpoint filters are sent with every page request."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(dict(request.url.params))
+            return httpx.Response(200, json=[])
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            rows = await collect(
+                client.iter_sec_filings_search_symbol(
+                    symbol="AAPL", from_date="2024-01-01", prefetch=0
+                )
+            )
+
+        assert rows == []
+        assert seen[0]["symbol"] == "AAPL"
+        assert seen[0]["from"] == "2024-01-01"
+        assert seen[0]["page"] == "0"
+
+    @pytest.mark.asyncio
+    async def test_iter_methods_exist(self, api_key):
+        """Test that every page/limit endpoint has an iterator variant."""
+        client = AsyncFMPClient(api_key)
+        for name in (
+            "iter_news_general_latest",
+            "iter_fmp_articles",
+            "iter_insider_trading_search",
+            "iter_cik_list",
+            "iter_delisted_companies",
+            "iter_mergers_acquisitions_latest",
+            "iter_senate_latest",
+            "iter_house_latest",
+            "iter_crowdfunding_offerings_latest",
+            "iter_fundraising_latest",
+            "iter_sec_filings_8k",
+        ):
+            assert callable(getattr(client, name))
+        await client.aclose()
+
+
+class TestFetchParts:
+    """Tests for fetch_parts."""
+
+    @pytest.mark.asyncio
+    async def test_yields_parts_in_order_until_empty(self):
+        """Test that parts are yielded in order and loading stops when empty."""
+        loaded = []
+
+        async def load(part: int) -> list[int]:
+            loaded.append(part)
+            await asyncio.sleep(0.01 if part == 0 else 0)
+            return [part] if part < 3 else []
+
+        results = await collect(
+            fetch_parts(load, is_empty=lambda rows: not rows, concurrency=2)
+        )
+
+        assert results == [[0], [1], [2]]
+        assert loaded[:4] == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_parts_load_concurrently(self):
+        """Test that up to concurrency parts are in flight at once."""
+        active = 0
+        peak = 0
+
+        async def load(part: int) -> list[int]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return [part] if part < 8 else []
+
+        await collect(fetch_parts(load, is_empty=lambda rows: not rows, concurrency=4))
+
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self):
+        """Test that concurrency below one is rejected."""
+        with pytest.raises(ValueError):
+            await collect(fetch_parts(FakeEndpoint(1), is_empty=bool, concurrency=0))
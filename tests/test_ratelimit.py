@@ -0,0 +1,122 @@
+"""Tests for the rate limiting module."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient
+from fmp_py_client._ratelimit import RateLimiter, TokenBucket, endpoint_group
+
+CLOCK_MODULES = ("fmp_py_client._ratelimit",)
+
+
+class TestEndpointGroup:
+    """Tests for endpoint_group."""
+
+    @pytest.mark.parametrize(
+        ("path", "group"),
+        [
+            ("profile-bulk", "bulk"),
+            ("income-statement-bulk", "bulk"),
+            ("quote", "quotes"),
+            ("quote-short", "quotes"),
+            ("batch-quote", "quotes"),
+            ("aftermarket-trade", "quotes"),
+            ("profile", "default"),
+            ("historical-price-eod/full", "default"),
+        ],
+    )
+    def test_groups(self, path, group):
+        """Test path classification."""
+        assert endpoint_group(path) == group
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket class."""
+
+    def test_default_burst(self):
+        """Test that burst defaults to one second of throughput."""
+        assert TokenBucket(600).burst == 10
+        assert TokenBucket(30).burst == 1
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+    def test_invalid_burst(self):
+        """Test that a burst below one is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(60, burst=0)
+
+    @pytest.mark.asyncio
+    async def test_burst_is_free(self, fake_clock):
+        """Test that calls within the burst do not wait."""
+        bucket = TokenBucket(60, burst=3)
+        for _ in range(3):
+            await bucket.acquire()
+
+        assert fake_clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_paces_after_burst(self, fake_clock):
+        """Test that calls beyond the burst are paced at the sustained rate."""
+        bucket = TokenBucket(60, burst=1)
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+        assert fake_clock.sleeps == pytest.approx([1.0, 1.0, 1.0])
+        assert fake_clock.now == pytest.approx(3.0)
+
+    @pytest.mark.asyncio
+    async def test_refills_over_time(self, fake_clock):
+        """Test that idle time refills the bucket up to its capacity."""
+        bucket = TokenBucket(60, burst=2)
+        await bucket.acquire()
+        await bucket.acquire()
+        fake_clock.now += 100.0
+        await bucket.acquire()
+        await bucket.acquire()
+
+        assert fake_clock.sleeps == []
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_group_budget(self, fake_clock):
+        """Test that a group bucket throttles only its own endpoints."""
+        limiter = RateLimiter(6000, groups={"bulk": TokenBucket(60, burst=1)})
+        await limiter.acquire("eod-bulk")
+        await limiter.acquire("profile")
+        await limiter.acquire("quote")
+
+        assert fake_clock.sleeps == []
+
+        await limiter.acquire("dcf-bulk")
+
+        assert fake_clock.sleeps == pytest.approx([1.0])
+
+    @pytest.mark.asyncio
+    async def test_client_uses_limiter(self, api_key, mock_transport):
+        """Test that the client acquires budget before each request."""
+        acquired: list[str] = []
+
+        class RecordingLimiter(RateLimiter):
+            async def acquire(self, path: str) -> None:
+                acquired.append(path)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[])
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key,
+                httpx_client=http_client,
+                rate_limiter=RecordingLimiter(60),
+            )
+            await client.quote(symbol="AAPL")
+            await client.profile(symbol="AAPL")
+
+        assert acquired == ["quote", "profile"]
@@ -0,0 +1,124 @@
+"""Tests for intraday bar resampling."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fmp_py_client import Timeframe
+from fmp_py_client.resample import resample, timeframe_minutes
+
+
+def minute_bars(day: str, start: str, count: int) -> list[dict]:
+    """Return 1-minute bars whose close is the minute's index."""
+    hour, minute = map(int, start.split(":"))
+    bars = []
+    for i in range(count):
+        total = hour * 60 + minute + i
+        bars.append(
+            {
+                "date": f"{day} {total // 60:02d}:{total % 60:02d}:00",
+                "open": float(i),
+                "high": float(i) + 0.5,
+                "low": float(i) - 0.5,
+                "close": float(i),
+                "volume": 10,
+            }
+        )
+    return bars[::-1]
+
+
+class TestTimeframeMinutes:
+    """Tests for timeframe_minutes."""
+
+    @pytest.mark.parametrize(
+        ("timeframe", "minutes"),
+        [
+            (Timeframe.FIVE_MIN, 5),
+            (Timeframe.FOUR_HOUR, 240),
+            (Timeframe.ONE_DAY, 1440),
+            ("90min", 90),
+            (2, 2),
+        ],
+    )
+    def test_parse(self, timeframe, minutes):
+        """Test standard and custom timeframes."""
+        assert timeframe_minutes(timeframe) == minutes
+
+    @pytest.mark.parametrize("timeframe", ["5sec", "0min", "2day"])
+    def test_invalid(self, timeframe):
+        """Test that unsupported timeframes are rejected."""
+        with pytest.raises(ValueError):
+            timeframe_minutes(timeframe)
+
+
+class TestResample:
+    """Tests for resample."""
+
+    def test_ohlcv_aggregation(self):
+        """Test open, high, low, close and volume of each window."""
+        bars = resample(minute_bars("2024-01-02", "09:30", 10), "5min")
+
+        assert bars == [
+            {
+                "date": "2024-01-02 09:35:00",
+                "open": 5.0,
+                "high": 9.5,
+                "low": 4.5,
+                "close": 9.0,
+                "volume": 50,
+            },
+            {
+                "date": "2024-01-02 09:30:00",
+                "open": 0.0,
+                "high": 4.5,
+                "low": -0.5,
+                "close": 4.0,
+                "volume": 50,
+            },
+        ]
+
+    def test_session_alignment(self):
+        """Test that hourly windows start at the session open."""
+        bars = resample(minute_bars("2024-01-02", "09:30", 390), Timeframe.ONE_HOUR)
+
+        dates = [bar["date"] for bar in bars[::-1]]
+        assert dates[:2] == ["2024-01-02 09:30:00", "2024-01-02 10:30:00"]
+        assert dates[-1] == "2024-01-02 15:30:00"
+        assert bars[0]["volume"] == 300
+
+    def test_custom_timeframe_and_days(self):
+        """Test a custom timeframe over two sessions without crossing days."""
+        minutes = minute_bars("2024-01-02", "09:30", 120) + minute_bars(
+            "2024-01-03", "09:30", 30
+        )
+
+        bars = resample(minutes, "90min")
+
+        assert [bar["date"] for bar in bars] == [
+            "2024-01-03 09:30:00",
+            "2024-01-02 11:00:00",
+            "2024-01-02 09:30:00",
+        ]
+        assert bars[1]["volume"] == 300
+
+    def test_daily_bars(self):
+        """Test aggregating to one bar per day dated with the day."""
+        bars = resample(minute_bars("2024-01-02", "09:30", 390), "1day")
+
+        assert len(bars) == 1
+        assert bars[0]["date"] == "2024-01-02"
+        assert bars[0]["high"] == 389.5
+        assert bars[0]["close"] == 389.0
+
+    def test_premarket_bars_align_to_open(self):
+        """Test that bars before the open fall into earlier aligned windows."""
+        bars = resample(minute_bars("2024-01-02", "09:25", 10), "5min")
+
+        assert [bar["date"] for bar in bars] == [
+            "2024-01-02 09:30:00",
+            "2024-01-02 09:25:00",
+        ]
+
+    def test_empty(self):
+        """Test that no bars resample to no bars."""
+        assert resample([], "5min") == []
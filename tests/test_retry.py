@@ -0,0 +1,264 @@
+"""Tests for the retry module."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient
+from fmp_py_client._exceptions import (
+    FMPAPIError,
+    FMPAuthenticationError,
+    FMPConnectionError,
+    FMPNotFoundError,
+    FMPRateLimitError,
+    FMPTimeoutError,
+)
+from fmp_py_client._retry import RetryPolicy
+
+CLOCK_MODULES = ("fmp_py_client._base",)
+
+
+def sequence_handler(responses):
+    """Build a handler that replays responses (or raises exceptions) in order."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        item = responses[len(calls)]
+        calls.append(request)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    handler.calls = calls
+    return handler
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy class."""
+
+    def test_defaults(self):
+        """Test default policy values."""
+        policy = RetryPolicy()
+
+        assert policy.max_attempts == 3
+        assert policy.deadline is None
+        assert 429 in policy.retry_statuses
+        assert 503 in policy.retry_statuses
+
+    def test_invalid_max_attempts(self):
+        """Test that max_attempts below one is rejected."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (FMPTimeoutError("timeout"), True),
+            (FMPConnectionError("refused"), True),
+            (FMPRateLimitError("slow down"), True),
+            (FMPAPIError("boom", status_code=503), True),
+            (FMPAPIError("bad", status_code=400), False),
+            (FMPNotFoundError("missing", status_code=404), False),
+            (FMPAuthenticationError("denied", status_code=401), False),
+        ],
+    )
+    def test_is_retryable(self, error, expected):
+        """Test which errors are retried."""
+        assert RetryPolicy().is_retryable(error) is expected
+
+    def test_delay_exponential_without_jitter(self):
+        """Test exponential backoff capped at backoff_max."""
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=False)
+        error = FMPTimeoutError("timeout")
+
+        assert [policy.delay(n, error) for n in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_delay_with_jitter_is_bounded(self):
+        """Test that jittered delays stay within the exponential ceiling."""
+        policy = RetryPolicy(backoff_base=1.0)
+        error = FMPTimeoutError("timeout")
+
+        for _ in range(50):
+            assert 0.0 <= policy.delay(3, error) <= 4.0
+
+    def test_delay_honors_retry_after(self):
+        """Test that Retry-After overrides the backoff schedule."""
+        policy = RetryPolicy(backoff_base=1.0, jitter=False)
+        error = FMPRateLimitError("slow down", retry_after=12.0)
+
+        assert policy.delay(1, error) == 12.0
+
+
+class TestClientRetry:
+    """Tests for retrying requests through the client."""
+
+    @pytest.mark.asyncio
+    async def test_no_retry_by_default(self, api_key, mock_transport):
+        """Test that errors propagate immediately without a policy."""
+        handler = sequence_handler([httpx.Response(503, text="unavailable")])
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+
+            with pytest.raises(FMPAPIError):
+                await client.quote(symbol="AAPL")
+
+        assert len(handler.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self, api_key, mock_transport, fake_clock):
+        """Test that transient failures are retried until success."""
+        handler = sequence_handler(
+            [
+                httpx.ConnectError("refused"),
+                httpx.Response(502, text="bad gateway"),
+                httpx.Response(200, json=[{"symbol": "AAPL"}]),
+            ]
+        )
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key,
+                httpx_client=http_client,
+                retry=RetryPolicy(backoff_base=1.0, jitter=False),
+            )
+            result = await client.quote(symbol="AAPL")
+
+        assert result == [{"symbol": "AAPL"}]
+        assert fake_clock.sleeps == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(
+        self, api_key, mock_transport, fake_clock
+    ):
+        """Test that the last error is raised once attempts are exhausted."""
+        handler = sequence_handler([httpx.Response(500, text="error")] * 2)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key,
+                httpx_client=http_client,
+                retry=RetryPolicy(max_attempts=2, jitter=False),
+            )
+
+            with pytest.raises(FMPAPIError) as exc_info:
+                await client.quote(symbol="AAPL")
+
+        assert exc_info.value.status_code == 500
+        assert len(handler.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(
+        self, api_key, mock_transport, fake_clock
+    ):
+        """Test that non-retryable errors are raised immediately."""
+        handler = sequence_handler([httpx.Response(404, text="missing")])
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key, httpx_client=http_client, retry=RetryPolicy()
+            )
+
+            with pytest.raises(FMPNotFoundError):
+                await client.quote(symbol="AAPL")
+
+        assert len(handler.calls) == 1
+        assert fake_clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self, api_key, mock_transport, fake_clock):
+        """Test that a 429 waits for the Retry-After interval."""
+        handler = sequence_handler(
+            [
+                httpx.Response(429, headers={"Retry-After": "7"}),
+                httpx.Response(200, json=[]),
+            ]
+        )
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key, httpx_client=http_client, retry=RetryPolicy()
+            )
+            await client.quote(symbol="AAPL")
+
+        assert fake_clock.sleeps == [7.0]
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_retries(self, api_key, mock_transport, fake_clock):
+        """Test that retries stop when the next wait would pass the deadline."""
+        handler = sequence_handler(
+            [
+                httpx.Response(429, headers={"Retry-After": "30"}),
+                httpx.Response(200, json=[]),
+            ]
+        )
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key,
+                httpx_client=http_client,
+                retry=RetryPolicy(deadline=10.0),
+            )
+
+            with pytest.raises(FMPRateLimitError):
+                await client.quote(symbol="AAPL")
+
+        assert len(handler.calls) == 1
+        assert fake_clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_pause(
+        self, api_key, mock_transport, fake_clock
+    ):
+        """Test that concurrent tasks wait for the shared rate-limit pause."""
+        limited = {"done": False}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if not limited["done"]:
+                limited["done"] = True
+                return httpx.Response(429, headers={"Retry-After": "5"})
+            return httpx.Response(200, json=[])
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key, httpx_client=http_client, retry=RetryPolicy()
+            )
+            await client.quote(symbol="AAPL")
+            assert client._resume_at == 5.0
+
+            fake_clock.now = 1.0
+            fake_clock.frozen = True
+            await asyncio.gather(
+                client.quote(symbol="MSFT"), client.profile(symbol="MSFT")
+            )
+
+        assert fake_clock.sleeps == [5.0, 4.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_retries_stream_before_first_chunk(
+        self, api_key, mock_transport, fake_clock
+    ):
+        """Test that a streamed bulk download is retried until it starts."""
+        csv = "symbol,date,close\nAAPL,2024-01-02,185.6\n"
+        handler = sequence_handler(
+            [
+                httpx.Response(503, text="unavailable"),
+                httpx.Response(429, headers={"Retry-After": "5"}),
+                httpx.Response(200, text=csv),
+            ]
+        )
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(
+                api_key,
+                httpx_client=http_client,
+                retry=RetryPolicy(backoff_base=1.0, jitter=False),
+            )
+            rows = [row async for row in client.iter_eod_bulk(date="2024-01-02")]
+
+            assert client._resume_at == 6.0
+
+        assert [row["close"] for row in rows] == [185.6]
+        assert len(handler.calls) == 3
+        assert fake_clock.sleeps == [1.0, 5.0]
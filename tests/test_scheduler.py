@@ -0,0 +1,97 @@
+"""Tests for the priority request scheduler."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, Priority, Scheduler
+
+
+class TestScheduler:
+    """Tests for Scheduler."""
+
+    def test_invalid_concurrency(self):
+        """Test that a cap below one is rejected."""
+        with pytest.raises(ValueError):
+            Scheduler(0)
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_by_priority(self, settle):
+        """Test that freed slots go to higher priorities first, FIFO among equals."""
+        scheduler = Scheduler(1)
+        await scheduler.acquire(Priority.BATCH)
+        order: list[str] = []
+
+        async def wait(name: str, priority: Priority) -> None:
+            await scheduler.acquire(priority)
+            order.append(name)
+            scheduler.release()
+
+        tasks = [
+            asyncio.create_task(wait("batch", Priority.BATCH)),
+            asyncio.create_task(wait("interactive-1", Priority.INTERACTIVE)),
+            asyncio.create_task(wait("realtime", Priority.REALTIME)),
+            asyncio.create_task(wait("interactive-2", Priority.INTERACTIVE)),
+        ]
+        await settle()
+        assert scheduler.waiting == 4
+
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["realtime", "interactive-1", "interactive-2", "batch"]
+        assert scheduler.active == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_releases_nothing(self, settle):
+        """Test that cancelling a queued request does not leak a slot."""
+        scheduler = Scheduler(1)
+        await scheduler.acquire(Priority.BATCH)
+        waiter = asyncio.create_task(scheduler.acquire(Priority.REALTIME))
+        await settle()
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        scheduler.release()
+
+        assert scheduler.active == 0
+        await asyncio.wait_for(scheduler.acquire(Priority.BATCH), 1.0)
+        assert scheduler.active == 1
+
+    def test_priority_for_groups(self, api_key):
+        """Test default priorities by endpoint group and explicit overrides."""
+        scheduler = Scheduler(groups={"default": Priority.BATCH})
+        client = AsyncFMPClient(api_key, scheduler=scheduler)
+
+        assert scheduler.priority_for("quote") == Priority.REALTIME
+        assert scheduler.priority_for("eod-bulk") == Priority.BATCH
+        assert scheduler.priority_for("profile") == Priority.BATCH
+        with client.priority(Priority.REALTIME):
+            assert scheduler.priority_for("eod-bulk") == Priority.REALTIME
+        assert scheduler.priority_for("eod-bulk") == Priority.BATCH
+
+
+class TestClientScheduling:
+    """Tests for scheduling requests through the client."""
+
+    @pytest.mark.asyncio
+    async def test_realtime_jumps_batch_backlog(self, api_key, gated_transport, settle):
+        """Test the concurrency cap and that quotes overtake queued bulk calls."""
+        transport = gated_transport()
+        scheduler = Scheduler(2)
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncFMPClient(
+                api_key, httpx_client=http_client, scheduler=scheduler
+            )
+            batch = [asyncio.create_task(client.profile_bulk(part=i)) for i in range(5)]
+            await settle()
+            quote = asyncio.create_task(client.quote(symbol="AAPL"))
+            await settle()
+            transport.gate.set()
+            await asyncio.gather(quote, *batch)
+
+        assert transport.max_in_flight == 2
+        assert transport.paths[:3] == ["profile-bulk", "profile-bulk", "quote"]
+        assert scheduler.active == 0
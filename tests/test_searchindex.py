@@ -0,0 +1,204 @@
+"""Tests for the offline search index."""
+
+from collections import Counter
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, SearchIndex
+from fmp_py_client._searchindex import DELISTED_PAGE_SIZE
+
+STOCKS = [
+    {"symbol": "AAPL", "name": "Apple Inc.", "exchangeShortName": "NASDAQ"},
+    {"symbol": "AAP", "name": "Advance Auto Parts, Inc.", "exchangeShortName": "NYSE"},
+    {"symbol": "AA", "name": "Alcoa Corporation", "exchangeShortName": "NYSE"},
+    {"symbol": "GOOGL", "name": "Alphabet Inc.", "exchangeShortName": "NASDAQ"},
+    {"symbol": "FB", "name": "Meta Platforms, Inc.", "exchangeShortName": "NASDAQ"},
+    {
+        "symbol": "APLE",
+        "name": "Apple Hospitality REIT, Inc.",
+        "exchangeShortName": "NYSE",
+    },
+]
+ETFS = [
+    {"symbol": "SPY", "name": "SPDR S&P 500 ETF Trust", "exchangeShortName": "AMEX"}
+]
+CIKS = [
+    {"cik": "0000320193", "name": "Apple Inc."},
+    {"cik": "0001652044", "name": "ALPHABET INC"},
+]
+
+
+class FakeAPI:
+    """Serve the list endpoints from in-memory rows."""
+
+    def __init__(self):
+        self.changes = [
+            {"date": "2021-06-01", "name": "Old", "oldSymbol": "X", "newSymbol": "Y"}
+        ]
+        self.delisted = [
+            {"symbol": "OLD", "companyName": "Old Co", "delistedDate": "2020-01-02"}
+        ]
+        self.calls: Counter[str] = Counter()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        name = request.url.path.rsplit("/", 1)[-1]
+        self.calls[name] += 1
+        page = int(request.url.params.get("page", 0))
+        if name == "delisted-companies":
+            # Newest first, like the API.
+            limit = int(request.url.params["limit"])
+            rows = sorted(self.delisted, key=lambda row: row["delistedDate"])[::-1]
+            return httpx.Response(200, json=rows[page * limit : (page + 1) * limit])
+        rows = {
+            "stock-list": STOCKS,
+            "etf-list": ETFS,
+            "financial-statement-symbol-list": STOCKS[:2],
+            "cik-list": CIKS if page == 0 else [],
+            "symbol-change": self.changes,
+        }[name]
+        return httpx.Response(200, json=rows)
+
+
+@pytest.fixture
+def index() -> SearchIndex:
+    return SearchIndex([*STOCKS, *ETFS], CIKS)
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex lookups."""
+
+    def test_search_symbol_prefix(self, index):
+        """Test ticker prefix search, exact and shortest first."""
+        results = index.search_symbol("aap")
+
+        assert [r["symbol"] for r in results] == ["AAP", "AAPL"]
+        assert index.search_symbol("AAP", exchange="NASDAQ")[0]["symbol"] == "AAPL"
+        assert index.search_symbol("ZZZ") == []
+
+    def test_search_name_ranking(self, index):
+        """Test that names starting with the query rank first."""
+        results = index.search_name("apple")
+
+        assert [r["symbol"] for r in results[:2]] == ["AAPL", "APLE"]
+        assert results[0]["exchangeShortName"] == "NASDAQ"
+
+    def test_search_name_tolerates_typos(self, index):
+        """Test that a misspelled name still finds the company."""
+        assert index.search_name("alphabett")[0]["symbol"] == "GOOGL"
+        assert index.search_name("meta platforms", exchange="NYSE") == []
+
+    def test_search_cik_links_ticker(self, index):
+        """Test CIK lookup with and without leading zeros."""
+        assert index.search_cik(320193) == [
+            {"cik": "0000320193", "name": "Apple Inc.", "ticker": "AAPL"}
+        ]
+        assert index.search_cik("1652044")[0]["ticker"] == "GOOGL"
+        assert index.search_cik(1) == []
+
+    def test_save_and_load(self, index, tmp_path):
+        """Test that a saved index loads with identical results."""
+        path = tmp_path / "index" / "search.json"
+        index.watermarks["delisted"] = "2020-01-02"
+
+        index.save(path)
+        loaded = SearchIndex.load(path)
+
+        assert len(loaded) == len(index)
+        assert loaded.search_name("apple") == index.search_name("apple")
+        assert loaded.search_cik(320193) == index.search_cik(320193)
+        assert loaded.watermarks == {"delisted": "2020-01-02"}
+
+
+class TestSearchIndexRefresh:
+    """Tests for building and refreshing from the API."""
+
+    @pytest.mark.asyncio
+    async def test_build_and_refresh(self, api_key, mock_transport):
+        """Test that only changes after the build are applied."""
+        api = FakeAPI()
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            index = await SearchIndex.build(client)
+
+            assert len(index) == len(STOCKS) + len(ETFS)
+            assert index.watermarks == {
+                "symbol-change": "2021-06-01",
+                "delisted": "2020-01-02",
+            }
+            assert await index.refresh(client) == {"renamed": 0, "delisted": 0}
+
+            api.changes.append(
+                {
+                    "date": "2022-06-09",
+                    "name": "Meta Platforms, Inc.",
+                    "oldSymbol": "FB",
+                    "newSymbol": "META",
+                }
+            )
+            api.delisted.append(
+                {"symbol": "AA", "companyName": "Alcoa", "delistedDate": "2023-01-05"}
+            )
+            counts = await index.refresh(client)
+
+        assert counts == {"renamed": 1, "delisted": 1}
+        assert "FB" not in index
+        assert index.get("meta")["exchangeShortName"] == "NASDAQ"
+        assert index.search_name("meta")[0]["symbol"] == "META"
+        assert index.search_symbol("AA")[0]["symbol"] == "AAP"
+        assert index.watermarks["symbol-change"] == "2022-06-09"
+
+    @pytest.mark.asyncio
+    async def test_noop_refresh_reads_one_page(self, api_key, mock_transport):
+        """Test that delisting pages stop at the watermark."""
+        api = FakeAPI()
+        api.delisted = [
+            {"symbol": f"D{i}", "delistedDate": f"2019-01-{1 + i % 28:02d}"}
+            for i in range(5 * DELISTED_PAGE_SIZE)
+        ]
+        index = SearchIndex(
+            STOCKS, watermarks={"symbol-change": "2021-06-01", "delisted": "2020-01-01"}
+        )
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            assert await index.refresh(client) == {"renamed": 0, "delisted": 0}
+            assert api.calls["delisted-companies"] == 1
+
+            api.delisted += [
+                {"symbol": "AA", "delistedDate": "2023-01-05"},
+                {"symbol": "AAP", "delistedDate": "2023-01-04"},
+            ]
+            assert await index.refresh(client) == {"renamed": 0, "delisted": 2}
+
+        assert api.calls["delisted-companies"] == 2
+        assert index.watermarks["delisted"] == "2023-01-05"
+
+    @pytest.mark.asyncio
+    async def test_late_rows_on_watermark_day(self, api_key, mock_transport):
+        """Test that changes published late but dated on the watermark apply."""
+        api = FakeAPI()
+
+        async with httpx.AsyncClient(transport=mock_transport(api)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            index = await SearchIndex.build(client)
+            api.changes.append(
+                {
+                    "date": "2021-06-01",
+                    "name": "Meta",
+                    "oldSymbol": "FB",
+                    "newSymbol": "META",
+                }
+            )
+            api.delisted.append(
+                {"symbol": "AA", "companyName": "Alcoa", "delistedDate": "2020-01-02"}
+            )
+            counts = await index.refresh(client)
+            again = await index.refresh(client)
+
+        assert counts == {"renamed": 1, "delisted": 1}
+        assert again == {"renamed": 0, "delisted": 0}
+        assert "AA" not in index
+        assert "FB" not in index
+        assert "META" in index
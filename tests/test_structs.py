@@ -0,0 +1,179 @@
+"""Tests for struct decoding."""
+
+import asyncio
+import json
+import sys
+
+import httpx
+import pytest
+
+from fmp_py_client import AsyncFMPClient, struct_type
+from fmp_py_client._structs import SlotsStruct, struct_decoder, to_structs
+from fmp_py_client.models import EODFull, EODLight
+
+BODY = json.dumps(
+    [
+        {
+            "symbol": "AAPL",
+            "date": "2024-01-02",
+            "open": 187,
+            "high": 188.4,
+            "low": 183.9,
+            "close": 185.6,
+            "volume": 82488700.0,
+            "extra": "dropped",
+        }
+    ]
+).encode()
+
+
+@pytest.fixture
+def no_msgspec(monkeypatch):
+    """Hide msgspec so the ``__slots__`` fallback is used."""
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    struct_type.cache_clear()
+    yield
+    struct_type.cache_clear()
+
+
+class TestStructType:
+    """Tests for struct_type and struct_decoder."""
+
+    def test_msgspec_struct(self):
+        """Test decoding into msgspec structs with lax typing."""
+        msgspec = pytest.importorskip("msgspec")
+
+        rows = struct_decoder(EODFull, json.loads)(BODY)
+
+        assert isinstance(rows[0], msgspec.Struct)
+        assert type(rows[0]) is struct_type(EODFull)
+        assert rows[0].open == 187.0
+        assert rows[0].volume == 82488700
+        assert rows[0].adjClose is None
+        assert not hasattr(rows[0], "extra")
+
+    def test_slots_fallback(self, no_msgspec):
+        """Test the ``__slots__`` structs used without msgspec."""
+        rows = struct_decoder(EODFull, json.loads)(BODY)
+
+        assert isinstance(rows[0], SlotsStruct)
+        assert rows[0].close == 185.6
+        assert rows[0].vwap is None
+        assert not hasattr(rows[0], "__dict__")
+        assert not hasattr(rows[0], "extra")
+        assert rows == to_structs(json.loads(BODY), EODFull)
+
+    @pytest.mark.parametrize("backend", ["msgspec", "stdlib"])
+    def test_fractional_volume(self, backend, monkeypatch):
+        """Test that crypto-style fractional volumes decode on both backends."""
+        if backend == "msgspec":
+            pytest.importorskip("msgspec")
+        else:
+            monkeypatch.setitem(sys.modules, "msgspec", None)
+        struct_type.cache_clear()
+        body = json.dumps([{"symbol": "BTCUSD", "close": 1.5, "volume": 1234.567}])
+
+        rows = struct_decoder(EODFull, json.loads)(body.encode())
+        struct_type.cache_clear()
+
+        assert rows[0].volume == 1234.567
+
+    def test_unexpected_types_fall_back(self):
+        """Test that values msgspec rejects are kept as sent."""
+        pytest.importorskip("msgspec")
+        body = json.dumps([{"symbol": 1, "close": "n/a"}]).encode()
+
+        rows = struct_decoder(EODFull, json.loads)(body)
+
+        assert type(rows[0]) is struct_type(EODFull)
+        assert (rows[0].symbol, rows[0].close) == (1, "n/a")
+
+    def test_struct_type_is_cached(self):
+        """Test that each model maps to a single struct class."""
+        assert struct_type(EODLight) is struct_type(EODLight)
+        assert struct_type(EODLight).__name__ == "EODLight"
+
+    def test_rejects_non_model(self):
+        """Test that only TypedDict models are accepted."""
+        with pytest.raises(TypeError):
+            struct_type(dict)
+
+
+class TestFetchStructs:
+    """Tests for AsyncFMPClient.fetch_structs."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_structs(self, api_key, mock_transport):
+        """Test that a client method's rows are returned as structs."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "/stable/historical-price-eod/full" in str(request.url)
+            return httpx.Response(200, content=BODY)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            rows = await client.fetch_structs(
+                client.historical_price_eod_full, symbol="AAPL"
+            )
+            plain = await client.historical_price_eod_full(symbol="AAPL")
+
+        assert type(rows[0]) is struct_type(EODFull)
+        assert rows[0].symbol == "AAPL"
+        assert isinstance(plain[0], dict)
+
+    @pytest.mark.asyncio
+    async def test_range_method(self, api_key, mock_transport):
+        """Test that rows merged from several windows are converted after merging."""
+        windows = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            windows.append(request.url.params["from"])
+            return httpx.Response(200, content=BODY)
+
+        async with httpx.AsyncClient(transport=mock_transport(handler)) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client)
+            rows = await client.fetch_structs(
+                client.historical_price_eod_range,
+                "AAPL",
+                from_date="2024-01-01",
+                to_date="2024-01-10",
+                window_days=5,
+            )
+
+        assert sorted(windows) == ["2024-01-01", "2024-01-06"]
+        assert [type(row) for row in rows] == [struct_type(EODFull)]
+        assert rows[0].date == "2024-01-02"
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_list_method(self, api_key):
+        """Test that methods not returning a list of models are rejected."""
+        async with AsyncFMPClient(api_key) as client:
+            with pytest.raises(TypeError, match="batch_quote_chunked"):
+                await client.fetch_structs(client.batch_quote_chunked, ["AAPL"])
+
+    @pytest.mark.asyncio
+    async def test_not_coalesced_with_dict_callers(self, api_key):
+        """Test that struct and dict callers do not share a coalesced result."""
+        calls = 0
+        gate = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await gate.wait()
+            return httpx.Response(200, content=BODY)
+
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncFMPClient(api_key, httpx_client=http_client, coalesce=True)
+            structs = asyncio.create_task(
+                client.fetch_structs(client.historical_price_eod_full, symbol="AAPL")
+            )
+            dicts = asyncio.create_task(client.historical_price_eod_full(symbol="AAPL"))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            gate.set()
+            struct_rows, dict_rows = await asyncio.gather(structs, dicts)
+
+        assert calls == 2
+        assert struct_rows[0].close == dict_rows[0]["close"]